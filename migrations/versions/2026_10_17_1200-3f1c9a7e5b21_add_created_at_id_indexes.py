@@ -0,0 +1,31 @@
+"""add created_at id indexes
+
+Revision ID: 3f1c9a7e5b21
+Revises: 37900156778b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c9a7e5b21"
+down_revision: Union[str, None] = "37900156778b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_routes_created_at_id", "routes", ["created_at", "id"], unique=False)
+    op.create_index("ix_posts_created_at_id", "posts", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_created_at_id", table_name="posts")
+    op.drop_index("ix_routes_created_at_id", table_name="routes")
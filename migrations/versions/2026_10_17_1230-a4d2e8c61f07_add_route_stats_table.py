@@ -0,0 +1,65 @@
+"""add route stats table
+
+Revision ID: a4d2e8c61f07
+Revises: 3f1c9a7e5b21
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d2e8c61f07"
+down_revision: Union[str, None] = "3f1c9a7e5b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "route_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("route_id", sa.Integer(), nullable=False),
+        sa.Column("place_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("photo_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("like_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["route_id"], ["routes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("route_id"),
+    )
+    op.create_index(op.f("ix_route_stats_place_count"), "route_stats", ["place_count"], unique=False)
+
+    op.create_index(op.f("ix_route_places_route_id"), "route_places", ["route_id"], unique=False)
+    op.create_index(op.f("ix_photos_route_id"), "photos", ["route_id"], unique=False)
+    op.create_index(op.f("ix_likes_route_id"), "likes", ["route_id"], unique=False)
+    op.create_index(op.f("ix_comments_route_id"), "comments", ["route_id"], unique=False)
+
+    # Заполняем статистику для существующих маршрутов
+    op.execute(
+        """
+        INSERT INTO route_stats (route_id, place_count, photo_count, like_count, comment_count)
+        SELECT
+            r.id,
+            (SELECT count(DISTINCT rp.place_id) FROM route_places rp WHERE rp.route_id = r.id),
+            (SELECT count(*) FROM photos p WHERE p.route_id = r.id),
+            (SELECT count(*) FROM likes l WHERE l.route_id = r.id),
+            (SELECT count(*) FROM comments c WHERE c.route_id = r.id)
+        FROM routes r
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_comments_route_id"), table_name="comments")
+    op.drop_index(op.f("ix_likes_route_id"), table_name="likes")
+    op.drop_index(op.f("ix_photos_route_id"), table_name="photos")
+    op.drop_index(op.f("ix_route_places_route_id"), table_name="route_places")
+    op.drop_index(op.f("ix_route_stats_place_count"), table_name="route_stats")
+    op.drop_table("route_stats")
@@ -0,0 +1,48 @@
+"""add trgm indexes
+
+Revision ID: 5b8e1d2f9c47
+Revises: a4d2e8c61f07
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e1d2f9c47"
+down_revision: Union[str, None] = "a4d2e8c61f07"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRGM_INDEXES = (
+    ("places", "name"),
+    ("routes", "name"),
+    ("posts", "title"),
+    ("posts", "description"),
+    ("users", "first_name"),
+    ("users", "last_name"),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in TRGM_INDEXES:
+        op.create_index(
+            f"ix_{table}_{column}_trgm",
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(TRGM_INDEXES):
+        op.drop_index(f"ix_{table}_{column}_trgm", table_name=table)
@@ -0,0 +1,62 @@
+"""add search vectors
+
+Revision ID: 8d3c7a1e4f92
+Revises: 5b8e1d2f9c47
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3c7a1e4f92"
+down_revision: Union[str, None] = "5b8e1d2f9c47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _vector(**weights: str) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('russian', coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+    )
+
+
+SEARCH_VECTORS = {
+    "places": _vector(name="A", tags="B", description="C"),
+    "routes": _vector(name="A", description="B"),
+    "posts": _vector(title="A", description="B"),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_search_vector",
+            table,
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(SEARCH_VECTORS):
+        op.drop_index(f"ix_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,56 @@
+"""add places location
+
+Revision ID: c61f0e9b2a38
+Revises: 8d3c7a1e4f92
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c61f0e9b2a38"
+down_revision: Union[str, None] = "8d3c7a1e4f92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Генерируемые колонки заполняются из coordinates сразу для всех существующих строк
+    op.add_column(
+        "places",
+        sa.Column(
+            "latitude",
+            sa.Double(),
+            sa.Computed("(coordinates ->> 0)::double precision", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "places",
+        sa.Column(
+            "longitude",
+            sa.Double(),
+            sa.Computed("(coordinates ->> 1)::double precision", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_places_location",
+        "places",
+        [sa.text("point(longitude, latitude)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_places_location", table_name="places")
+    op.drop_column("places", "longitude")
+    op.drop_column("places", "latitude")
@@ -0,0 +1,75 @@
+"""backfill route metrics
+
+Revision ID: e2b7a94d1c53
+Revises: c61f0e9b2a38
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7a94d1c53"
+down_revision: Union[str, None] = "c61f0e9b2a38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f("ix_routes_distance"), "routes", ["distance"], unique=False)
+    op.create_index(op.f("ix_routes_duration"), "routes", ["duration"], unique=False)
+
+    # Длина по haversine между соседними местами, время - по средней скорости способа передвижения
+    op.execute(
+        """
+        WITH points AS (
+            SELECT
+                rp.route_id,
+                radians(p.latitude) AS lat,
+                radians(p.longitude) AS lon,
+                lag(radians(p.latitude)) OVER w AS prev_lat,
+                lag(radians(p.longitude)) OVER w AS prev_lon
+            FROM route_places rp
+            JOIN places p ON p.id = rp.place_id
+            WHERE p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+            WINDOW w AS (PARTITION BY rp.route_id ORDER BY rp."order", rp.id)
+        ),
+        lengths AS (
+            SELECT
+                route_id,
+                coalesce(sum(
+                    2 * 6371000 * asin(sqrt(
+                        power(sin((lat - prev_lat) / 2), 2)
+                        + cos(prev_lat) * cos(lat) * power(sin((lon - prev_lon) / 2), 2)
+                    ))
+                ), 0) AS distance
+            FROM points
+            GROUP BY route_id
+        )
+        UPDATE routes r
+        SET
+            distance = round(l.distance),
+            duration = round(l.distance / 1000 / (
+                CASE r.type
+                    WHEN 'WALKING' THEN 4.5
+                    WHEN 'SCOOTER_BIKE' THEN 12.0
+                    WHEN 'BUS' THEN 18.0
+                    WHEN 'CAR' THEN 30.0
+                    WHEN 'VEHICLE' THEN 30.0
+                    ELSE 15.0
+                END
+            ) * 60)
+        FROM lengths l
+        WHERE l.route_id = r.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_routes_duration"), table_name="routes")
+    op.drop_index(op.f("ix_routes_distance"), table_name="routes")
@@ -0,0 +1,64 @@
+"""add routes yandex maps url
+
+Revision ID: f4a8c2d6e910
+Revises: e2b7a94d1c53
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f4a8c2d6e910"
+down_revision: Union[str, None] = "e2b7a94d1c53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("routes", sa.Column("yandex_maps_url", sa.String(), nullable=True))
+
+    op.execute(
+        """
+        WITH points AS (
+            SELECT
+                rp.route_id,
+                string_agg(p.latitude || ',' || p.longitude, '~' ORDER BY rp."order", rp.id)
+                    FILTER (WHERE p.latitude IS NOT NULL AND p.longitude IS NOT NULL) AS rtext,
+                string_agg('ymapsbm1:/org?oid=' || p.object_id, '~' ORDER BY rp."order", rp.id)
+                    FILTER (WHERE p.object_id IS NOT NULL AND p.object_id <> 0) AS ruri,
+                (array_agg(p.longitude || ',' || p.latitude ORDER BY rp."order", rp.id)
+                    FILTER (WHERE p.latitude IS NOT NULL AND p.longitude IS NOT NULL))[1] AS ll
+            FROM route_places rp
+            JOIN places p ON p.id = rp.place_id
+            GROUP BY rp.route_id
+        )
+        UPDATE routes r
+        SET yandex_maps_url = 'https://yandex.ru/maps/?mode=routes&rtext=' || pt.rtext
+            || '&rtt=' || (
+                CASE r.type
+                    WHEN 'WALKING' THEN 'pd'
+                    WHEN 'CAR' THEN 'auto'
+                    WHEN 'VEHICLE' THEN 'auto'
+                    WHEN 'BUS' THEN 'mt'
+                    WHEN 'SCOOTER_BIKE' THEN 'bc'
+                    WHEN 'MIXED' THEN 'comparison'
+                    ELSE 'mt'
+                END
+            )
+            || '&z=14&ll=' || pt.ll
+            || '&ruri=' || coalesce(pt.ruri, '~~')
+        FROM points pt
+        WHERE pt.route_id = r.id AND pt.rtext IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("routes", "yandex_maps_url")
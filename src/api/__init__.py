@@ -13,6 +13,7 @@ from api.public.places import router as public_place_router
 from api.public.posts import router as posts_survey_router
 from api.public.profile import router as profile_router
 from api.public.routes import router as public_route_router
+from api.public.search import router as public_search_router
 from api.public.surveys import router as public_survey_router
 
 admin_routers = [
@@ -35,4 +36,5 @@ public_routers = [
     public_like_router,
     public_comment_router,
     posts_survey_router,
+    public_search_router,
 ]
@@ -11,6 +11,7 @@ from common.dto import PlacesFiltersDTO
 from config.containers import Container
 from domain.entities.enums import ModelType
 from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.ChatGPT.catalog import PlacesCatalog
 
 from .schemas import PlaceRead
 
@@ -56,10 +57,12 @@ async def retrieve_place(
 async def delete_place(
     place_id: int,
     use_case: ModelObjectDeleteUseCase = Depends(Provide[Container.object_delete_use_case]),
+    places_catalog: PlacesCatalog = Depends(Provide[Container.clients.places_catalog]),
 ) -> Response:
     """Удалить место"""
     await use_case.execute(
         obj_id=place_id,
         model_type=ModelType.PLACES,
     )
+    await places_catalog.invalidate()
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -6,11 +6,12 @@ from api.permissions.is_admin import is_admin
 from application.use_cases.common.delete import ModelObjectDeleteUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
+from application.use_cases.tasks.route_generate import StartChatGPTRouteBatchGenerateTaskUseCase
 from config.containers import Container
 from domain.entities.enums import ModelType
 from domain.validators.dto import PaginatedResponse
 
-from .schemas import RouteRead
+from .schemas import RouteBatchGenerateSchema, RouteRead
 
 # router = APIRouter(tags=["Routes"], prefix="/routes", dependencies=[Depends(is_admin)])
 router = APIRouter(tags=["Routes"], prefix="/routes")
@@ -35,6 +36,19 @@ async def list_routes(
     )
 
 
+@router.post("/generate", status_code=status.HTTP_202_ACCEPTED)
+@inject
+async def generate_routes_batch(
+    data: RouteBatchGenerateSchema,
+    use_case: StartChatGPTRouteBatchGenerateTaskUseCase = Depends(
+        Provide[Container.start_route_chatgpt_batch_generate_task]
+    ),
+) -> str:
+    """Сгенерировать маршруты сразу по нескольким анкетам"""
+    await use_case.execute(data.survey_ids, data.mode, data.use_cache)
+    return "Пакетная генерация маршрутов запущена"
+
+
 @router.get("/{route_id}", response_model=RouteRead, status_code=status.HTTP_200_OK)
 @inject
 async def retrieve_route(
@@ -3,6 +3,8 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from application.constants import MAX_BATCH_SURVEYS
+from application.use_cases.routes.enums import RouteGenerationMode
 from application.utils import get_settings
 from common.dto import UserRead
 from domain.entities.enums import CityCategory, PlaceCategory, PlaceType, RouteType, SurveyStatus
@@ -174,6 +176,12 @@ class RouteReadSchema(CommonRouteBase):
     places: List[PlaceRead] = []
 
 
+class RouteBatchGenerateSchema(BaseModel):
+    survey_ids: List[int] = Field(min_length=1, max_length=MAX_BATCH_SURVEYS)
+    mode: RouteGenerationMode = RouteGenerationMode.FULL
+    use_cache: bool = True
+
+
 class RoutePlaceRead(BaseModel):
     order: int
     place: PlaceRead
@@ -208,7 +216,7 @@ class RouteRead(CommonRouteBase):
     def model_validate(cls, route: Route) -> "RouteRead":
         sorted_places: List[RoutePlaces] = sorted(route.places, key=lambda p: p.order)
 
-        obj = cls(
+        return cls(
             id=route.id,
             name=route.name,
             description=route.description,
@@ -224,52 +232,8 @@ class RouteRead(CommonRouteBase):
             author=UserRead.model_validate(route.author),
             photos=[PhotoRead.model_validate(p) for p in route.photos],
             places=([RoutePlaceRead.model_validate(place) for place in sorted_places]),
+            yandex_maps_url=route.yandex_maps_url,
         )
-        obj.yandex_maps_url = obj._compute_yandex_maps_url()
-        return obj
-
-    def _compute_yandex_maps_url(self) -> Optional[str]:
-        if not self.places:
-            return None
-
-        # Сортировка по порядку
-        sorted_places = sorted(self.places, key=lambda x: x.order)
-
-        # Сбор координат в формате широта,долгота
-        coords = "~".join(
-            f"{p.place.coordinates[0]},{p.place.coordinates[1]}"
-            for p in sorted_places
-            if p.place and p.place.coordinates
-        )
-
-        # Сбор ruri (если есть object_id / oid)
-        ruris = "~".join(
-            f"ymapsbm1:/org?oid={p.place.object_id}"
-            for p in sorted_places
-            if p.place and getattr(p.place, "object_id", None) not in (None, "", 0)
-        )
-        # Расчёт центра карты (по первой точке)
-        first = sorted_places[0].place.coordinates if sorted_places else [0, 0]
-        ll = f"{first[1]},{first[0]}"  # долгота,широта
-
-        # Выбор типа маршрута
-        rtt_map = {
-            RouteType.WALKING: "pd",  # Пешком
-            RouteType.CAR: "auto",  # Машина
-            RouteType.VEHICLE: "auto",
-            RouteType.BUS: "mt",  # Общественный транспорт
-            RouteType.SCOOTER_BIKE: "bc",
-            RouteType.MIXED: "comparison",  # Смешанный
-        }
-        rtt_value = rtt_map.get(self.type, "mt")
-
-        # Финальная ссылка
-        base = f"https://yandex.ru/maps/?mode=routes&rtext={coords}&rtt={rtt_value}&z=14&ll={ll}"
-        if ruris:
-            base += f"&ruri={ruris}"
-        else:
-            base += "&ruri=~~"
-        return base
 
 
 class CommonSurveyBase(BaseModel):
@@ -21,10 +21,11 @@ async def list_users(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    name: str | None = Query(None, description="Поиск по имени или фамилии"),
     use_case: UsersListUseCase = Depends(Provide[Container.users_list_use_case]),
 ) -> PaginatedResponse[UserDTO]:
     """Получить список пользователей с пагинацией"""
-    return await use_case.execute(request=request, page=page, page_size=page_size)
+    return await use_case.execute(request=request, page=page, page_size=page_size, name=name)
 
 
 @router.get("/{user_id}", status_code=status.HTTP_200_OK)
@@ -20,10 +20,15 @@ from application.use_cases.places.dto import CreatePlaceDTO
 from common.exceptions import APIException
 from config.containers import Container
 from domain.entities.enums import CityCategory, ModelType, PlaceCategory, PlaceType
+from infrastructure.managers.ChatGPT.catalog import PlacesCatalog
 from infrastructure.models.alchemy.routes import Place
+from infrastructure.repositories.alchemy.routes import SqlAlchemyRoutesRepository
 
 router = APIRouter()
 
+# Поля места, от которых зависят длина, время в пути и ссылка на Яндекс.Карты маршрутов
+ROUTE_METRICS_FIELDS = {"coordinates", "object_id"}
+
 
 @router.post("/", status_code=status.HTTP_200_OK)
 @inject
@@ -84,6 +89,7 @@ async def patch(
     item_id: int,
     item_data: PlacePatch,
     session: AsyncSession = Depends(Provide[Container.db.session]),
+    places_catalog: PlacesCatalog = Depends(Provide[Container.clients.places_catalog]),
 ) -> PlaceRead:
     try:
         values = item_data.model_dump(exclude_unset=True)
@@ -97,7 +103,10 @@ async def patch(
             .execution_options(synchronize_session="fetch")
         )
         await session.execute(stmt)
+        if ROUTE_METRICS_FIELDS & values.keys():
+            await SqlAlchemyRoutesRepository(session).refresh_metrics_by_place(item_id)
         await session.commit()
+        await places_catalog.invalidate()
 
         result = await session.execute(
             select(Place).where(Place.id == item_id).options(selectinload(Place.photos))
@@ -118,6 +127,7 @@ async def put(
     item_id: int,
     item_data: PlacePut,
     session: AsyncSession = Depends(Provide[Container.db.session]),
+    places_catalog: PlacesCatalog = Depends(Provide[Container.clients.places_catalog]),
 ) -> PlaceRead:
     try:
         validated = PlacePut(**item_data.model_dump(exclude_unset=False))
@@ -128,7 +138,9 @@ async def put(
             .execution_options(synchronize_session="fetch")
         )
         await session.execute(stmt)
+        await SqlAlchemyRoutesRepository(session).refresh_metrics_by_place(item_id)
         await session.commit()
+        await places_catalog.invalidate()
 
         result = await session.execute(
             select(Place).where(Place.id == item_id).options(selectinload(Place.photos))
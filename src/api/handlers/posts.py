@@ -16,7 +16,7 @@ from application.use_cases.posts.feed import PostFeedFilterUseCase
 from common.dto import PostsFiltersDTO
 from common.exceptions import APIException
 from config.containers import Container
-from domain.entities.enums import ModelType
+from domain.entities.enums import ModelType, PaginationType
 from domain.validators.dto import PaginatedResponse
 from infrastructure.models.alchemy.posts import Post
 
@@ -30,6 +30,7 @@ async def list_posts(
     filters: PostsFiltersDTO = Depends(),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    pagination: PaginationType = Query(PaginationType.OFFSET, description="Режим пагинации"),
     use_case: PostFeedFilterUseCase = Depends(Provide[Container.post_feed_use_case]),
 ) -> PaginatedResponse[PostRead]:
     """Получить список постов"""
@@ -39,6 +40,7 @@ async def list_posts(
         PaginatorModel=PostRead,
         page=page,
         page_size=page_size,
+        pagination=pagination,
     )
 
 
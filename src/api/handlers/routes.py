@@ -2,7 +2,7 @@ from io import BytesIO
 from typing import List, Optional
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Body, Depends, File, Form, Request, UploadFile, status
+from fastapi import APIRouter, Body, Depends, File, Form, Query, Request, Response, UploadFile, status
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,17 +12,26 @@ from application.use_cases.common.photo.delete import DeletePhotoUseCase
 from application.use_cases.routes.add_photos import RoutePhotosAddUseCase
 from application.use_cases.routes.avatar import RoutePhotoUpdateUseCase
 from application.use_cases.routes.create import RouteCreateUseCase
-from application.use_cases.routes.dto import RouteCreateDTO
+from application.use_cases.routes.dto import RouteCreateDTO, RouteGenerationJobDTO
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
 from application.use_cases.routes.places.add import RoutePlaceAddUseCase
-from application.use_cases.routes.places.dto import RoutePlacesOrderUpdateDTO
+from application.use_cases.routes.places.dto import (
+    RoutePlacesOptimizeDTO,
+    RoutePlacesOptimizeResultDTO,
+    RoutePlacesOrderUpdateDTO,
+)
+from application.use_cases.routes.places.optimize_order import RoutePlaceOptimizeOrderUseCase
 from application.use_cases.routes.places.remove import RoutePlaceRemoveUseCase
 from application.use_cases.routes.places.update_order import RoutePlaceUpdateOrderUseCase
-from application.use_cases.tasks.route_generate import StartChatGPTRouteGenerateTaskUseCase
+from application.use_cases.tasks.route_generate import (
+    RouteGenerationJobRetrieveUseCase,
+    StartChatGPTRouteGenerateTaskUseCase,
+)
 from common.exceptions import APIException
 from config.containers import Container
 from domain.entities.enums import CityCategory, RouteType
 from infrastructure.models.alchemy.routes import Route
+from infrastructure.repositories.alchemy.routes import SqlAlchemyRoutesRepository
 
 router = APIRouter()
 
@@ -90,6 +99,23 @@ async def update_route_places_order(
     return await use_case.execute(route_id, order_info)
 
 
+@router.post(
+    "/{route_id}/places/optimize_order",
+    response_model=RoutePlacesOptimizeResultDTO,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def optimize_route_places_order(
+    route_id: int,
+    data: RoutePlacesOptimizeDTO = Body(default_factory=RoutePlacesOptimizeDTO),
+    use_case: RoutePlaceOptimizeOrderUseCase = Depends(
+        Provide[Container.route_place_optimize_order_use_case]
+    ),
+) -> RoutePlacesOptimizeResultDTO:
+    """Переупорядочить места маршрута так, чтобы сократить общее расстояние"""
+    return await use_case.execute(route_id, data)
+
+
 @router.patch("/{item_id}", response_model=MiniRouteSchema)
 @inject
 async def patch(
@@ -109,6 +135,9 @@ async def patch(
             .execution_options(synchronize_session="fetch")
         )
         await session.execute(stmt)
+        if "type" in values:
+            # Время в пути зависит от способа передвижения
+            await SqlAlchemyRoutesRepository(session).refresh_metrics(item_id)
         await session.commit()
 
         result = await session.execute(select(Route).where(Route.id == item_id))
@@ -175,11 +204,35 @@ async def generate_route(
     request: Request,
     survey_id: int,
     mode: Mode = Mode.FULL,
+    use_cache: bool = Query(True, description="Использовать сохранённый результат для такой же анкеты"),
     use_case: StartChatGPTRouteGenerateTaskUseCase = Depends(
         Provide[Container.start_route_chatgpt_generate_task]
     ),
-) -> str:
+) -> RouteGenerationJobDTO:
+    """Запустить генерацию маршрута; статус задачи можно опрашивать по job_id"""
     user_id: int = request.state.user.id
 
-    await use_case.execute(user_id, survey_id, mode)
-    return "Генерация маршрута запущена"
+    return await use_case.execute(user_id, survey_id, mode, use_cache)
+
+
+@router.get("/generate/jobs/{job_id}", response_model=RouteGenerationJobDTO, status_code=status.HTTP_200_OK)
+@inject
+async def retrieve_generation_job(
+    request: Request,
+    response: Response,
+    job_id: str,
+    use_case: RouteGenerationJobRetrieveUseCase = Depends(
+        Provide[Container.route_generation_job_retrieve_use_case]
+    ),
+) -> Response | RouteGenerationJobDTO:
+    """Статус задачи генерации маршрута. Пока статус не изменился, на If-None-Match отвечает 304"""
+    job = await use_case.execute(job_id, request.state.user.id)
+
+    etag = f'"{job.job_id}-{job.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("If-None-Match", "")
+    if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return job
@@ -8,13 +8,13 @@ from application.use_cases.common.delete import ModelObjectDeleteUseCase
 from application.use_cases.common.list import ModelObjectListUseCase
 from application.use_cases.common.retrieve import ModelObjectRetrieveUseCase
 from application.use_cases.routes.copy import RouteCopyUseCase
-from application.use_cases.routes.dto import RouteFeedFiltersDTO
+from application.use_cases.routes.dto import RouteFeedFiltersDTO, RouteGenerationJobDTO
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
 from application.use_cases.routes.feed.list import RouteFeedListUseCase
 from application.use_cases.routes.feed.retrieve import RouteFeedRetrieveUseCase
 from application.use_cases.tasks.route_generate import StartChatGPTRouteGenerateTaskUseCase
 from config.containers import Container
-from domain.entities.enums import ModelType
+from domain.entities.enums import ModelType, PaginationType
 from domain.entities.user import User
 from domain.validators.dto import PaginatedResponse
 
@@ -87,6 +87,7 @@ async def routes_feed(
     request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    pagination: PaginationType = Query(PaginationType.OFFSET, description="Режим пагинации"),
     filters: RouteFeedFiltersDTO = Depends(),
     use_case: RouteFeedListUseCase = Depends(Provide[Container.route_feed_use_case]),
 ) -> PaginatedResponse[RouteRead]:
@@ -97,6 +98,7 @@ async def routes_feed(
         PaginatorModel=RouteRead,
         page=page,
         page_size=page_size,
+        pagination=pagination,
     )
 
     return routes
@@ -119,14 +121,15 @@ async def generate_route(
     request: Request,
     survey_id: int,
     mode: Mode = Mode.FULL,
+    use_cache: bool = Query(True, description="Использовать сохранённый результат для такой же анкеты"),
     use_case: StartChatGPTRouteGenerateTaskUseCase = Depends(
         Provide[Container.start_route_chatgpt_generate_task]
     ),
-) -> str:
+) -> RouteGenerationJobDTO:
+    """Запустить генерацию маршрута; статус задачи можно опрашивать по job_id"""
     user_id: int = request.state.user.id
 
-    await use_case.execute(user_id, survey_id, mode)
-    return "Генерация маршрута запущена"
+    return await use_case.execute(user_id, survey_id, mode, use_cache)
 
 
 @router.post("/copy/{route_id}", status_code=status.HTTP_201_CREATED)
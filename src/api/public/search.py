@@ -0,0 +1,27 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query, Request, status
+
+from application.use_cases.search.list import SearchUseCase
+from common.dto import SearchFiltersDTO, SearchResultRead
+from config.containers import Container
+from domain.validators.dto import PaginatedResponse
+
+router = APIRouter(tags=["Public Search"], prefix="/search")
+
+
+@router.get("", response_model=PaginatedResponse[SearchResultRead], status_code=status.HTTP_200_OK)
+@inject
+async def search(
+    request: Request,
+    filters: SearchFiltersDTO = Depends(),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=100),
+    use_case: SearchUseCase = Depends(Provide[Container.search_use_case]),
+) -> PaginatedResponse[SearchResultRead]:
+    """Полнотекстовый поиск по местам, маршрутам и постам, отсортированный по релевантности"""
+    return await use_case.execute(
+        request=request,
+        filters=filters,
+        page=page,
+        page_size=page_size,
+    )
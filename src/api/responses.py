@@ -0,0 +1,65 @@
+import asyncio
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi import Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _supports_fast_json(route: APIRoute) -> bool:
+    response_model = route.response_model
+    return (
+        asyncio.iscoroutinefunction(route.endpoint)
+        and isinstance(response_model, type)
+        and issubclass(response_model, BaseModel)
+        # Заголовки/куки из параметра Response переносятся только стандартным путём FastAPI
+        and route.dependant.response_param_name is None
+        and route.response_model_include is None
+        and route.response_model_exclude is None
+        and not route.response_model_exclude_unset
+        and not route.response_model_exclude_defaults
+        and not route.response_model_exclude_none
+    )
+
+
+def fast_json_endpoint(route: APIRoute) -> Callable[..., Any]:
+    """
+    Оборачивает эндпоинт так, что возвращённая Pydantic-модель сериализуется
+    сразу в байты (pydantic-core), минуя dict-представление, jsonable-обход и json.dumps.
+    Остальные ответы (ORM-объекты, dict, Response) идут стандартным путём FastAPI.
+    """
+    endpoint = route.endpoint
+    if getattr(endpoint, "__fast_json__", False) or not _supports_fast_json(route):
+        return endpoint
+
+    response_model = route.response_model
+    adapter = TypeAdapter(response_model)
+    status_code = route.status_code or 200
+    by_alias = route.response_model_by_alias
+
+    @wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await endpoint(*args, **kwargs)
+        if not isinstance(result, BaseModel):
+            return result
+
+        if type(result) is not response_model:
+            # Приведение к объявленной модели ответа, как это делает FastAPI (лишние поля отбрасываются).
+            # Вложенные экземпляры нужных классов принимаются без повторной валидации.
+            result = adapter.validate_python(result, from_attributes=True)
+
+        content = adapter.dump_json(result, by_alias=by_alias)
+        return Response(content=content, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+    wrapper.__fast_json__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def use_fast_json(router: Any) -> None:
+    """Включить быструю сериализацию для всех маршрутов роутера (до include_router)"""
+    for route in router.routes:
+        if isinstance(route, APIRoute):
+            route.endpoint = fast_json_endpoint(route)
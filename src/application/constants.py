@@ -6,6 +6,14 @@ USERS_MAX_COMMENTS_COUNT = 50
 MIN_PLACES_COUNT = 2
 MAX_PLACES_COUNT = 10
 
+# Сколько мест-кандидатов отправляется в ChatGPT при генерации маршрута
+ROUTE_CANDIDATES_PER_PLACE = 6
+MIN_ROUTE_CANDIDATES = 20
+MAX_ROUTE_CANDIDATES = 60
+MAX_CANDIDATE_KEYWORDS = 40
+# Сколько анкет можно отправить в одну пакетную генерацию
+MAX_BATCH_SURVEYS = 50
+
 MAX_FIELD_SIZE = 10_000
 MAX_PROMPT_LENGHT = 1000
 
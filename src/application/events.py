@@ -3,5 +3,6 @@ from enum import Enum
 
 class EventType(Enum):
     ROUTE_GENERATION_STARTED = "ROUTE_GENERATION_STARTED"
+    ROUTE_GENERATION_PROGRESS = "ROUTE_GENERATION_PROGRESS"
     ROUTE_GENERATION_SUCCEDED = "ROUTE_GENERATION_SUCCEDED"
     ROUTE_GENERATION_FAILED = "ROUTE_GENERATION_FAILED"
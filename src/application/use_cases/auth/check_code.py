@@ -5,27 +5,29 @@ from application.use_cases.base import UseCase
 from domain.entities.user import User
 from infrastructure.managers.dto import UserCreateDTO
 from infrastructure.managers.jwt_manager import JWTManager
-from infrastructure.redis.redis_cache import RedisCache
+from infrastructure.redis.base import AbstractAsyncRedisCache
 from infrastructure.uow.base import UnitOfWork
 
 
 class VerifySmsCodeUseCase(UseCase):
     """Use Case для проверки SMS-кода и выдачи токенов."""
 
-    def __init__(self, uow: UnitOfWork, redis_client: RedisCache, jwt_manager: JWTManager) -> None:
+    def __init__(
+        self, uow: UnitOfWork, redis_client: AbstractAsyncRedisCache, jwt_manager: JWTManager
+    ) -> None:
         self._uow = uow
         self._redis_cache = redis_client
         self._jwt_manager = jwt_manager
 
     async def execute(self, data: SmsPayloadDTO) -> TokenDTO:
         """Проверяет код из SMS и выдает токены."""
-        stored_code = self._redis_cache.get_code_by_phone(data.phone)
+        stored_code = await self._redis_cache.get_code_by_phone(data.phone)
 
         if not stored_code or stored_code != data.code:
             raise HTTPException(status_code=400, detail="Неверный код")
 
         # Удаляем код после успешной проверки
-        self._redis_cache.delete_code_by_phone(data.phone)
+        await self._redis_cache.delete_code_by_phone(data.phone)
 
         is_new_user = False
         async with self._uow(autocommit=True):
@@ -19,6 +19,7 @@ class CommentCreateUseCase(UseCase):
             await self._validate_data(data)
             await self._check_if_comment_limit_exceeded(data)
             comment: Comment = await self._uow.comments.create(Comment(**data.model_dump()))
+            await self._uow.route_stats.refresh(comment.route_id)
             return CommentRead.model_validate(comment)
 
     async def _validate_data(self, data: CommentCreateDTO) -> None:
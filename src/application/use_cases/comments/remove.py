@@ -1,5 +1,6 @@
 from application.use_cases.base import UseCase
 from common.exceptions import APIException
+from domain.entities.comment import Comment
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -14,7 +15,9 @@ class CommentRemoveUseCase(UseCase):
     async def execute(self, comment_id: int, user_id: int) -> None:
         async with self._uow(autocommit=True):
             await self._check_if_comment_exists(comment_id, user_id)
+            comment: Comment = await self._uow.comments.get_by_id(comment_id)
             await self._uow.comments.delete_by_id(comment_id)
+            await self._uow.route_stats.refresh(comment.route_id)
 
     async def _check_if_comment_exists(self, comment_id: int, user_id: int) -> None:
         exists = await self._uow.comments.exists(id=comment_id, author_id=user_id)
@@ -35,6 +35,12 @@ class ModelObjectDeleteUseCase(UseCase):
                             code=403, message=f"Пользователь не имеет права на удаление объекта"
                         )
 
+            # лайки и комментарии маршрута учитываются в route_stats
+            route_id = None
+            if model_type in (ModelType.LIKES, ModelType.COMMENTS):
+                route_id = (await repository.get_by_id(model_id=obj_id)).route_id
+
             await repository.delete_by_id(obj_id)
+            await self._uow.route_stats.refresh(route_id)
 
         return True
@@ -6,7 +6,6 @@ from pydantic import BaseModel
 from application.use_cases.base import UseCase
 from domain.entities.enums import ModelType
 from domain.validators.dto import PaginatedResponse
-from infrastructure.managers.paginator import Paginator
 from infrastructure.uow import UnitOfWork
 
 
@@ -29,6 +28,5 @@ class ModelObjectListUseCase(UseCase):
     ) -> PaginatedResponse:
         async with self._uow(autocommit=True):
             repository = self._uow.get_model_repository(model_type)
-            result = await repository.get_list_models(**filters)
-
-        return await Paginator(ObjectDTO).paginate(result, request, page, page_size)
+            stmt = repository.get_list_models_stmt(**filters)
+            return await repository.paginate(stmt, ObjectDTO, request, page, page_size)
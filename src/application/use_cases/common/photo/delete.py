@@ -27,6 +27,7 @@ class DeletePhotoUseCase(UseCase):
         async with self._uow(autocommit=True):
             photo: Photo = await self._uow.photos.get_by_id(model_id=photo_id)
             await self._uow.photos.delete_by_id(model_id=photo_id)
+            await self._uow.route_stats.refresh(photo.route_id)
 
         filepath = photo.url
         if filepath:
@@ -40,3 +40,4 @@ class UploadPhotosUseCase(UseCase):
 
         async with self._uow(autocommit=True):
             await self._uow.photos.bulk_create(data=photos_to_create)
+            await self._uow.route_stats.refresh(route_id)
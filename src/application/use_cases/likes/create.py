@@ -18,6 +18,7 @@ class LikeCreateUseCase(UseCase):
             await self._validate_data(data)
             await self._check_if_like_exists(data)
             like: Like = await self._uow.likes.create(Like(**data.model_dump()))
+            await self._uow.route_stats.refresh(like.route_id)
             return LikeRead.model_validate(like)
 
     async def _validate_data(self, data: LikeCreateDTO) -> None:
@@ -1,5 +1,6 @@
 from application.use_cases.base import UseCase
 from common.exceptions import APIException
+from domain.entities.like import Like
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -14,7 +15,9 @@ class LikeRemoveUseCase(UseCase):
     async def execute(self, like_id: int, user_id: int) -> None:
         async with self._uow(autocommit=True):
             await self._check_if_like_exists(like_id, user_id)
+            like: Like = await self._uow.likes.get_by_id(like_id)
             await self._uow.likes.delete_by_id(like_id)
+            await self._uow.route_stats.refresh(like.route_id)
 
     async def _check_if_like_exists(self, like_id: int, user_id: int) -> None:
         exists = await self._uow.likes.exists(id=like_id, author_id=user_id)
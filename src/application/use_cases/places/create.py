@@ -8,6 +8,7 @@ from application.use_cases.places.dto import CreatePlaceDTO, PlaceDTO, Validated
 from common.exceptions import APIException
 from domain.entities.place import Place
 from infrastructure.managers.base import StorageManager
+from infrastructure.managers.ChatGPT.catalog import PlacesCatalog
 from infrastructure.managers.enum import ModelType
 from infrastructure.uow.base import UnitOfWork
 
@@ -23,8 +24,10 @@ class PlaceCreateUseCase(UseCase):
         storage_manager: StorageManager,
         update_photo_use_case: PhotoUpdateUseCase,
         upload_photos_use_case: UploadPhotosUseCase,
+        places_catalog: PlacesCatalog,
     ) -> None:
         self._uow = uow
+        self._places_catalog = places_catalog
         self._storage_manager = storage_manager
         self._update_photo_use_case = update_photo_use_case
         self._upload_photos_use_case = upload_photos_use_case
@@ -35,6 +38,7 @@ class PlaceCreateUseCase(UseCase):
             place: Place = await self._uow.places.create(
                 Place(**data.model_dump(exclude=["photo", "photos"]))
             )
+        await self._places_catalog.invalidate()
 
         place = await self._set_photo(photo=data.photo, place=place)
         await self._add_photos(photos=data.photos, place=place, user_id=user_id)
@@ -4,7 +4,6 @@ from pydantic import BaseModel
 from application.use_cases.base import UseCase
 from common.dto import PlaceRead, PlacesFiltersDTO
 from domain.validators.dto import PaginatedResponse
-from infrastructure.managers.paginator import Paginator
 from infrastructure.uow import UnitOfWork
 
 
@@ -27,6 +26,5 @@ class PlaceFeedListUseCase(UseCase):
         page_size: int = 10,
     ) -> PaginatedResponse[BaseModel]:
         async with self._uow(autocommit=True):
-            result = await self._uow.places.get_list_by_filters(filters)
-
-        return await Paginator(PlaceRead).paginate(result, request, page, page_size)
+            stmt = await self._uow.places.get_stmt_by_filters(filters)
+            return await self._uow.places.paginate(stmt, PlaceRead, request, page, page_size)
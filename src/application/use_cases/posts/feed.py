@@ -3,8 +3,8 @@ from openai import BaseModel
 
 from application.use_cases.base import UseCase
 from common.dto import PostsFiltersDTO
+from domain.entities.enums import PaginationType
 from domain.validators.dto import PaginatedResponse
-from infrastructure.managers.paginator import Paginator
 from infrastructure.uow.base import UnitOfWork
 
 
@@ -22,8 +22,12 @@ class PostFeedFilterUseCase(UseCase):
         PaginatorModel: BaseModel,
         page: int = 1,
         page_size: int = 10,
+        pagination: PaginationType = PaginationType.OFFSET,
     ) -> PaginatedResponse[BaseModel]:
         async with self._uow(autocommit=True):
-            result = await self._uow.posts.get_list_by_filters(filters)
-
-        return await Paginator(PaginatorModel).paginate(result, request, page, page_size)
+            stmt = await self._uow.posts.get_stmt_by_filters(filters)
+            if pagination == PaginationType.CURSOR:
+                return await self._uow.posts.paginate_by_cursor(
+                    stmt, PaginatorModel, request, page_size, cursor=filters.cursor
+                )
+            return await self._uow.posts.paginate(stmt, PaginatorModel, request, page, page_size)
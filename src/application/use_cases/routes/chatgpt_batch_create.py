@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from typing import Any, List
+
+from application.events import EventType
+from application.use_cases.routes.chatgpt_create import ChatGPTRouteGenerateUseCase
+from application.use_cases.routes.enums import RouteGenerationMode as Mode
+from common.dto import RouteRead
+from domain.entities.route import Route
+from domain.entities.route_places import RoutePlaces
+from domain.entities.survey import Survey
+from infrastructure.managers.ChatGPT.dto import ChatGPTContentData, ChatGPTRouteData
+
+logger = logging.getLogger(__name__)
+
+
+class ChatGPTRouteBatchGenerateUseCase(ChatGPTRouteGenerateUseCase):
+    """
+    Генерация маршрутов сразу для многих анкет.
+    Все промпты используют одну версию каталога мест, запросы к модели идут параллельно
+    с ограничением concurrency, а все маршруты с местами создаются одной транзакцией.
+    """
+
+    def __init__(self, concurrency: int = 4, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._concurrency = max(concurrency, 1)
+
+    async def execute(
+        self, survey_ids: List[int], mode: str = Mode.FULL.value, use_cache: bool = True
+    ) -> List[Route]:
+        logger.info(f"Start batch route generation for surveys: {survey_ids} in {mode} mode")
+        async with self._uow(autocommit=True):
+            surveys: List[Survey] = await self._uow.surveys.get_list_by_ids(survey_ids)
+
+        missing_ids = set(survey_ids) - {survey.id for survey in surveys}
+        if missing_ids:
+            logger.warning(f"Surveys not found for batch route generation: {sorted(missing_ids)}")
+
+        try:
+            contents = await self._create_contents(surveys)
+            generated = await self._generate_routes_data(contents, Mode(mode), use_cache)
+            if not generated:
+                return []
+
+            try:
+                routes = await self._create_routes(generated)
+            except Exception as e:
+                for survey, _ in generated:
+                    await self._notify_failed(survey, e)
+                raise
+
+            for route, (survey, _) in zip(routes, generated):
+                route_data = RouteRead.model_validate(route).model_dump(mode="json")
+                await self._notifier.notify_user(
+                    survey.author_id, EventType.ROUTE_GENERATION_SUCCEDED.value, route_data
+                )
+            logger.info(f"Finish batch route generation: {len(routes)} of {len(survey_ids)} routes created")
+            return routes
+
+        finally:
+            async with self._uow(autocommit=True):
+                await self._uow.surveys.delete([survey.id for survey in surveys])
+
+    async def _create_contents(self, surveys: List[Survey]) -> List[tuple[Survey, ChatGPTContentData]]:
+        """
+        Данные для промптов собираются последовательно (одна сессия БД),
+        версия каталога читается один раз, поэтому префикс промпта у всего пакета общий.
+        """
+        catalog_version = await self._places_catalog.version()
+        contents = []
+        for survey in surveys:
+            await self._notifier.notify_user(survey.author_id, EventType.ROUTE_GENERATION_STARTED.value)
+            try:
+                content = await self._create_content(survey.author_id, survey.id, catalog_version)
+            except Exception as e:
+                await self._notify_failed(survey, e)
+                continue
+            contents.append((survey, content))
+        return contents
+
+    async def _generate_routes_data(
+        self, contents: List[tuple[Survey, ChatGPTContentData]], mode: Mode, use_cache: bool
+    ) -> List[tuple[Survey, ChatGPTRouteData]]:
+        """Запросы к модели идут параллельно, но не больше concurrency одновременно"""
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def generate(survey: Survey, content: ChatGPTContentData) -> ChatGPTRouteData:
+            async with semaphore:
+                return await self._generate_route_data(content, mode, survey.author_id, use_cache)
+
+        results = await asyncio.gather(
+            *(generate(survey, content) for survey, content in contents), return_exceptions=True
+        )
+
+        generated = []
+        for (survey, content), result in zip(contents, results):
+            if isinstance(result, Exception):
+                await self._notify_failed(survey, result)
+                continue
+            generated.append((survey, self._optimize_places_order(result, content)))
+        return generated
+
+    async def _notify_failed(self, survey: Survey, error: Exception) -> None:
+        logger.info(f"Batch route generation failed for survey: {survey.id}\nException: {error}")
+        await self._notifier.notify_user(survey.author_id, EventType.ROUTE_GENERATION_FAILED.value)
+
+    async def _create_routes(self, generated: List[tuple[Survey, ChatGPTRouteData]]) -> List[Route]:
+        """Все маршруты пакета и их места создаются одной транзакцией"""
+        async with self._uow(autocommit=False):
+            try:
+                await self._validate_places_data(
+                    places=list({place_id for _, route_data in generated for place_id in route_data.places})
+                )
+
+                routes: List[Route] = await self._uow.routes.bulk_create(
+                    [
+                        Route(
+                            **route_data.model_dump(exclude={"name", "keep_order"}),
+                            city=survey.city,
+                            name=survey.name,
+                        )
+                        for survey, route_data in generated
+                    ]
+                )
+                await self._uow.route_places.bulk_create(
+                    [
+                        RoutePlaces(route_id=route.id, place_id=place_id, order=index)
+                        for route, (_, route_data) in zip(routes, generated)
+                        for index, place_id in enumerate(route_data.places, start=1)
+                    ]
+                )
+                for route in routes:
+                    await self._uow.route_stats.refresh(route.id)
+                    await self._uow.routes.refresh_metrics(route.id)
+
+                await self._uow.commit()
+                logger.info(f"Created routes: {[route.id for route in routes]}")
+
+                created_routes = await self._uow.routes.get_list_by_ids([route.id for route in routes])
+                created = {route.id: route for route in created_routes}
+                return [created[route.id] for route in routes]
+
+            except Exception as e:
+                await self._uow.rollback()
+                logger.error(f"Error occurred during batch route creation: {e}", exc_info=True)
+                raise Exception("Не удалось создать маршруты. Попробуйте позже.")
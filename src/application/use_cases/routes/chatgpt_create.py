@@ -1,19 +1,34 @@
+import asyncio
 import logging
+import re
 from asyncio import sleep
-from typing import List
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, List, Optional
 
 from pydantic import ValidationError
 
+from application.constants import (
+    MAX_CANDIDATE_KEYWORDS,
+    MAX_PLACES_COUNT,
+    MAX_ROUTE_CANDIDATES,
+    MIN_PLACES_COUNT,
+    MIN_ROUTE_CANDIDATES,
+    ROUTE_CANDIDATES_PER_PLACE,
+)
 from application.events import EventType
 from application.use_cases.base import UseCase
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
-from common.dto import RouteRead
-from common.exceptions import APIException
+from application.use_cases.surveys.dto import PlaceInfo
+from common.dto import PlaceCandidatesFiltersDTO, RouteRead
+from common.exceptions import APIException, ResponsesLimitExceededException, ServiceUnavailableException
+from domain.entities.enums import SurveyStatus
 from domain.entities.place import Place
 from domain.entities.route import Route
 from domain.entities.route_places import RoutePlaces
 from domain.entities.survey import Survey
 from domain.entities.user import User
+from infrastructure.managers.ChatGPT.catalog import PlacesCatalog
 from infrastructure.managers.ChatGPT.dto import (
     ChatGPTContentData,
     ChatGPTPlaceData,
@@ -21,69 +36,204 @@ from infrastructure.managers.ChatGPT.dto import (
     ChatGPTSurveyData,
     ChatGPTUserData,
 )
+from infrastructure.managers.place_candidates import PlaceCandidateSelector
+from infrastructure.managers.route_optimizer import RouteOrderOptimizer
 from infrastructure.notifications.notifier import PusherNotifier
-from infrastructure.redis.base import AbstractRedisCache
-from infrastructure.repositories.interfaces.ChatGPT.base import ClassificationManager
+from infrastructure.redis.base import AbstractAsyncRedisCache
+from infrastructure.repositories.interfaces.ChatGPT.base import AsyncClassificationManager
 from infrastructure.uow import UnitOfWork
 
 logger = logging.getLogger(__name__)
 
+KEYWORD_PATTERN = re.compile(r"[^\W\d_]{3,}")
+
 
 class ChatGPTRouteGenerateUseCase(UseCase):
     def __init__(
         self,
         uow: UnitOfWork,
         notifier: PusherNotifier,
-        redis_client: AbstractRedisCache,
-        route_generate_gpt_manager: ClassificationManager,
+        redis_client: AbstractAsyncRedisCache,
+        route_generate_gpt_manager: AsyncClassificationManager,
+        route_order_optimizer: RouteOrderOptimizer,
+        place_candidate_selector: PlaceCandidateSelector,
+        places_catalog: PlacesCatalog,
+        local_route_generator: AsyncClassificationManager,
+        local_fallback: bool = True,
+        lock_ttl: int = 120,
     ) -> None:
         self._uow = uow
         self._redis_cache = redis_client
         self._notifier = notifier
 
         self._route_generate_gpt_manager = route_generate_gpt_manager
+        self._route_order_optimizer = route_order_optimizer
+        self._place_candidate_selector = place_candidate_selector
+        self._places_catalog = places_catalog
+        self._local_route_generator = local_route_generator
+        self._local_fallback = local_fallback
+        self._lock_ttl = lock_ttl
 
-    async def execute(self, user_id: int, survey_id: int, mode: str = Mode.FULL.value) -> Route:
+    async def execute(
+        self,
+        user_id: int,
+        survey_id: int,
+        mode: str = Mode.FULL.value,
+        use_cache: bool = True,
+        lock_token: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ) -> Route:
         logger.info(
             f"Start route GPT generate use case for user: {user_id} with survey: {survey_id} in {mode} mode"
         )
+        async with self._hold_generation_lock(user_id, lock_token, job_id):
+            try:
+                await self._update_job(job_id, SurveyStatus.GENERATING)
+                await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_STARTED.value)
+                data = await self._create_content(user_id, survey_id)
+                logger.info(f"Content data: {data}")
+                validated_route_data = await self._generate_route_data(data, Mode(mode), user_id, use_cache)
+                validated_route_data = self._optimize_places_order(validated_route_data, data)
+                logger.info(f"validated_route_data: {validated_route_data}")
+                route = await self._create_route(validated_route_data, survey_id)
+                logger.info("Finish route chatgpt generate use case")
+                route_data = RouteRead.model_validate(route).model_dump(mode="json")
+                await self._update_job(job_id, SurveyStatus.GENERATED_SUCCESS, route_id=route.id)
+                await self._notifier.notify_user(
+                    user_id, EventType.ROUTE_GENERATION_SUCCEDED.value, route_data
+                )
+                return route
+
+            except asyncio.CancelledError:
+                # Отмена (например, при потере блокировки) не является Exception,
+                # но задача и пользователь всё равно должны узнать, что генерация не завершилась
+                logger.info(
+                    f"Route GPT generate use case cancelled for user: {user_id} with survey: {survey_id}"
+                )
+                await self._update_job(
+                    job_id, SurveyStatus.GENERATED_ERROR, reason="Генерация маршрута прервана"
+                )
+                await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_FAILED.value)
+                raise
+
+            except Exception as e:
+                logger.info(
+                    f"Route GPT generate use case failed for user: {user_id} with survey: {survey_id} "
+                    f"in {mode} mode\nException: {e}"
+                )
+                await self._update_job(
+                    job_id, SurveyStatus.GENERATED_ERROR, reason=getattr(e, "message", str(e))
+                )
+                await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_FAILED.value)
+                raise
+
+            finally:
+                async with self._uow(autocommit=True):
+                    await self._uow.surveys.delete_by_id(survey_id)
+
+    async def _update_job(self, job_id: Optional[str], status: SurveyStatus, **fields: str | int) -> None:
+        """Статус задачи генерации для клиентов, которые опрашивают его вместо событий Pusher"""
+        if job_id is not None:
+            await self._redis_cache.update_generation_job(job_id, status.name, **fields)
+
+    @asynccontextmanager
+    async def _hold_generation_lock(
+        self, user_id: int, lock_token: Optional[str], job_id: Optional[str] = None
+    ) -> AsyncIterator[None]:
+        """
+        Блокировка генерации, занятая при запуске задачи, продлевается, пока генерация идёт,
+        и снимается в конце, только если всё ещё принадлежит этой задаче.
+        Если блокировка истекла, пока задача ждала в очереди, она занимается заново;
+        если её уже занял другой запуск, генерация не начинается,
+        а при потере блокировки по ходу генерация отменяется.
+        """
+        if lock_token is None:
+            yield
+            return
+
+        redis_cache = self._redis_cache
+        if not (
+            await redis_cache.extend_route_generation_lock(user_id, lock_token, self._lock_ttl)
+            or await redis_cache.acquire_route_generation_lock(user_id, lock_token, self._lock_ttl)
+        ):
+            message = "Генерация маршрута уже выполняется другой задачей"
+            await self._update_job(job_id, SurveyStatus.GENERATED_ERROR, reason=message)
+            raise APIException(code=409, message=message)
+
+        generation = asyncio.current_task()
+        heartbeat = asyncio.create_task(self._extend_generation_lock(user_id, lock_token, generation))
+        try:
+            yield
+        finally:
+            heartbeat.cancel()
+            await self._redis_cache.release_route_generation_lock(user_id, lock_token)
+
+    async def _extend_generation_lock(
+        self, user_id: int, lock_token: str, generation: Optional[asyncio.Task]
+    ) -> None:
+        while True:
+            await sleep(self._lock_ttl / 3)
+            if not await self._redis_cache.extend_route_generation_lock(
+                user_id, lock_token, self._lock_ttl
+            ):
+                logger.warning(f"Route generation lock of user {user_id} is lost, cancelling generation")
+                if generation is not None:
+                    generation.cancel()
+                return
+
+    async def _generate_route_data(
+        self, content: ChatGPTContentData, mode: Mode, user_id: int, use_cache: bool
+    ) -> ChatGPTRouteData:
+        """
+        Маршрут из кеша по отпечатку анкеты, от ChatGPT или от локального генератора.
+        Локальный генератор работает в быстром режиме и, если разрешено, когда ChatGPT недоступен.
+        """
+        if mode == Mode.LOCAL:
+            return await self._generate_locally(content, user_id)
+
+        fingerprint = content.survey_data.fingerprint(mode.value, content.catalog_version)
+        cached_route_data = await self._redis_cache.get_generated_route(fingerprint) if use_cache else None
+        if cached_route_data is not None:
+            logger.info(f"Route data taken from cache: {fingerprint}")
+            return await self._validate_generated_route(cached_route_data, user_id)
+
         try:
-            await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_STARTED.value)
-            data = await self._create_content(user_id, survey_id)
-            logger.info(f"Content data: {data}")
-            route_data = self._route_generate_gpt_manager.generate_route(data, Mode(mode))
-            # route_data = {
-            #     "name": "Маршрут по Пермскому театру, ресторану и цирку",
-            #     "type": "На машине",
-            #     "places": [89, 92, 93],
-            # }
-            validated_route_data = await self._validate_generated_route(route_data, user_id)
-            logger.info(f"validated_route_data: {validated_route_data}")
-            route = await self._create_route(validated_route_data, survey_id)
-            logger.info("Finish route chatgpt generate use case")
-            route_data = RouteRead.model_validate(route).model_dump(mode="json")
-            await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_SUCCEDED.value, route_data)
-            return route
-
-        except Exception as e:
-            logger.info(
-                f"Route GPT generate use case failed for user: {user_id} with survey: {survey_id} in {mode} mode\n"
-                f"Exception: {e}"
+            route_data = await self._route_generate_gpt_manager.generate_route(
+                content, mode, user_id=user_id, on_progress=partial(self._notify_progress, user_id)
             )
-            await self._notifier.notify_user(user_id, EventType.ROUTE_GENERATION_FAILED.value)
-            raise
+        except (ResponsesLimitExceededException, ServiceUnavailableException) as e:
+            if not self._local_fallback:
+                raise
+            logger.warning(f"ChatGPT is unavailable ({e.message}), falling back to local route generator")
+            return await self._generate_locally(content, user_id)
+        # route_data = {
+        #     "name": "Маршрут по Пермскому театру, ресторану и цирку",
+        #     "type": "На машине",
+        #     "places": [89, 92, 93],
+        # }
+        validated_route_data = await self._validate_generated_route(route_data, user_id)
+        await self._redis_cache.set_generated_route(fingerprint, route_data)
+        return validated_route_data
 
-        finally:
-            self._redis_cache.unset_active_route_geration(user_id)
+    async def _generate_locally(self, content: ChatGPTContentData, user_id: int) -> ChatGPTRouteData:
+        route_data = await self._local_route_generator.generate_route(content, Mode.LOCAL, user_id=user_id)
+        return await self._validate_generated_route(route_data, user_id)
 
-            async with self._uow(autocommit=True):
-                await self._uow.surveys.delete_by_id(survey_id)
+    async def _notify_progress(self, user_id: int, places: List[int]) -> None:
+        """Места, которые ChatGPT уже выбрал, пока ответ ещё генерируется"""
+        await self._notifier.notify_user(
+            user_id, EventType.ROUTE_GENERATION_PROGRESS.value, {"places": places}
+        )
 
-    async def _create_content(self, user_id: int, survey_id: int) -> ChatGPTContentData:
+    async def _create_content(
+        self, user_id: int, survey_id: int, catalog_version: Optional[int] = None
+    ) -> ChatGPTContentData:
         async with self._uow(autocommit=True):
             user: User = await self._uow.users.get_by_id(user_id)
             survey: Survey = await self._uow.surveys.get_by_id(survey_id)
-            places: List[Place] = await self._uow.places.get_list()
+            places: List[Place] = await self._select_candidates(survey)
+            if catalog_version is None:
+                catalog_version = await self._places_catalog.version()
 
             user_dto = ChatGPTUserData(
                 first_name=user.first_name,
@@ -113,8 +263,61 @@ class ChatGPTRouteGenerateUseCase(UseCase):
                 user_data=user_dto,
                 survey_data=survey_dto,
                 places_data=places_dto,
+                places_catalog=await self._get_catalog(survey.city, catalog_version),
+                candidate_ids=[place.id for place in places],
+                catalog_version=catalog_version,
             )
 
+    async def _get_catalog(self, city: str, version: int) -> str:
+        """Компактный каталог города; пересобирается, только если версия в Redis изменилась"""
+        catalog = self._places_catalog.get(city, version)
+        if catalog is None:
+            catalog = self._places_catalog.put(city, version, await self._uow.places.get_list_by_city(city))
+        return catalog
+
+    async def _select_candidates(self, survey: Survey) -> List[Place]:
+        """
+        Ограниченный набор мест для ChatGPT вместо всего каталога:
+        город, категории и типы из анкеты, ключевые слова предпочтений, разброс по карте.
+        """
+        filters = self._build_candidates_filters(survey)
+        limit = self._candidates_limit(survey)
+        filters.limit = limit * 3
+
+        places = await self._uow.places.get_candidates(filters)
+        candidates = self._place_candidate_selector.select(places, limit, pinned_ids=filters.place_ids)
+        logger.info(f"Selected {len(candidates)} of {len(places)} candidate places for survey {survey.id}")
+        return candidates
+
+    @staticmethod
+    def _build_candidates_filters(survey: Survey) -> PlaceCandidatesFiltersDTO:
+        slots = [PlaceInfo.model_validate(slot) for slot in (survey.places or {}).values()]
+        data = survey.data or {}
+
+        texts = [survey.prompt, data.get("preferences"), data.get("experience")]
+        texts += list((data.get("questions") or {}).values())
+        texts += [slot.description for slot in slots]
+        words = (word.lower() for text in texts if text for word in KEYWORD_PATTERN.findall(text))
+        keywords = list(dict.fromkeys(words))
+
+        return PlaceCandidatesFiltersDTO(
+            city=survey.city,
+            categories=list({slot.category for slot in slots if slot.category}),
+            types=list({slot.type for slot in slots if slot.type}),
+            place_ids=[slot.place_id for slot in slots if slot.place_id],
+            keywords=keywords[:MAX_CANDIDATE_KEYWORDS],
+            # Без слотов "на вкус ChatGPT" остальные категории не нужны
+            strict=bool(slots) and all(slot.place_id or slot.category or slot.type for slot in slots),
+        )
+
+    @staticmethod
+    def _candidates_limit(survey: Survey) -> int:
+        """Число кандидатов растёт с числом мест в маршруте"""
+        places_count = (survey.data or {}).get("places_count") or len(survey.places or {})
+        places_count = min(max(places_count, MIN_PLACES_COUNT), MAX_PLACES_COUNT)
+        limit = places_count * ROUTE_CANDIDATES_PER_PLACE
+        return min(max(limit, MIN_ROUTE_CANDIDATES), MAX_ROUTE_CANDIDATES)
+
     async def _validate_generated_route(self, route_data: dict, author_id: int) -> ChatGPTRouteData:
         try:
             return ChatGPTRouteData(**route_data, author_id=author_id)
@@ -124,6 +327,22 @@ class ChatGPTRouteGenerateUseCase(UseCase):
                 code=400, message=(f"ChatGPT responded with invalid route_data: {route_data}. Errors: {e}")
             )
 
+    def _optimize_places_order(
+        self, route_data: ChatGPTRouteData, content: ChatGPTContentData
+    ) -> ChatGPTRouteData:
+        """Порядок мест считается локально; первое место из ответа ChatGPT остаётся стартом"""
+        if route_data.keep_order or len(route_data.places) < 3:
+            return route_data
+
+        coordinates = {place.id: place.coordinates for place in content.places_data}
+        ordered = self._route_order_optimizer.order_places(
+            route_data.places,
+            [coordinates.get(place_id) for place_id in route_data.places],
+            start_place_id=route_data.places[0],
+        )
+        logger.info(f"Optimized places order: {route_data.places} -> {ordered}")
+        return route_data.model_copy(update={"places": ordered})
+
     async def _create_route(self, validated_route_data: ChatGPTRouteData, survey_id: int) -> Route:
         async with self._uow(autocommit=False):
             try:
@@ -133,7 +352,7 @@ class ChatGPTRouteGenerateUseCase(UseCase):
 
                 route: Route = await self._uow.routes.create(
                     Route(
-                        **validated_route_data.model_dump(exclude={"name"}),
+                        **validated_route_data.model_dump(exclude={"name", "keep_order"}),
                         city=survey.city,
                         name=survey.name,
                     )
@@ -143,6 +362,8 @@ class ChatGPTRouteGenerateUseCase(UseCase):
                     RoutePlaces(route_id=route.id, place_id=place_id, order=index)
                     for index, place_id in enumerate(validated_route_data.places, start=1)
                 )
+                await self._uow.route_stats.refresh(route.id)
+                await self._uow.routes.refresh_metrics(route.id)
 
                 await self._uow.commit()
 
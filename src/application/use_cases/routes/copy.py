@@ -23,5 +23,7 @@ class RouteCopyUseCase(UseCase):
                 my_route.id,
                 destination_route.places,
             )
+            await self._uow.route_stats.refresh(my_route.id)
+            await self._uow.routes.refresh_metrics(my_route.id)
 
         return dto.model_validate(my_route)
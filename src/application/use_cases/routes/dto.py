@@ -5,7 +5,7 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import APIException
-from domain.entities.enums import CityCategory, RouteType
+from domain.entities.enums import CityCategory, RouteType, SurveyStatus
 
 
 class RouteCreateDTO(BaseModel):
@@ -64,6 +64,10 @@ class RouteFeedFiltersDTO(BaseModel):
     places_lte: Optional[int] = Field(
         default=None, description="Количество мест в маршруте должно быть МЕНЬШЕ ИЛИ РАВНО этому значению"
     )
+    distance_gte: Optional[int] = Field(default=None, description="Длина маршрута не меньше, в метрах")
+    distance_lte: Optional[int] = Field(default=None, description="Длина маршрута не больше, в метрах")
+    duration_gte: Optional[int] = Field(default=None, description="Время в пути не меньше, в минутах")
+    duration_lte: Optional[int] = Field(default=None, description="Время в пути не больше, в минутах")
     has_avatar: Optional[bool] = Field(
         default=None, description="Если True — возвращать только маршруты с аватаркой"
     )
@@ -73,6 +77,9 @@ class RouteFeedFiltersDTO(BaseModel):
     is_custom: Optional[bool] = Field(
         default=None, description="Фильтрация по пользовательским маршрутам (True/False)"
     )
+    cursor: Optional[str] = Field(
+        default=None, description="Курсор следующей страницы (next_cursor) для keyset-пагинации"
+    )
 
 
 class PublicRouteCreateDTO(BaseModel):
@@ -81,3 +88,15 @@ class PublicRouteCreateDTO(BaseModel):
     type: Optional[RouteType] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RouteGenerationJobDTO(BaseModel):
+    job_id: str
+    status: SurveyStatus
+    survey_id: int
+    route_id: Optional[int] = None
+    reason: Optional[str] = None
+    updated_at: datetime
+    # Увеличивается при каждом изменении статуса, используется как ETag
+    version: int = Field(exclude=True)
+    user_id: int = Field(exclude=True)
@@ -4,3 +4,4 @@ from enum import Enum
 class RouteGenerationMode(Enum):
     FULL = "Свободный"
     PARTIAL = "Частичный"
+    LOCAL = "Быстрый"  # без ChatGPT, локальным генератором
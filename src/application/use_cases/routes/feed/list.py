@@ -3,8 +3,8 @@ from pydantic import BaseModel
 
 from application.use_cases.base import UseCase
 from application.use_cases.routes.dto import RouteFeedFiltersDTO
+from domain.entities.enums import PaginationType
 from domain.validators.dto import PaginatedResponse
-from infrastructure.managers.paginator import Paginator
 from infrastructure.uow import UnitOfWork
 
 
@@ -26,9 +26,13 @@ class RouteFeedListUseCase(UseCase):
         PaginatorModel: BaseModel,
         page: int = 1,
         page_size: int = 10,
+        pagination: PaginationType = PaginationType.OFFSET,
     ) -> PaginatedResponse[BaseModel]:
         add_filters = {"is_publicated": True}
         async with self._uow(autocommit=True):
-            result = await self._uow.routes.get_list_by_filters(filters, add_filters)
-
-        return await Paginator(PaginatorModel).paginate(result, request, page, page_size)
+            stmt = await self._uow.routes.get_stmt_by_filters(filters, add_filters)
+            if pagination == PaginationType.CURSOR:
+                return await self._uow.routes.paginate_by_cursor(
+                    stmt, PaginatorModel, request, page_size, cursor=filters.cursor
+                )
+            return await self._uow.routes.paginate(stmt, PaginatorModel, request, page, page_size)
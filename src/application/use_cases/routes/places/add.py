@@ -30,3 +30,5 @@ class RoutePlaceAddUseCase(UseCase):
             route_place: RoutePlaces = await self._uow.route_places.create(
                 RoutePlaces(route_id=route.id, place_id=place_id, order=order)
             )
+            await self._uow.route_stats.refresh(route.id)
+            await self._uow.routes.refresh_metrics(route.id)
@@ -1,7 +1,21 @@
-from typing import Dict
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class RoutePlacesOrderUpdateDTO(BaseModel):
     order_dict: Dict[int, int]
+
+
+class RoutePlacesOptimizeDTO(BaseModel):
+    start_place_id: Optional[int] = Field(
+        default=None, description="Место, с которого маршрут должен начинаться"
+    )
+    finish_place_id: Optional[int] = Field(
+        default=None, description="Место, которым маршрут должен заканчиваться"
+    )
+
+
+class RoutePlacesOptimizeResultDTO(BaseModel):
+    places: List[int] = Field(description="ID мест в новом порядке посещения")
+    distance: int = Field(description="Длина маршрута по прямой между точками, в метрах")
@@ -0,0 +1,57 @@
+from application.use_cases.base import UseCase
+from application.use_cases.routes.places.dto import RoutePlacesOptimizeDTO, RoutePlacesOptimizeResultDTO
+from common.exceptions import APIException
+from common.geo import route_length
+from domain.entities.route import Route
+from domain.entities.route_places import RoutePlaces
+from infrastructure.managers.route_optimizer import RouteOrderOptimizer
+from infrastructure.uow.base import UnitOfWork
+
+
+class RoutePlaceOptimizeOrderUseCase(UseCase):
+    """
+    Reorder route places to shorten the total distance.
+    """
+
+    def __init__(self, uow: UnitOfWork, route_order_optimizer: RouteOrderOptimizer) -> None:
+        self._uow = uow
+        self._route_order_optimizer = route_order_optimizer
+
+    async def execute(self, route_id: int, data: RoutePlacesOptimizeDTO) -> RoutePlacesOptimizeResultDTO:
+        async with self._uow(autocommit=True):
+            route: Route = await self._uow.routes.get_by_id(route_id)
+            if not route:
+                raise APIException(code=404, message=f"Маршрут с id={route_id} не найден")
+
+            route_places: list[RoutePlaces] = await self._uow.route_places.get_list_by_route_id(route_id)
+            place_ids = [route_place.place_id for route_place in route_places]
+            for place_id in (data.start_place_id, data.finish_place_id):
+                if place_id is not None and place_id not in place_ids:
+                    raise APIException(code=400, message=f"Места с id={place_id} нет в маршруте")
+
+            # Оптимизируются записи RoutePlace, чтобы повторяющиеся места не склеивались
+            by_id = {route_place.id: route_place for route_place in route_places}
+            first_by_place_id = {}
+            for route_place in route_places:
+                first_by_place_id.setdefault(route_place.place_id, route_place.id)
+
+            ordered_ids = self._route_order_optimizer.order_places(
+                list(by_id),
+                [self._coordinates(route_place) for route_place in route_places],
+                start_place_id=first_by_place_id.get(data.start_place_id),
+                finish_place_id=first_by_place_id.get(data.finish_place_id),
+            )
+            await self._uow.route_places.update_orders(
+                {route_place_id: order for order, route_place_id in enumerate(ordered_ids, start=1)}
+            )
+            await self._uow.routes.refresh_metrics(route_id)
+
+            ordered = [by_id[route_place_id] for route_place_id in ordered_ids]
+            return RoutePlacesOptimizeResultDTO(
+                places=[route_place.place_id for route_place in ordered],
+                distance=round(route_length([self._coordinates(route_place) for route_place in ordered])),
+            )
+
+    @staticmethod
+    def _coordinates(route_place: RoutePlaces) -> list[float] | None:
+        return route_place.place.coordinates if route_place.place else None
@@ -25,3 +25,5 @@ class RoutePlaceRemoveUseCase(UseCase):
                     raise APIException(code=404, message=f"Место с id={place_id} не найдено")
 
             await self._uow.route_places.remove_route_place_by_id(route_id, place_id)
+            await self._uow.route_stats.refresh(route_id)
+            await self._uow.routes.refresh_metrics(route_id)
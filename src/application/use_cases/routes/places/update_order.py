@@ -22,3 +22,4 @@ class RoutePlaceUpdateOrderUseCase(UseCase):
 
             for place_id, order in data.order_dict.items():
                 await self._uow.route_places.update_order(place_id, order)
+            await self._uow.routes.refresh_metrics(route_id)
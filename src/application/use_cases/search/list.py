@@ -0,0 +1,29 @@
+from fastapi import Request
+
+from application.use_cases.base import UseCase
+from common.dto import SearchFiltersDTO, SearchResultRead
+from domain.validators.dto import PaginatedResponse
+from infrastructure.uow import UnitOfWork
+
+
+class SearchUseCase(UseCase):
+    """
+    Full-text search across places, routes and posts.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWork,
+    ) -> None:
+        self._uow = uow
+
+    async def execute(
+        self,
+        request: Request,
+        filters: SearchFiltersDTO,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse[SearchResultRead]:
+        async with self._uow(autocommit=True):
+            stmt = self._uow.search.get_search_stmt(filters)
+            return await self._uow.search.paginate(stmt, request, page, page_size)
@@ -1,10 +1,14 @@
 import logging
-from typing import Any
+from typing import Any, List
+from uuid import uuid4
 
+from application.constants import MAX_BATCH_SURVEYS
 from application.use_cases.base import UseCase
+from application.use_cases.routes.dto import RouteGenerationJobDTO
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
 from common.exceptions import APIException
-from infrastructure.redis.base import AbstractRedisCache
+from domain.entities.enums import SurveyStatus
+from infrastructure.redis.base import AbstractAsyncRedisCache
 from infrastructure.tasks import Task
 from infrastructure.uow import UnitOfWork
 
@@ -15,18 +19,81 @@ class StartChatGPTRouteGenerateTaskUseCase(UseCase):
     def __init__(
         self,
         uow: UnitOfWork,
-        redis_client: AbstractRedisCache,
+        redis_client: AbstractAsyncRedisCache,
         route_generate_gpt_task: Task,
+        lock_ttl: int = 120,
     ) -> None:
         self._uow = uow
         self._redis_cache = redis_client
         self._chatgpt_process_route_task = route_generate_gpt_task
+        self._lock_ttl = lock_ttl
 
-    async def execute(self, user_id: int, survey_id: int, mode: Mode = Mode.FULL) -> Any:
-        if self._redis_cache.check_if_user_has_active_route_geration(user_id):
+    async def execute(
+        self, user_id: int, survey_id: int, mode: Mode = Mode.FULL, use_cache: bool = True
+    ) -> RouteGenerationJobDTO:
+        # Блокировка занимается атомарно (SET NX), токен владельца передаётся в задачу
+        lock_token = uuid4().hex
+        if not await self._redis_cache.acquire_route_generation_lock(user_id, lock_token, self._lock_ttl):
             raise APIException(code=400, message="У пользователя уже есть активная генерация маршрута")
-        else:
-            self._redis_cache.set_active_route_geration(user_id)
 
-        logger.info("Started ChatGPT route generating task")
-        self._chatgpt_process_route_task.delay(user_id, survey_id, mode.value)
+        job_id = uuid4().hex
+        await self._redis_cache.create_generation_job(job_id, user_id, survey_id, SurveyStatus.QUEUED.name)
+
+        logger.info(f"Started ChatGPT route generating task, job: {job_id}")
+        try:
+            self._chatgpt_process_route_task.delay(
+                user_id, survey_id, mode.value, use_cache, lock_token, job_id
+            )
+        except Exception:
+            await self._redis_cache.release_route_generation_lock(user_id, lock_token)
+            await self._redis_cache.update_generation_job(
+                job_id, SurveyStatus.GENERATED_ERROR.name, reason="Не удалось поставить генерацию в очередь"
+            )
+            raise
+
+        return job_to_dto(job_id, await self._redis_cache.get_generation_job(job_id))
+
+
+class RouteGenerationJobRetrieveUseCase(UseCase):
+    """Состояние задачи генерации маршрута пользователя для опроса клиентом"""
+
+    def __init__(self, redis_client: AbstractAsyncRedisCache) -> None:
+        self._redis_cache = redis_client
+
+    async def execute(self, job_id: str, user_id: int) -> RouteGenerationJobDTO:
+        job = await self._redis_cache.get_generation_job(job_id)
+        if job is None or int(job["user_id"]) != user_id:
+            raise APIException(code=404, message=f"Задача генерации маршрута {job_id} не найдена")
+        return job_to_dto(job_id, job)
+
+
+class StartChatGPTRouteBatchGenerateTaskUseCase(UseCase):
+    def __init__(self, route_batch_generate_gpt_task: Task) -> None:
+        self._chatgpt_process_routes_batch_task = route_batch_generate_gpt_task
+
+    async def execute(self, survey_ids: List[int], mode: Mode = Mode.FULL, use_cache: bool = True) -> Any:
+        survey_ids = list(dict.fromkeys(survey_ids))
+        if not survey_ids:
+            raise APIException(code=400, message="Не переданы анкеты для генерации маршрутов")
+        if len(survey_ids) > MAX_BATCH_SURVEYS:
+            raise APIException(
+                code=400, message=f"За один раз можно сгенерировать не больше {MAX_BATCH_SURVEYS} маршрутов"
+            )
+
+        logger.info(f"Started ChatGPT batch route generating task for {len(survey_ids)} surveys")
+        self._chatgpt_process_routes_batch_task.delay(survey_ids, mode.value, use_cache)
+
+
+def job_to_dto(job_id: str, job: dict[str, str] | None) -> RouteGenerationJobDTO:
+    if job is None:
+        raise APIException(code=404, message=f"Задача генерации маршрута {job_id} не найдена")
+    return RouteGenerationJobDTO(
+        job_id=job_id,
+        status=SurveyStatus[job["status"]],
+        survey_id=int(job["survey_id"]),
+        route_id=int(job["route_id"]) if job.get("route_id") else None,
+        reason=job.get("reason") or None,
+        updated_at=job["updated_at"],
+        version=int(job["version"]),
+        user_id=int(job["user_id"]),
+    )
@@ -1,9 +1,10 @@
+from typing import Optional
+
 from fastapi import Request
 
 from application.use_cases.base import UseCase
 from application.use_cases.users.dto import UserDTO
 from domain.validators.dto import PaginatedResponse
-from infrastructure.managers.paginator import Paginator
 from infrastructure.uow import UnitOfWork
 
 
@@ -14,12 +15,10 @@ class UsersListUseCase(UseCase):
 
     def __init__(self, uow: UnitOfWork) -> None:
         self._uow = uow
-        self.paginator = Paginator(schema_read=UserDTO)
 
     async def execute(
-        self, request: Request, page: int = 1, page_size: int = 10
+        self, request: Request, page: int = 1, page_size: int = 10, name: Optional[str] = None
     ) -> PaginatedResponse[UserDTO]:
         async with self._uow(autocommit=True):
-            result = await self._uow.users.get_list_models()
-
-        return await self.paginator.paginate(result, request, page, page_size)
+            stmt = self._uow.users.get_stmt_by_name(name)
+            return await self._uow.users.paginate(stmt, UserDTO, request, page, page_size)
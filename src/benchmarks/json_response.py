@@ -0,0 +1,136 @@
+"""
+Микро-бенчмарк сериализации ответа: страница ленты из 100 маршрутов.
+
+Сравнивает стандартный путь FastAPI (валидация ответа -> dict -> json.dumps)
+с быстрым путём api.responses (модель -> байты в pydantic-core).
+
+Запуск из каталога src:
+    python -m benchmarks.json_response
+"""
+
+import os
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+os.environ.setdefault("PUSHER__APP_ID", "bench")
+os.environ.setdefault("PUSHER__KEY", "bench")
+os.environ.setdefault("PUSHER__SECRET", "bench")
+
+from fastapi import APIRouter, FastAPI, Query, status  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api.admin.schemas import RouteRead  # noqa: E402
+from api.responses import use_fast_json  # noqa: E402
+from domain.entities.enums import CityCategory, PlaceCategory, RouteType  # noqa: E402
+from domain.validators.dto import PaginatedResponse  # noqa: E402
+
+ROUTES_PER_PAGE = 100
+PLACES_PER_ROUTE = 8
+PHOTOS_PER_ITEM = 3
+REQUESTS = 200
+
+
+def _photos(prefix: str) -> list[SimpleNamespace]:
+    return [SimpleNamespace(id=i, url=f"/media/{prefix}/{i}.jpg") for i in range(1, PHOTOS_PER_ITEM + 1)]
+
+
+def _route(route_id: int) -> SimpleNamespace:
+    places = [
+        SimpleNamespace(
+            order=order,
+            place=SimpleNamespace(
+                id=route_id * 100 + order,
+                name=f"Место {order}",
+                website_url="https://example.com",
+                description="Описание места " * 10,
+                city=CityCategory.PERM,
+                category=list(PlaceCategory)[order % len(PlaceCategory)],
+                type=None,
+                tags="музей, история, центр",
+                coordinates=[58.0 + order / 100, 56.2 + order / 100],
+                object_id=1000 + order,
+                photo="/media/place.jpg",
+                map_name=None,
+                photos=_photos("places"),
+            ),
+        )
+        for order in range(1, PLACES_PER_ROUTE + 1)
+    ]
+    return SimpleNamespace(
+        id=route_id,
+        name=f"Маршрут {route_id}",
+        description="Описание маршрута " * 5,
+        city=CityCategory.PERM,
+        type=RouteType.WALKING,
+        photo="/media/route.jpg",
+        author_id=1,
+        duration=90,
+        distance=4200,
+        is_publicated=True,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        author=SimpleNamespace(
+            id=1,
+            phone="79990000000",
+            first_name="Иван",
+            last_name="Иванов",
+            middle_name=None,
+            registration_date=datetime.now(),
+            is_banned=False,
+            is_admin=False,
+            photo=None,
+            description=None,
+        ),
+        photos=_photos("routes"),
+        places=places,
+        yandex_maps_url="https://yandex.ru/maps/?mode=routes",
+    )
+
+
+PAGE = PaginatedResponse[RouteRead](
+    data=[RouteRead.model_validate(_route(i)) for i in range(1, ROUTES_PER_PAGE + 1)],
+    count=10_000,
+    page=1,
+    page_size=ROUTES_PER_PAGE,
+    total_pages=100,
+)
+
+
+def _build_app(fast: bool) -> FastAPI:
+    router = APIRouter()
+
+    @router.get("/feed", response_model=PaginatedResponse[RouteRead], status_code=status.HTTP_200_OK)
+    async def feed(page: int = Query(1)) -> PaginatedResponse[RouteRead]:
+        return PAGE
+
+    if fast:
+        use_fast_json(router)
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+def _bench(fast: bool) -> tuple[float, bytes]:
+    client = TestClient(_build_app(fast))
+    body = client.get("/feed").content
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get("/feed")
+    return REQUESTS / (time.perf_counter() - started), body
+
+
+def main() -> None:
+    default_rps, default_body = _bench(fast=False)
+    fast_rps, fast_body = _bench(fast=True)
+
+    import json
+
+    assert json.loads(default_body) == json.loads(fast_body), "Ответы должны совпадать"
+    print(f"Страница: {ROUTES_PER_PAGE} маршрутов, {len(fast_body) / 1024:.0f} КБ")
+    print(f"FastAPI по умолчанию: {default_rps:8.1f} запросов/с")
+    print(f"Быстрая сериализация: {fast_rps:8.1f} запросов/с (x{fast_rps / default_rps:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,8 @@ from typing import Any, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 from application.utils import get_settings
-from domain.entities.enums import CityCategory, PlaceCategory, PlaceType, RouteType
+from common.geo import DEFAULT_RADIUS_M
+from domain.entities.enums import CityCategory, ModelType, PlaceCategory, PlaceType, RouteType
 from domain.entities.place import Place
 from domain.entities.route import Route
 
@@ -145,7 +146,7 @@ class RouteRead(CommonRouteBase):
     def model_validate(cls, route: Route) -> "RouteRead":
         sorted_places = sorted(route.places, key=lambda p: p.order)
 
-        obj = cls(
+        return cls(
             id=route.id,
             name=route.name,
             city=route.city,
@@ -159,52 +160,22 @@ class RouteRead(CommonRouteBase):
             author=UserRead.model_validate(route.author),
             photos=[PhotoRead.model_validate(p) for p in route.photos],
             places=([RoutePlaceRead.model_validate(place) for place in sorted_places]),
+            yandex_maps_url=route.yandex_maps_url,
         )
-        obj.yandex_maps_url = obj._compute_yandex_maps_url()
-        return obj
-
-    def _compute_yandex_maps_url(self) -> Optional[str]:
-        if not self.places:
-            return None
 
-        # Сортировка по порядку
-        sorted_places = sorted(self.places, key=lambda x: x.order)
 
-        # Сбор координат в формате широта,долгота
-        coords = "~".join(
-            f"{p.place.coordinates[0]},{p.place.coordinates[1]}"
-            for p in sorted_places
-            if p.place and p.place.coordinates
-        )
-
-        # Сбор ruri (если есть object_id / oid)
-        ruris = "~".join(
-            f"ymapsbm1:/org?oid={p.place.object_id}"
-            for p in sorted_places
-            if p.place and getattr(p.place, "object_id", None) not in (None, "", 0)
-        )
-        # Расчёт центра карты (по первой точке)
-        first = sorted_places[0].place.coordinates if sorted_places else [0, 0]
-        ll = f"{first[1]},{first[0]}"  # долгота,широта
-
-        # Выбор типа маршрута
-        rtt_map = {
-            RouteType.WALKING: "pd",  # Пешком
-            RouteType.CAR: "auto",  # Машина
-            RouteType.VEHICLE: "auto",
-            RouteType.BUS: "mt",  # Общественный транспорт
-            RouteType.SCOOTER_BIKE: "bc",
-            RouteType.MIXED: "comparison",  # Смешанный
-        }
-        rtt_value = rtt_map.get(self.type, "mt")
-
-        # Финальная ссылка
-        base = f"https://yandex.ru/maps/?mode=routes&rtext={coords}&rtt={rtt_value}&z=14&ll={ll}"
-        if ruris:
-            base += f"&ruri={ruris}"
-        else:
-            base += "&ruri=~~"
-        return base
+def parse_coordinates(value: str, size: int) -> list[float]:
+    """Разбирает строку 'широта,долгота[,широта,долгота]' с проверкой диапазонов"""
+    try:
+        items = [float(item) for item in value.split(",")]
+    except ValueError:
+        raise ValueError(f"Ожидаются {size} числа через запятую")
+    if len(items) != size:
+        raise ValueError(f"Ожидаются {size} числа через запятую")
+    for lat, lon in zip(items[::2], items[1::2]):
+        if not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            raise ValueError("Широта должна быть в [-90, 90], долгота в [-180, 180]")
+    return items
 
 
 class PlacesFiltersDTO(BaseModel):
@@ -214,6 +185,15 @@ class PlacesFiltersDTO(BaseModel):
     types: Optional[str] = Field(default=None, description="Типы через запятую")
     has_avatar: Optional[bool] = None
     has_photos: Optional[bool] = None
+    near: Optional[str] = Field(
+        default=None, description="Точка 'широта,долгота': места в радиусе radius, ближайшие первыми"
+    )
+    radius: float = Field(
+        default=DEFAULT_RADIUS_M, gt=0, le=50_000, description="Радиус поиска около near, в метрах"
+    )
+    bbox: Optional[str] = Field(
+        default=None, description="Область карты 'мин_широта,мин_долгота,макс_широта,макс_долгота'"
+    )
 
     @field_validator("categories")
     def split_categories(cls, value):
@@ -227,6 +207,35 @@ class PlacesFiltersDTO(BaseModel):
             return [PlaceType(item.strip()) for item in value.split(",") if item.strip()]
         return value
 
+    @field_validator("near")
+    def split_near(cls, value):
+        if isinstance(value, str):
+            lat, lon = parse_coordinates(value, 2)
+            return lat, lon
+        return value
+
+    @field_validator("bbox")
+    def split_bbox(cls, value):
+        if isinstance(value, str):
+            min_lat, min_lon, max_lat, max_lon = parse_coordinates(value, 4)
+            if min_lat > max_lat or min_lon > max_lon:
+                raise ValueError("bbox: минимальные координаты должны быть не больше максимальных")
+            return min_lat, min_lon, max_lat, max_lon
+        return value
+
+
+class PlaceCandidatesFiltersDTO(BaseModel):
+    """Критерии отбора мест-кандидатов для генерации маршрута"""
+
+    city: Optional[CityCategory] = None
+    categories: List[PlaceCategory] = Field(default_factory=list)
+    types: List[PlaceType] = Field(default_factory=list)
+    place_ids: List[int] = Field(default_factory=list, description="Места, выбранные пользователем явно")
+    keywords: List[str] = Field(default_factory=list, description="Слова из предпочтений и промпта")
+    strict: bool = Field(default=False, description="Брать только места нужных категорий и типов")
+    per_category: int = Field(default=15, gt=0, description="Не больше стольких мест одной категории")
+    limit: int = Field(default=150, gt=0, description="Размер выборки до географического прореживания")
+
 
 class PostsFiltersDTO(BaseModel):
     title: Optional[str] = Field(default=None, description="Поиск поста по имени (частичное совпадение)")
@@ -258,3 +267,51 @@ class PostsFiltersDTO(BaseModel):
     is_custom: Optional[bool] = Field(
         default=None, description="Фильтрация по пользовательским маршрутам (True/False)"
     )
+    cursor: Optional[str] = Field(
+        default=None, description="Курсор следующей страницы (next_cursor) для keyset-пагинации"
+    )
+
+
+SEARCHABLE_MODEL_TYPES = (ModelType.PLACES, ModelType.ROUTES, ModelType.POSTS)
+
+
+class SearchFiltersDTO(BaseModel):
+    q: str = Field(
+        min_length=1, description='Поисковый запрос (синтаксис websearch: слова, "фраза", -исключение)'
+    )
+    city: Optional[CityCategory] = Field(
+        default=CityCategory.PERM, description="Фильтрация по городу. По умолчанию — Пермь"
+    )
+    types: Optional[str] = Field(
+        default=None, description="Типы объектов через запятую: places, routes, posts"
+    )
+
+    @field_validator("types")
+    def split_types(cls, value):
+        if isinstance(value, str):
+            types = [ModelType(item.strip()) for item in value.split(",") if item.strip()]
+            if any(model_type not in SEARCHABLE_MODEL_TYPES for model_type in types):
+                allowed = ", ".join(model_type.value for model_type in SEARCHABLE_MODEL_TYPES)
+                raise ValueError(f"Поиск поддерживается только по: {allowed}")
+            return types
+        return value
+
+
+class SearchResultRead(BaseModel):
+    type: ModelType
+    id: int
+    title: str
+    description: Optional[str] = None
+    photo: Optional[str] = None
+    rank: float
+
+    @classmethod
+    def model_validate(cls, row: Any) -> "SearchResultRead":
+        return cls(
+            type=row["type"],
+            id=row["id"],
+            title=row["title"],
+            description=row["description"],
+            photo=f"{get_settings().app.base_url}/{row['photo'].lstrip('/')}" if row["photo"] else None,
+            rank=row["rank"],
+        )
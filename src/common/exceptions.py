@@ -8,3 +8,9 @@ class ResponsesLimitExceededException(Exception):
     def __init__(self, message="ChatGPT responses limit per day exceeded", code=429):
         self.message = message
         self.code = code
+
+
+class ServiceUnavailableException(Exception):
+    def __init__(self, message="ChatGPT is temporarily unavailable", code=503):
+        self.message = message
+        self.code = code
@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+from domain.entities.enums import RouteType
+
+EARTH_RADIUS_M = 6_371_000
+DEFAULT_RADIUS_M = 1000
+
+# Средняя скорость передвижения по городу, км/ч
+ROUTE_TYPE_SPEED_KMH = {
+    RouteType.WALKING: 4.5,
+    RouteType.SCOOTER_BIKE: 12.0,
+    RouteType.BUS: 18.0,
+    RouteType.CAR: 30.0,
+    RouteType.VEHICLE: 30.0,
+    RouteType.MIXED: 15.0,
+}
+
+
+def radius_bbox(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
+    """
+    Прямоугольник (min_lat, min_lon, max_lat, max_lon), описанный вокруг круга радиуса radius_m.
+    Используется как индексный предфильтр перед точной проверкой по haversine.
+    """
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-12)
+    d_lon = min(math.degrees(radius_m / (EARTH_RADIUS_M * cos_lat)), 180.0)
+    return lat - d_lat, lon - d_lon, lat + d_lat, lon + d_lon
+
+
+def haversine_matrix(coordinates: np.ndarray) -> np.ndarray:
+    """Матрица попарных расстояний в метрах для массива точек формы (n, 2) = [широта, долгота]"""
+    radians = np.radians(np.asarray(coordinates, dtype=float))
+    lat, lon = radians[:, 0], radians[:, 1]
+    d_lat = lat[:, None] - lat[None, :]
+    d_lon = lon[:, None] - lon[None, :]
+    a = np.sin(d_lat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(d_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def path_length(distances: np.ndarray, order: list[int] | np.ndarray) -> float:
+    """Длина пути, проходящего точки в порядке order, по матрице расстояний"""
+    order = np.asarray(order, dtype=int)
+    if order.size < 2:
+        return 0.0
+    return float(distances[order[:-1], order[1:]].sum())
+
+
+def route_length(coordinates: list[list[float] | None]) -> float:
+    """Длина ломаной через точки в заданном порядке, в метрах. Точки без координат пропускаются"""
+    points = [point[:2] for point in coordinates if point and len(point) >= 2]
+    if len(points) < 2:
+        return 0.0
+    points = np.asarray(points, dtype=float)
+    distances = haversine_matrix(points)
+    return path_length(distances, np.arange(len(points)))
+
+
+def route_duration(distance_m: float, route_type: RouteType | None) -> int:
+    """Время в пути в минутах для заданного способа передвижения"""
+    speed_kmh = ROUTE_TYPE_SPEED_KMH.get(route_type, ROUTE_TYPE_SPEED_KMH[RouteType.MIXED])
+    return round(distance_m / 1000 / speed_kmh * 60)
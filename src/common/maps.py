@@ -0,0 +1,38 @@
+from typing import Optional, Sequence
+
+from domain.entities.enums import RouteType
+
+YANDEX_MAPS_ROUTE_TYPES = {
+    RouteType.WALKING: "pd",  # Пешком
+    RouteType.CAR: "auto",  # Машина
+    RouteType.VEHICLE: "auto",
+    RouteType.BUS: "mt",  # Общественный транспорт
+    RouteType.SCOOTER_BIKE: "bc",
+    RouteType.MIXED: "comparison",  # Смешанный
+}
+
+
+def build_yandex_maps_url(
+    points: Sequence[tuple[Optional[Sequence[float]], Optional[int]]],
+    route_type: Optional[RouteType],
+) -> Optional[str]:
+    """
+    Ссылка на маршрут в Яндекс.Картах.
+    points: (координаты [широта, долгота], object_id) мест в порядке посещения.
+    """
+    located = [coordinates for coordinates, _ in points if coordinates]
+    if not located:
+        return None
+
+    # Сбор координат в формате широта,долгота
+    coords = "~".join(f"{lat},{lon}" for lat, lon, *_ in located)
+
+    # Сбор ruri (если есть object_id / oid)
+    ruris = "~".join(f"ymapsbm1:/org?oid={object_id}" for _, object_id in points if object_id)
+
+    # Центр карты по первой точке: долгота,широта
+    ll = f"{located[0][1]},{located[0][0]}"
+    rtt_value = YANDEX_MAPS_ROUTE_TYPES.get(route_type, "mt")
+
+    url = f"https://yandex.ru/maps/?mode=routes&rtext={coords}&rtt={rtt_value}&z=14&ll={ll}"
+    return url + (f"&ruri={ruris}" if ruris else "&ruri=~~")
@@ -10,6 +10,7 @@ from fastapi.staticfiles import StaticFiles
 import api
 from api import admin_routers, public_routers
 from api.middlewares.get_jwt_token_user import JwtTokenUserMiddleware
+from api.responses import use_fast_json
 from config.celery import app as celery_app  # noqa
 from config.containers import Container
 from config.loggers import config_loggers
@@ -55,10 +56,13 @@ def add_exception_hanlers(app: FastAPI) -> None:
 
 
 def include_routers(app: FastAPI, settings: Settings) -> None:
+    # Модели ответов сериализуются сразу в байты, без jsonable-обхода и json.dumps
     for router in admin_routers:
+        use_fast_json(router)
         app.include_router(router, prefix=settings.api.admin_prefix)
 
     for router in public_routers:
+        use_fast_json(router)
         app.include_router(router, prefix=settings.api.public_prefix)
 
 
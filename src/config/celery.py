@@ -1,12 +1,30 @@
+from typing import Any
+
 from celery import Celery
+from celery.concurrency.thread import TaskPool as ThreadTaskPool
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready, worker_shutdown
+from kombu import Queue
+from sqlalchemy import text
 
 from config.containers import Container
 from config.loggers import config_loggers
 from config.settings import Settings
+from infrastructure.tasks.loop import task_event_loop
 
 settings = Settings()
 TASKS_PACKAGES = ["infrastructure.tasks"]
 
+# Генерация маршрутов (долгие запросы к ChatGPT) и обработка медиа идут в отдельных очередях
+# со своими воркерами, чтобы всплеск генераций не задерживал быстрые задачи
+DEFAULT_QUEUE = "default"
+GENERATION_QUEUE = "generation"
+MEDIA_QUEUE = "media"
+TASK_QUEUES = (Queue(DEFAULT_QUEUE), Queue(GENERATION_QUEUE), Queue(MEDIA_QUEUE))
+TASK_ROUTES = {
+    "bestway.tasks.default.route_*": {"queue": GENERATION_QUEUE},
+    "bestway.tasks.media.*": {"queue": MEDIA_QUEUE},
+}
+
 
 def create_app() -> Celery:
     app = Celery(
@@ -14,6 +32,12 @@ def create_app() -> Celery:
         broker=settings.task.broker_url,
         backend=settings.task.result_url,
     )
+    app.conf.task_queues = TASK_QUEUES
+    app.conf.task_default_queue = DEFAULT_QUEUE
+    app.conf.task_routes = TASK_ROUTES
+    app.conf.worker_pool = settings.task.worker_pool
+    app.conf.worker_concurrency = settings.task.worker_concurrency
+    app.conf.worker_prefetch_multiplier = settings.task.worker_prefetch_multiplier
     app.autodiscover_tasks(TASKS_PACKAGES, related_name="__init__")
     container = Container()
     container.wire(
@@ -46,4 +70,39 @@ def create_app() -> Celery:
     return app
 
 
+async def warm_up_pools(container: Container) -> None:
+    """Соединения с БД и Redis открываются при старте процесса, а не в первой задаче"""
+    database = container.db.container.db()
+    # Соединения, унаследованные от родительского процесса после fork, не используются
+    await database.engine.dispose(close=False)
+    async with database.session_factory() as session:
+        await session.execute(text("SELECT 1"))
+    container.clients.container.redis_pool().ping()
+    await container.clients.container.async_redis_cache().ping()
+
+
+async def close_pools(container: Container) -> None:
+    await container.db.container.db().engine.dispose()
+
+
 app = create_app()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs: Any) -> None:
+    """Дочерний процесс prefork-пула или solo-воркер"""
+    task_event_loop.run(warm_up_pools(app.container))
+
+
+@worker_ready.connect
+def init_thread_pool_worker(sender: Any = None, **kwargs: Any) -> None:
+    """Пул потоков не отправляет worker_process_init: все задачи выполняются в главном процессе"""
+    if isinstance(getattr(sender, "pool", None), ThreadTaskPool):
+        task_event_loop.run(warm_up_pools(app.container))
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_process(**kwargs: Any) -> None:
+    task_event_loop.run(close_pools(app.container))
+    task_event_loop.stop()
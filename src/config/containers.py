@@ -33,20 +33,27 @@ from application.use_cases.posts.create import PostCreateUseCase
 from application.use_cases.posts.feed import PostFeedFilterUseCase
 from application.use_cases.routes.add_photos import RoutePhotosAddUseCase
 from application.use_cases.routes.avatar import RoutePhotoUpdateUseCase
+from application.use_cases.routes.chatgpt_batch_create import ChatGPTRouteBatchGenerateUseCase
 from application.use_cases.routes.chatgpt_create import ChatGPTRouteGenerateUseCase
 from application.use_cases.routes.copy import RouteCopyUseCase
 from application.use_cases.routes.create import RouteCreateUseCase
 from application.use_cases.routes.feed.list import RouteFeedListUseCase
 from application.use_cases.routes.feed.retrieve import RouteFeedRetrieveUseCase
 from application.use_cases.routes.places.add import RoutePlaceAddUseCase
+from application.use_cases.routes.places.optimize_order import RoutePlaceOptimizeOrderUseCase
 from application.use_cases.routes.places.remove import RoutePlaceRemoveUseCase
 from application.use_cases.routes.places.update_order import RoutePlaceUpdateOrderUseCase
+from application.use_cases.search.list import SearchUseCase
 from application.use_cases.surveys.create import SurveyCreateUseCase
 from application.use_cases.surveys.delete import SurveyDeleteUseCase
 from application.use_cases.surveys.list import SurveysListUseCase
 from application.use_cases.surveys.retrieve import SurveyRetrieveUseCase
 from application.use_cases.surveys.update import SurveyUpdateUseCase
-from application.use_cases.tasks.route_generate import StartChatGPTRouteGenerateTaskUseCase
+from application.use_cases.tasks.route_generate import (
+    RouteGenerationJobRetrieveUseCase,
+    StartChatGPTRouteBatchGenerateTaskUseCase,
+    StartChatGPTRouteGenerateTaskUseCase,
+)
 from application.use_cases.users.delete_user import UserDeleteUseCase
 from application.use_cases.users.list import UsersListUseCase
 from application.use_cases.users.photo import UserPhotoUpdateUseCase
@@ -54,17 +61,21 @@ from application.use_cases.users.retrieve import UserRetrieveUseCase
 from application.use_cases.users.update_user import UserUpdateUseCase
 from config.settings import Settings
 from infrastructure.managers.base import StorageManager
-from infrastructure.managers.ChatGPT.route_chatgpt_manager import ChatGPTRouteGenerationManager
+from infrastructure.managers.ChatGPT.catalog import PlacesCatalog
+from infrastructure.managers.ChatGPT.route_chatgpt_manager import AsyncChatGPTRouteGenerationManager
 from infrastructure.managers.jwt_manager import JWTManager
+from infrastructure.managers.local_route_manager import LocalRouteGenerationManager
 from infrastructure.managers.local_storage import LocalStorageManager
+from infrastructure.managers.place_candidates import PlaceCandidateSelector
+from infrastructure.managers.route_optimizer import RouteOrderOptimizer
 from infrastructure.managers.sms_client import SmsClient
 from infrastructure.notifications.notifier import PusherNotifier
 from infrastructure.redis import init_redis_pool
-from infrastructure.redis.base import AbstractRedisCache
+from infrastructure.redis.base import AbstractAsyncRedisCache, AbstractRedisCache
 from infrastructure.redis.redis_cache import RedisCache
 from infrastructure.repositories.alchemy.db import Database
 from infrastructure.tasks import Task
-from infrastructure.tasks.routes import route_generate_gpt_task
+from infrastructure.tasks.routes import route_batch_generate_gpt_task, route_generate_gpt_task
 from infrastructure.uow import SqlAlchemyUnitOfWork, UnitOfWork
 
 
@@ -82,6 +93,14 @@ class ClientsContainer(containers.DeclarativeContainer):
         cache_connection=redis_pool,
     )
 
+    # Клиент redis.asyncio сам по себе awaitable, и провайдер, возвращающий его,
+    # dependency_injector считает асинхронным, поэтому пул создаётся внутри кеша
+    async_redis_cache: providers.Provider[AbstractAsyncRedisCache] = providers.Resource(
+        init_redis_pool.init_async_redis_cache,  # type: ignore
+        host=settings.provided.redis.host,
+        password=settings.provided.redis.password,
+    )
+
     notifier: providers.Provider[PusherNotifier] = providers.Resource(
         PusherNotifier,
         app_id=settings.provided.pusher.app_id,
@@ -92,11 +111,18 @@ class ClientsContainer(containers.DeclarativeContainer):
     )
 
     sms_client: providers.Provider[SmsClient] = providers.Resource(
-        SmsClient, redis_cache=redis_cache, settings=settings.provided.sms
+        SmsClient, redis_cache=async_redis_cache, settings=settings.provided.sms
+    )
+
+    route_generate_gpt_manager: providers.Provider[AsyncChatGPTRouteGenerationManager] = (
+        providers.Singleton(
+            AsyncChatGPTRouteGenerationManager,
+            redis_cache=async_redis_cache,
+        )
     )
 
-    route_generate_gpt_manager: providers.Provider[ChatGPTRouteGenerationManager] = providers.Singleton(
-        ChatGPTRouteGenerationManager,
+    places_catalog: providers.Provider[PlacesCatalog] = providers.Singleton(
+        PlacesCatalog, redis_cache=async_redis_cache
     )
 
 
@@ -114,6 +140,9 @@ class DBContainer(containers.DeclarativeContainer):
 
 class TasksContainer(containers.DeclarativeContainer):
     chatgpt_process_route: providers.Provider[Task] = providers.Singleton(lambda: route_generate_gpt_task)
+    chatgpt_process_routes_batch: providers.Provider[Task] = providers.Singleton(
+        lambda: route_batch_generate_gpt_task
+    )
 
 
 class Container(containers.DeclarativeContainer):
@@ -132,6 +161,16 @@ class Container(containers.DeclarativeContainer):
         settings=settings,
     )
 
+    route_order_optimizer: providers.Provider[RouteOrderOptimizer] = providers.Singleton(
+        RouteOrderOptimizer
+    )
+    place_candidate_selector: providers.Provider[PlaceCandidateSelector] = providers.Singleton(
+        PlaceCandidateSelector
+    )
+    local_route_generator: providers.Provider[LocalRouteGenerationManager] = providers.Singleton(
+        LocalRouteGenerationManager
+    )
+
     tasks = providers.Container(TasksContainer)
 
     ###################
@@ -167,7 +206,7 @@ class Container(containers.DeclarativeContainer):
     verify_sms_code_use_case: providers.Provider[VerifySmsCodeUseCase] = providers.Factory(
         VerifySmsCodeUseCase,
         uow=db.container.uow,
-        redis_client=clients.container.redis_cache,
+        redis_client=clients.container.async_redis_cache,
         jwt_manager=jwt_manager,
     )
 
@@ -175,7 +214,7 @@ class Container(containers.DeclarativeContainer):
         providers.Factory(
             VerifyPhoneChangeSmsCodeUseCase,
             uow=db.container.uow,
-            redis_client=clients.container.redis_cache,
+            redis_client=clients.container.async_redis_cache,
             jwt_manager=jwt_manager,
         )
     )
@@ -218,6 +257,7 @@ class Container(containers.DeclarativeContainer):
     create_place_use_case: providers.Provider[PlaceCreateUseCase] = providers.Factory(
         PlaceCreateUseCase,
         uow=db.container.uow,
+        places_catalog=clients.container.places_catalog,
         storage_manager=storage_manager,
         update_photo_use_case=update_photo_use_case,
         upload_photos_use_case=upload_photos_use_case,
@@ -228,6 +268,11 @@ class Container(containers.DeclarativeContainer):
         uow=db.container.uow,
     )
 
+    search_use_case: providers.Provider[SearchUseCase] = providers.Factory(
+        SearchUseCase,
+        uow=db.container.uow,
+    )
+
     place_avatar_update_use_case: providers.Provider[PlacePhotoUpdateUseCase] = providers.Factory(
         PlacePhotoUpdateUseCase,
         uow=db.container.uow,
@@ -263,14 +308,34 @@ class Container(containers.DeclarativeContainer):
         uow=db.container.uow,
     )
 
+    route_place_optimize_order_use_case: providers.Provider[RoutePlaceOptimizeOrderUseCase] = (
+        providers.Factory(
+            RoutePlaceOptimizeOrderUseCase,
+            uow=db.container.uow,
+            route_order_optimizer=route_order_optimizer,
+        )
+    )
+
     start_route_chatgpt_generate_task: providers.Provider[StartChatGPTRouteGenerateTaskUseCase] = (
         providers.Factory(
             StartChatGPTRouteGenerateTaskUseCase,
             uow=db.container.uow,
-            redis_client=clients.container.redis_cache,
+            redis_client=clients.container.async_redis_cache,
             route_generate_gpt_task=tasks.container.chatgpt_process_route,
+            lock_ttl=settings.provided.chatgpt.generation_lock_ttl,
         )
     )
+    route_generation_job_retrieve_use_case: providers.Provider[RouteGenerationJobRetrieveUseCase] = (
+        providers.Factory(
+            RouteGenerationJobRetrieveUseCase, redis_client=clients.container.async_redis_cache
+        )
+    )
+    start_route_chatgpt_batch_generate_task: providers.Provider[
+        StartChatGPTRouteBatchGenerateTaskUseCase
+    ] = providers.Factory(
+        StartChatGPTRouteBatchGenerateTaskUseCase,
+        route_batch_generate_gpt_task=tasks.container.chatgpt_process_routes_batch,
+    )
 
     copy_route_use_case: providers.Provider[RouteCopyUseCase] = providers.Factory(
         RouteCopyUseCase,
@@ -280,9 +345,31 @@ class Container(containers.DeclarativeContainer):
     route_chatgpt_generate_use_case: providers.Provider[ChatGPTRouteGenerateUseCase] = providers.Factory(
         ChatGPTRouteGenerateUseCase,
         uow=db.container.uow,
-        redis_client=clients.container.redis_cache,
+        redis_client=clients.container.async_redis_cache,
         notifier=clients.container.notifier,
         route_generate_gpt_manager=clients.container.route_generate_gpt_manager,
+        route_order_optimizer=route_order_optimizer,
+        place_candidate_selector=place_candidate_selector,
+        places_catalog=clients.container.places_catalog,
+        local_route_generator=local_route_generator,
+        local_fallback=settings.provided.chatgpt.local_fallback,
+        lock_ttl=settings.provided.chatgpt.generation_lock_ttl,
+    )
+    route_chatgpt_batch_generate_use_case: providers.Provider[ChatGPTRouteBatchGenerateUseCase] = (
+        providers.Factory(
+            ChatGPTRouteBatchGenerateUseCase,
+            uow=db.container.uow,
+            redis_client=clients.container.async_redis_cache,
+            notifier=clients.container.notifier,
+            route_generate_gpt_manager=clients.container.route_generate_gpt_manager,
+            route_order_optimizer=route_order_optimizer,
+            place_candidate_selector=place_candidate_selector,
+            places_catalog=clients.container.places_catalog,
+            local_route_generator=local_route_generator,
+            local_fallback=settings.provided.chatgpt.local_fallback,
+            lock_ttl=settings.provided.chatgpt.generation_lock_ttl,
+            concurrency=settings.provided.chatgpt.batch_concurrency,
+        )
     )
 
     route_avatar_update_use_case: providers.Provider[RoutePhotoUpdateUseCase] = providers.Factory(
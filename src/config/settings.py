@@ -94,6 +94,12 @@ class TaskSettings(BaseSettings):
     app_name: str = "bestway"
     broker_url: str = "redis://localhost:6379/0"
     result_url: str = "redis://localhost:6379/1"
+    # Генерации в основном ждут ответа ChatGPT, поэтому по умолчанию пул потоков
+    # с общим event loop процесса (см. infrastructure.tasks.loop)
+    worker_pool: str = "threads"
+    worker_concurrency: int = 8
+    # Долгие задачи не должны простаивать в буфере воркера, пока он занят
+    worker_prefetch_multiplier: int = 1
 
     # broker_url: str = "redis://redis:6379/0"
     # result_url: str = "redis://redis:6379/1"
@@ -132,9 +138,23 @@ class ChatGPTSettings(BaseSettings):
     api_key: str = "secret"
     model: str = "gpt-5"
     max_responses_per_day: int = 25
+    max_responses_per_user_per_day: int = 0  # 0 - без ограничения
     request_delay: int = 1  # в секундах
     max_request_retries: int = 3
     chatgpt_request_timeout: int = 600
+    max_connections: int = 20  # размер пула соединений асинхронного клиента
+    requests_per_minute: int = 60  # лимит аккаунта OpenAI (RPM) на все воркеры, 0 - без ограничения
+    requests_burst: int = 5  # сколько запросов можно отправить подряд без ожидания
+    hedge_delay: float = 60  # через сколько секунд без ответа (p95) отправить дублирующий запрос
+    hedge_max_requests: int = 2  # всего одновременных запросов с учётом дублирующих
+    breaker_failure_threshold: int = 3  # подряд идущих сбоев до размыкания
+    breaker_reset_timeout: int = 120  # в секундах
+    result_cache_ttl: int = 6 * 60 * 60  # кеш результатов генерации по анкете, в секундах
+    local_fallback: bool = True  # генерировать локально, если ChatGPT недоступен или квота исчерпана
+    batch_concurrency: int = 4  # одновременных запросов при пакетной генерации
+    # Блокировка генерации пользователя, в секундах; покрывает ожидание в очереди,
+    # пока задача выполняется, продлевается каждые generation_lock_ttl / 3 секунд
+    generation_lock_ttl: int = 120
 
 
 class Settings(BaseSettings):
@@ -143,6 +143,12 @@ class ModelType(Enum):
 
 class SurveyStatus(Enum):
     DRAFT = "Черновик"
+    QUEUED = "Генерация в очереди"
     GENERATING = "Генерация в процессе"
     GENERATED_SUCCESS = "Генерация завершена успешно"
     GENERATED_ERROR = "Генерация завершена с ошибкой"
+
+
+class PaginationType(Enum):
+    OFFSET = "offset"
+    CURSOR = "cursor"
@@ -25,6 +25,7 @@ class Route(Entity):
         distance: Optional[int] = None,
         is_custom: Optional[bool] = False,
         json_data: Optional[dict] = None,
+        yandex_maps_url: Optional[str] = None,
         places: Optional[List[RoutePlaces]] = None,
         photos: Optional[List[Photo]] = None,
     ) -> None:
@@ -44,6 +45,7 @@ class Route(Entity):
         self.is_custom = is_custom
         self.is_publicated = is_publicated
         self.json_data = json_data
+        self.yandex_maps_url = yandex_maps_url
 
         self.places = places or []
         self.photos = photos or []
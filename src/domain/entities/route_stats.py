@@ -0,0 +1,22 @@
+from typing import Optional
+
+from domain.entities.entity import Entity
+
+
+class RouteStats(Entity):
+    def __init__(
+        self,
+        id: Optional[int] = None,
+        route_id: Optional[int] = None,
+        place_count: int = 0,
+        photo_count: int = 0,
+        like_count: int = 0,
+        comment_count: int = 0,
+    ) -> None:
+        super().__init__(id)
+
+        self.route_id = route_id
+        self.place_count = place_count
+        self.photo_count = photo_count
+        self.like_count = like_count
+        self.comment_count = comment_count
@@ -7,9 +7,10 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
-    count: int  # Общее количество элементов
+    count: Optional[int]  # Общее количество элементов (None в режиме курсора)
     page: int  # Текущая страница
     page_size: int  # Элементов на страницу
-    total_pages: int  # Общее количество страниц
+    total_pages: Optional[int]  # Общее количество страниц (None в режиме курсора)
     next: Optional[str] = None
     previous: Optional[str] = None
+    next_cursor: Optional[str] = None  # Курсор следующей страницы (только в режиме курсора)
@@ -1,19 +1,29 @@
+import asyncio
 import datetime
+import hashlib
 import json
 import logging
 from time import sleep
-from typing import Any
+from typing import Any, Optional
 
 import httpx
 
 from openai import OpenAI
 
-from common.exceptions import APIException, ResponsesLimitExceededException
+from application.constants import TIME_ZONE
+from common.exceptions import APIException, ResponsesLimitExceededException, ServiceUnavailableException
 from config.settings import Settings
+from infrastructure.managers.ChatGPT.circuit_breaker import CircuitBreaker
 from infrastructure.managers.ChatGPT.dto import ChatGPTContentData
-from infrastructure.managers.ChatGPT.utils import retry_on_status_code
-from infrastructure.managers.proxy_client import ProxyClient
-from infrastructure.repositories.interfaces.ChatGPT.base import ClassificationManager
+from infrastructure.managers.ChatGPT.rate_limiter import RateLimiter
+from infrastructure.managers.ChatGPT.utils import (
+    async_retry_on_status_code,
+    parse_partial_places,
+    retry_on_status_code,
+)
+from infrastructure.managers.proxy_client import AsyncProxyClient, ProxyClient
+from infrastructure.redis.base import AbstractAsyncRedisCache, AbstractRedisCache
+from infrastructure.repositories.interfaces.ChatGPT.base import ClassificationManager, ProgressCallback
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +35,20 @@ class BaseClassificationManager(ClassificationManager):
       - Работа с proxy_client
       - Общие методы _send_request (если нужно) и т.д.
 
-    Лимиты и счётчики по дневным ограничениям.
+    Дневные лимиты ответов считаются в Redis и общие для всех процессов и воркеров.
     """
 
     settings = Settings()
 
     CHATGPT_MODEL = settings.chatgpt.model
+    CHATGPT_SERVICE_URL = settings.chatgpt.service_url
     CHATGPT_REQUEST_DELAY = settings.chatgpt.request_delay
     CHATGPT_MAX_REQUEST_RETRIES = settings.chatgpt.max_request_retries
     MAX_RESPONSES_PER_DAY = settings.chatgpt.max_responses_per_day
+    MAX_RESPONSES_PER_USER_PER_DAY = settings.chatgpt.max_responses_per_user_per_day
 
-    def __init__(self):
+    def __init__(self, redis_cache: AbstractRedisCache):
+        self.redis_cache = redis_cache
 
         self.proxy_client = ProxyClient(
             proxy_host=self.settings.proxy.host,
@@ -47,58 +60,74 @@ class BaseClassificationManager(ClassificationManager):
             api_key=self.settings.chatgpt.api_key, http_client=self.proxy_client.client
         )
 
-        self.responses_count = 0
-        self.last_response_date = None
+        self.input_tokens_count = 0
+        self.cached_tokens_count = 0
 
-    def _check_daily_limit(self):
+    @staticmethod
+    def _quota_day() -> str:
+        return datetime.datetime.now(TIME_ZONE).date().isoformat()
+
+    def _reserve_response(self, user_id: int | None = None) -> str:
         """
-        Проверяем, не превышен ли дневной лимит запросов (у наследника).
+        Атомарно занимает один ответ из общей и пользовательской дневной квоты.
+        Возвращает день квоты, чтобы при ошибке запроса вернуть ответ в тот же день.
         """
-        self._reset_counter_if_new_day()
-        if self.responses_count >= self.MAX_RESPONSES_PER_DAY:
-            raise ResponsesLimitExceededException()
+        day = self._quota_day()
+        reserved = self.redis_cache.reserve_chatgpt_response(
+            day, user_id, self.MAX_RESPONSES_PER_DAY, self.MAX_RESPONSES_PER_USER_PER_DAY
+        )
+        if not reserved:
+            self._raise_responses_limit_exceeded(day, user_id)
+        return day
 
-    def _increment_response(self):
-        """Увеличиваем счётчик обращений на 1."""
-        self.responses_count += 1
-        logger.info(f"Requests done: {self.responses_count}")
+    def _release_response(self, day: str, user_id: int | None = None) -> None:
+        self.redis_cache.release_chatgpt_response(day, user_id)
 
-    def _reset_counter_if_new_day(self):
-        """
-        Обнуляем счётчик, если наступил новый день
-        (каждый наследник делает это для своего счётчика).
-        """
-        current_date = datetime.date.today()
-        if self.last_response_date != current_date:
-            self.responses_count = 0
-            self.last_response_date = current_date
-
-    def is_max_responses_reached(self):
-        self._reset_counter_if_new_day()
-        return not self.responses_count < self.MAX_RESPONSES_PER_DAY
-
-    def _check_response_availability(self):
-        logger.info(f"Current response count from ChatGPT: {self.responses_count}.")
-        if self.is_max_responses_reached():
-            logger.info(
-                f"Response count from ChatGPT ({self.responses_count}) "
-                f"equal to daily limit ({self.MAX_RESPONSES_PER_DAY}), "
-                f"try increase limits."
-            )
-            raise ResponsesLimitExceededException()
+    def _raise_responses_limit_exceeded(self, day: str, user_id: int | None) -> None:
+        logger.info(
+            f"Daily ChatGPT responses limit reached (day: {day}, user: {user_id}), "
+            f"limits: {self.MAX_RESPONSES_PER_DAY} total, "
+            f"{self.MAX_RESPONSES_PER_USER_PER_DAY} per user."
+        )
+        raise ResponsesLimitExceededException()
 
     def _create_request_payload(self, content: ChatGPTContentData, system_prompt: str) -> dict:
         """
         Формирует JSON-параметры (payload), которые будем отправлять в ChatGPT.
+        Сообщения идут от неизменной части к изменяемой: системный промпт, каталог города, анкета.
+        Так префикс запроса совпадает побайтно и кешируется на стороне OpenAI.
         """
+        messages = [{"role": "system", "content": system_prompt}]
+        payload = {"model": self.CHATGPT_MODEL}
+
+        static_prompt = content.static_prompt()
+        if static_prompt is not None:
+            messages.append({"role": "user", "content": static_prompt})
+            # Запросы с одинаковым префиксом направляются на один и тот же кеш
+            prefix = f"{system_prompt}{static_prompt}".encode()
+            payload["prompt_cache_key"] = hashlib.sha256(prefix).hexdigest()[:32]
+
+        messages.append({"role": "user", "content": content.to_prompt()})
+        payload.update(input=messages, max_output_tokens=60000, truncation="auto")
+        return payload
+
+    def _record_usage(self, usage: dict[str, Any]) -> None:
+        """Учёт входных токенов и попаданий в кеш префикса"""
+        input_tokens = usage.get("input_tokens") or 0
+        cached_tokens = (usage.get("input_tokens_details") or {}).get("cached_tokens") or 0
+        self.input_tokens_count += input_tokens
+        self.cached_tokens_count += cached_tokens
+
+        total_rate = self.cached_tokens_count / self.input_tokens_count if self.input_tokens_count else 0
+        logger.info(
+            f"OpenAI usage: input_tokens={input_tokens}, cached_tokens={cached_tokens}, "
+            f"output_tokens={usage.get('output_tokens') or 0}, cache hit rate total={total_rate:.1%}"
+        )
+
+    def _create_request_headers(self) -> dict[str, str]:
         return {
-            "model": self.CHATGPT_MODEL,
-            "input": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": content.model_dump_json()},
-            ],
-            "max_output_tokens": 60000,
-            "truncation": "auto",
+            "Authorization": f"Bearer {self.settings.chatgpt.api_key}",
+            "Content-Type": "application/json",
         }
 
     def _parse_chatgpt_response(self, response: httpx.Response) -> dict[str, Any]:
@@ -106,10 +135,16 @@ class BaseClassificationManager(ClassificationManager):
         Парсит ответ Responses API.
         Ожидаем JSON-строку в output_text (или в output[].content[].text).
         """
-        logger.info(f"Received response from OpenAI API: {response.json()}")
-
+        # Сначала статус: у 5xx от прокси или OpenAI тело может быть HTML или пустым
         response.raise_for_status()
+
         data = response.json()
+        logger.info(f"Received response from OpenAI API: {data}")
+        return self._parse_response_data(data)
+
+    def _parse_response_data(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Достаёт JSON модели из объекта response Responses API"""
+        self._record_usage(data.get("usage") or {})
 
         response_content: str | None = data.get("output_text")
 
@@ -136,19 +171,15 @@ class BaseClassificationManager(ClassificationManager):
         """
         Делает запрос в OpenAI. Возвращает dict (распарсенный JSON, который вернула модель).
         """
-        self._check_response_availability()
         sleep(self.CHATGPT_REQUEST_DELAY)
 
         payload = self._create_request_payload(content, system_prompt)
 
         try:
             response = self.proxy_client.post(
-                "https://api.openai.com/v1/responses",
+                self.CHATGPT_SERVICE_URL,
                 json=payload,
-                headers={
-                    "Authorization": f"Bearer {self.settings.chatgpt.api_key}",
-                    "Content-Type": "application/json",
-                },
+                headers=self._create_request_headers(),
             )
 
             if response.status_code >= 400:
@@ -165,3 +196,209 @@ class BaseClassificationManager(ClassificationManager):
         except Exception as ex:
             logger.error(f"Error while sending the request to OpenAI: {str(ex)}")
             raise
+
+
+class AsyncBaseClassificationManager(BaseClassificationManager):
+    """
+    Асинхронный вариант базового менеджера:
+      - пул соединений httpx.AsyncClient через прокси
+      - паузы и повторы через asyncio.sleep, event loop не блокируется
+      - хеджирование: если ответа нет дольше hedge_delay, отправляется дублирующий запрос,
+        используется первый валидный ответ
+      - размыкатель цепи: при недоступности прокси или OpenAI запросы сразу отклоняются
+      - квота ответов и лимит частоты считаются через redis.asyncio
+
+    Позволяет выполнять несколько генераций одновременно в одном процессе.
+    """
+
+    HEDGE_DELAY = BaseClassificationManager.settings.chatgpt.hedge_delay
+    HEDGE_MAX_REQUESTS = BaseClassificationManager.settings.chatgpt.hedge_max_requests
+
+    def __init__(self, redis_cache: AbstractAsyncRedisCache):
+        self.redis_cache = redis_cache
+        self.proxy_client = AsyncProxyClient(
+            proxy_host=self.settings.proxy.host,
+            proxy_http_port=self.settings.proxy.http_port,
+            proxy_username=self.settings.proxy.username,
+            proxy_password=self.settings.proxy.password,
+            max_connections=self.settings.chatgpt.max_connections,
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=self.settings.chatgpt.breaker_failure_threshold,
+            reset_timeout=self.settings.chatgpt.breaker_reset_timeout,
+        )
+        self.rate_limiter = RateLimiter(
+            redis_cache,
+            name="openai",
+            requests_per_minute=self.settings.chatgpt.requests_per_minute,
+            capacity=self.settings.chatgpt.requests_burst,
+        )
+
+        self.input_tokens_count = 0
+        self.cached_tokens_count = 0
+
+    async def aclose(self) -> None:
+        await self.proxy_client.aclose()
+
+    async def _reserve_response(self, user_id: int | None = None) -> str:  # type: ignore[override]
+        day = self._quota_day()
+        reserved = await self.redis_cache.reserve_chatgpt_response(
+            day, user_id, self.MAX_RESPONSES_PER_DAY, self.MAX_RESPONSES_PER_USER_PER_DAY
+        )
+        if not reserved:
+            self._raise_responses_limit_exceeded(day, user_id)
+        return day
+
+    async def _release_response(  # type: ignore[override]
+        self, day: str, user_id: int | None = None
+    ) -> None:
+        await self.redis_cache.release_chatgpt_response(day, user_id)
+
+    @async_retry_on_status_code(
+        code=429,
+        max_retries=BaseClassificationManager.CHATGPT_MAX_REQUEST_RETRIES,
+        delay=BaseClassificationManager.CHATGPT_REQUEST_DELAY,
+    )
+    async def _send_request(
+        self, content, system_prompt: str, on_progress: Optional[ProgressCallback] = None
+    ) -> dict[str, Any]:
+        """
+        Делает запрос в OpenAI. Возвращает dict (распарсенный JSON, который вернула модель).
+        С on_progress ответ читается потоком, и выбранные моделью места сообщаются по мере появления.
+        """
+        probe = self.circuit_breaker.check()
+        try:
+            await asyncio.sleep(self.CHATGPT_REQUEST_DELAY)
+
+            payload = self._create_request_payload(content, system_prompt)
+
+            try:
+                result = await self._send_hedged(payload, on_progress)
+            except Exception as ex:
+                logger.error(f"Error while sending the request to OpenAI: {str(ex)}")
+                if self._is_unhealthy(ex):
+                    self.circuit_breaker.record_failure()
+                    raise ServiceUnavailableException() from ex
+                # OpenAI ответил (429, другой 4xx, некорректный ответ) - сервис доступен
+                self.circuit_breaker.record_success()
+                raise
+
+            self.circuit_breaker.record_success()
+            return result
+        finally:
+            if probe:
+                self.circuit_breaker.end_probe()
+
+    async def _send_hedged(
+        self, payload: dict, on_progress: Optional[ProgressCallback] = None
+    ) -> dict[str, Any]:
+        """
+        Первый запрос отправляется сразу, каждый следующий - если за HEDGE_DELAY секунд
+        не пришло ни одного валидного ответа. Остальные запросы отменяются после первого успеха.
+        Прогресс сообщает только первый запрос, чтобы события не дублировались.
+        Потоковый ответ, который уже начал приходить, не дублируется: долгая генерация
+        с идущими событиями не считается зависшей.
+        """
+        pending: set[asyncio.Task] = set()
+        error: Exception | None = None
+        stream_started = asyncio.Event()
+
+        def can_hedge() -> bool:
+            # После ошибки дублирующие запросы больше не отправляются, ждём уже отправленные
+            return len(pending) < self.HEDGE_MAX_REQUESTS and error is None and not stream_started.is_set()
+
+        try:
+            while True:
+                if can_hedge():
+                    if pending:
+                        logger.warning(f"No OpenAI response in {self.HEDGE_DELAY} s, hedging the request")
+                        pending.add(asyncio.create_task(self._post(payload)))
+                    else:
+                        pending.add(asyncio.create_task(self._post(payload, on_progress, stream_started)))
+
+                timeout = self.HEDGE_DELAY if can_hedge() else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+
+                if error is not None and not pending:
+                    raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _post(
+        self,
+        payload: dict,
+        on_progress: Optional[ProgressCallback] = None,
+        stream_started: Optional[asyncio.Event] = None,
+    ) -> dict[str, Any]:
+        # Лимит общий для всех процессов, учитываются и повторы, и дублирующие запросы
+        await self.rate_limiter.acquire()
+        if on_progress is not None:
+            return await self._post_streaming(payload, on_progress, stream_started)
+
+        response = await self.proxy_client.post(
+            self.CHATGPT_SERVICE_URL,
+            json=payload,
+            headers=self._create_request_headers(),
+        )
+
+        if response.status_code >= 400:
+            logger.error("OpenAI error %s: %s", response.status_code, response.text)
+
+        return self._parse_chatgpt_response(response)
+
+    async def _post_streaming(
+        self, payload: dict, on_progress: ProgressCallback, stream_started: Optional[asyncio.Event] = None
+    ) -> dict[str, Any]:
+        """
+        Потоковый запрос: текст ответа собирается из событий response.output_text.delta,
+        при каждом новом месте в массиве places вызывается on_progress.
+        Итоговый ответ разбирается из события response.completed.
+        stream_started выставляется на первом событии потока.
+        """
+        text = ""
+        reported: list[int] = []
+        async with self.proxy_client.stream(
+            self.CHATGPT_SERVICE_URL,
+            json={**payload, "stream": True},
+            headers=self._create_request_headers(),
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                logger.error("OpenAI error %s: %s", response.status_code, response.text)
+                response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data:") or not line[5:].strip().startswith("{"):
+                    continue
+                event = json.loads(line[5:])
+                event_type = event.get("type")
+                if stream_started is not None:
+                    stream_started.set()
+
+                if event_type == "response.output_text.delta":
+                    text += event.get("delta") or ""
+                    places = parse_partial_places(text)
+                    if len(places) > len(reported):
+                        reported = places
+                        await on_progress(places)
+                elif event_type == "response.completed":
+                    return self._parse_response_data(event["response"])
+                elif event_type in ("response.failed", "response.incomplete", "error"):
+                    raise APIException(code=502, message=f"OpenAI stream failed: {event}")
+
+        raise APIException(code=502, message="OpenAI stream ended without response.completed")
+
+    @staticmethod
+    def _is_unhealthy(ex: Exception) -> bool:
+        """Сбой прокси или OpenAI, а не ошибка конкретного запроса"""
+        if isinstance(ex, httpx.HTTPStatusError):
+            return ex.response.status_code >= 500
+        return isinstance(ex, httpx.TransportError)
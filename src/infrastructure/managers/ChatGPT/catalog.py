@@ -0,0 +1,68 @@
+import json
+import logging
+from typing import Iterable, Optional
+
+from domain.entities.place import Place
+from infrastructure.redis.base import AbstractAsyncRedisCache
+
+logger = logging.getLogger(__name__)
+
+# 4 знака после запятой - точность около 11 м, этого достаточно для построения маршрута
+COORDINATES_PRECISION = 4
+
+
+class PlacesCatalog:
+    """
+    Компактный каталог мест для промптов ChatGPT.
+    Для каждого города один раз собирается JSON-массив мест с короткими ключами в порядке id
+    и хранится в памяти процесса. Пока версия не изменилась, текст каталога побайтно одинаков,
+    поэтому он подходит для кеширования префикса промпта на стороне OpenAI.
+    Версия каталога лежит в Redis и увеличивается при создании, изменении и удалении мест,
+    поэтому все процессы (API и воркеры) видят устаревание кеша.
+    Версия читается и увеличивается через redis.asyncio, чтобы не блокировать event loop.
+    """
+
+    def __init__(self, redis_cache: AbstractAsyncRedisCache):
+        self._redis_cache = redis_cache
+        self._cities: dict[str, tuple[int, str]] = {}
+
+    async def version(self) -> int:
+        return await self._redis_cache.get_places_catalog_version()
+
+    async def invalidate(self) -> None:
+        version = await self._redis_cache.bump_places_catalog_version()
+        logger.info(f"Places catalog version bumped to {version}")
+
+    def get(self, city: str, version: int) -> Optional[str]:
+        """Каталог города, если он собран для этой версии"""
+        cached = self._cities.get(city)
+        if cached and cached[0] == version:
+            return cached[1]
+        return None
+
+    def put(self, city: str, version: int, places: Iterable[Place]) -> str:
+        lines = [self.compact(place) for place in sorted(places, key=lambda place: place.id)]
+        catalog = "[" + ",".join(lines) + "]"
+        self._cities[city] = (version, catalog)
+        logger.info(f"Places catalog for {city} rebuilt: version {version}, {len(lines)} places")
+        return catalog
+
+    @staticmethod
+    def compact(place: Place) -> str:
+        """
+        Короткие ключи: i - id, n - название, c - категория, t - тип,
+        g - теги, p - [широта, долгота], m - название на карте. Пустые поля не передаются.
+        """
+        coordinates = place.coordinates[:2] if place.coordinates else []
+        data = {
+            "i": place.id,
+            "n": place.name,
+            "c": getattr(place.category, "value", place.category),
+            "t": getattr(place.type, "value", place.type),
+            "g": place.tags,
+            "p": [round(float(value), COORDINATES_PRECISION) for value in coordinates],
+            "m": place.map_name if place.map_name != place.name else None,
+        }
+        return json.dumps(
+            {key: value for key, value in data.items() if value}, ensure_ascii=False, separators=(",", ":")
+        )
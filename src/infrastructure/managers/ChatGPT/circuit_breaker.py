@@ -0,0 +1,68 @@
+import logging
+import time
+from typing import Optional
+
+from common.exceptions import ServiceUnavailableException
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Размыкатель цепи для запросов к OpenAI через прокси.
+      - closed: запросы идут, подряд идущие сбои считаются
+      - open: после failure_threshold сбоев запросы сразу отклоняются reset_timeout секунд
+      - half-open: по истечении reset_timeout пропускается один пробный запрос;
+        после него вызывается end_probe, чем бы он ни закончился
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def check(self) -> bool:
+        """
+        Бросает ServiceUnavailableException, если цепь разомкнута.
+        Возвращает True, если запрос пропущен как пробный.
+        """
+        if self.opened_at is None:
+            return False
+
+        if self._probing or time.monotonic() - self.opened_at < self.reset_timeout:
+            raise ServiceUnavailableException()
+
+        logger.info("Circuit breaker is half-open, sending a probe request to OpenAI")
+        self._probing = True
+        return True
+
+    def end_probe(self) -> None:
+        """
+        Пробный запрос завершён. Если он не закрыл и не разомкнул цепь заново
+        (например, был отменён), следующий запрос после reset_timeout снова станет пробным.
+        """
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            logger.info("Circuit breaker closed, OpenAI is available again")
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            logger.warning(
+                f"Circuit breaker opened after {self.failures} failures, "
+                f"requests to OpenAI are rejected for {self.reset_timeout} seconds"
+            )
+            self.opened_at = time.monotonic()
@@ -6,29 +6,34 @@ FULL_MODE_PROMPT = """
     - Важен ли порядок посещения мест
     - Предпочтительные типы локаций
 
-    Также будет передан список мест в следующем формате:
+    Первым сообщением передаётся каталог мест города: поле places_data в компактном формате
+    (пустые поля опускаются):
     [
         {
-            "id": <целое число>,  # уникальный идентификатор места
-            "name": "<название места>",
-            "latitude": <широта>,
-            "longitude": <долгота>,
-            "category": "<категория>",
-            "type": "<подкатегория>"
+            "i": <целое число>,  # уникальный идентификатор места
+            "n": "<название места>",
+            "c": "<категория>",
+            "t": "<подкатегория>",
+            "g": "<теги>",
+            "p": [<широта>, <долгота>],
+            "m": "<название на карте>"
         },
         ...
     ]
 
+    Вторым сообщением передаётся анкета и поле candidate_ids — ID мест из каталога, заранее отобранных
+    под анкету. Выбирай места в первую очередь из candidate_ids, остальные места каталога бери,
+    только если среди кандидатов нет подходящих.
+
     Используя анкету и список мест, необходимо:
     1. Проанализировать содержимое поля prompt из теля запроса и по нему сформировать маршрут.
     2. Проанализировать предпочтения пользователя и учитывать их при подборе мест.
-    3. Упорядочить их логически (например по географической близости) с учётом типа маршрута и предпочтений
-       (если в промпте не указан конкретный порядок).
+    3. Порядок посещения по географической близости рассчитывается на сервере, его подбирать не нужно.
+       Если в промпте явно указан порядок посещения — верни места в этом порядке и укажи "keep_order": true.
     4. Построить удобный и выверенный маршрут из выбранных тобой мест, количество мест выбирай сам исходя из запроса
        пользователя, если оно явно указано, или выбери его из сути запроса.
 
     Обязательно:
-    - Учитывай координаты мест при определении порядка
     - Учитывай тип маршрута и предпочтения
     - Не добавляй никакого текста, комментариев или объяснений
     - Верни только JSON в следующем строго определённом формате
@@ -43,8 +48,9 @@ FULL_MODE_PROMPT = """
                     'На машине',
                     'Смешанный'>",  # Тип маршрута, строка
         "places": [
-            <Список целых чисел — ID мест, упорядоченных по порядку их посещения>
-        ]
+            <Список целых чисел — ID мест; первым укажи место, с которого маршрут должен начинаться>
+        ],
+        "keep_order": <true, если порядок мест задан пользователем явно, иначе false>
     }
 """
 
@@ -66,16 +72,18 @@ PARTIAL_MODE_PROMPT = """
             - type: подкатегория места (например: Итальянский, Исторический)
             - description: дополнительное текстовое требование или пожелание к месту
 
-    Также будет передан список всех доступных мест в следующем формате:
+    Первым сообщением передаётся каталог мест города: поле places_data в компактном формате
+    (пустые поля опускаются). Вместе с анкетой передаётся candidate_ids — ID мест, заранее
+    отобранных под анкету; выбирай в первую очередь из них:
     [
         {
-            "id": <целое число>,  # уникальный идентификатор места
-            "name": "<название места>",
-            "latitude": <широта>,
-            "longitude": <долгота>,
-            "category": "<категория>",
-            "type": "<тип: START, MIDDLE, FINISH и т.д.>",
-            "description": "<описание места>"
+            "i": <целое число>,  # уникальный идентификатор места, его нужно возвращать в places
+            "n": "<название места>",
+            "c": "<категория>",
+            "t": "<подкатегория>",
+            "g": "<теги>",
+            "p": [<широта>, <долгота>],
+            "m": "<название на карте>"
         },
         ...
     ]
@@ -89,7 +97,8 @@ PARTIAL_MODE_PROMPT = """
     На основе этих данных необходимо:
     1. Проанализировать анкету и предпочтения пользователя.
     2. Выбрать оптимальные места согласно правилам выше.
-    3. Упорядочить их логически, используя координаты, чтобы построить логичный маршрут.
+    3. Порядок по географической близости рассчитывается на сервере. Если анкета явно задаёт порядок
+       посещения — сохрани его и укажи "keep_order": true.
     4. Вернуть результат строго в следующем JSON-формате.
 
     Важно:
@@ -106,7 +115,8 @@ PARTIAL_MODE_PROMPT = """
                     'На машине',
                     'Смешанный'>",
         "places": [
-            <Список ID мест из переданных в теле запроса, упорядоченных по порядку посещения>
-        ]
+            <Список ID мест из переданных в теле запроса; первым укажи место начала маршрута>
+        ],
+        "keep_order": <true, если порядок мест задан пользователем явно, иначе false>
     }
 """
@@ -1,7 +1,9 @@
+import hashlib
+import json
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 from domain.entities.enums import CityCategory, Gender, PlaceCategory, PlaceType, RouteType
 
@@ -31,17 +33,56 @@ class ChatGPTSurveyData(BaseModel):
     places: Optional[dict] = None
     city: Optional[CityCategory] = CityCategory.PERM
 
+    def fingerprint(self, *parts: Any) -> str:
+        """
+        Хеш нормализованной анкеты для кеша результатов генерации:
+        пустые значения отбрасываются, строки - в нижнем регистре без лишних пробелов.
+        """
+        normalized = [_normalize(self.model_dump(mode="json")), *parts]
+        raw = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.lower().split()) or None
+    if isinstance(value, dict):
+        items = ((key, _normalize(item)) for key, item in value.items())
+        return {key: item for key, item in items if item not in (None, [], {})} or None
+    if isinstance(value, list):
+        return [_normalize(item) for item in value] or None
+    return value
+
 
 class ChatGPTContentData(BaseModel):
     user_data: ChatGPTUserData
     survey_data: ChatGPTSurveyData
     places_data: List[ChatGPTPlaceData]
+    # Компактный каталог мест города (JSON-массив), заменяет places_data в промпте
+    places_catalog: Optional[str] = Field(default=None, exclude=True)
+    # Места, отобранные по анкете
+    candidate_ids: List[int] = Field(default_factory=list, exclude=True)
+    catalog_version: Optional[int] = Field(default=None, exclude=True)
+
+    def static_prompt(self) -> Optional[str]:
+        """Неизменная между запросами часть: каталог города"""
+        if self.places_catalog is None:
+            return None
+        return f'{{"places_data":{self.places_catalog}}}'
+
+    def to_prompt(self) -> str:
+        """Часть промпта конкретного пользователя: анкета и кандидаты"""
+        if self.places_catalog is None:
+            return self.model_dump_json()
+        head = self.model_dump_json(exclude={"places_data"}, exclude_none=True)
+        return f'{head[:-1]},"candidate_ids":{json.dumps(self.candidate_ids, separators=(",", ":"))}}}'
 
 
 class ChatGPTRouteData(BaseModel):
     name: Optional[str] = "Сгенерированный маршрут"
     type: RouteType
     places: List[int]
+    keep_order: bool = False
     author_id: int
 
 
@@ -0,0 +1,35 @@
+import asyncio
+import logging
+
+from infrastructure.redis.base import AbstractAsyncRedisCache
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Ограничение частоты запросов, общее для всех процессов (token bucket в Redis).
+    Ведро на capacity запросов пополняется со скоростью requests_per_minute,
+    запрос без свободного токена ждёт его появления, не блокируя event loop.
+    """
+
+    def __init__(
+        self, redis_cache: AbstractAsyncRedisCache, name: str, requests_per_minute: int, capacity: int
+    ) -> None:
+        self._redis_cache = redis_cache
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.capacity = max(capacity, 1)
+
+    async def acquire(self) -> None:
+        if self.requests_per_minute <= 0:
+            return
+
+        while True:
+            wait = await self._redis_cache.take_rate_limit_token(
+                self.name, self.requests_per_minute / 60, self.capacity
+            )
+            if wait <= 0:
+                return
+            logger.info(f"Rate limit of {self.name} reached, waiting {wait:.1f} s")
+            await asyncio.sleep(wait)
@@ -1,11 +1,14 @@
 import logging
+from typing import Optional
 
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
 from config.settings import Settings
 from infrastructure.managers.ChatGPT.constants import FULL_MODE_PROMPT, PARTIAL_MODE_PROMPT
 from infrastructure.managers.ChatGPT.dto import ChatGPTContentData
+from infrastructure.redis.base import AbstractAsyncRedisCache, AbstractRedisCache
+from infrastructure.repositories.interfaces.ChatGPT.base import ProgressCallback
 
-from .base import BaseClassificationManager
+from .base import AsyncBaseClassificationManager, BaseClassificationManager
 
 logger = logging.getLogger(__name__)
 
@@ -20,19 +23,23 @@ class ChatGPTRouteGenerationManager(BaseClassificationManager):
 
     MAX_RESPONSES_PER_DAY = settings.chatgpt.max_responses_per_day or 300
 
-    def __init__(self, serializer=None):
-        super().__init__()
+    def __init__(self, redis_cache: AbstractRedisCache, serializer=None):
+        super().__init__(redis_cache)
         self.serializer = serializer
 
-    def generate_route(self, content: ChatGPTContentData, mode: Mode = Mode.FULL) -> dict:
-        logger.info("_check_response_availability")
-        self._check_response_availability()
+    def generate_route(
+        self, content: ChatGPTContentData, mode: Mode = Mode.FULL, user_id: int | None = None
+    ) -> dict:
+        quota_day = self._reserve_response(user_id)
 
         PROMPT: str = self._choose_prompt(mode)
         logger.info(f"_send_response to ChatGPT with prompt: {PROMPT}")
-        logger.info(f"ChatGPT request body: {content.model_dump_json()}")
-        response = self._send_request(content, PROMPT)
-        self._increment_response()
+        logger.info(f"ChatGPT request with {len(content.places_data)} places")
+        try:
+            response = self._send_request(content, PROMPT)
+        except Exception:
+            self._release_response(quota_day, user_id)
+            raise
         if self.serializer:
             return self.serializer(**response)
 
@@ -45,3 +52,40 @@ class ChatGPTRouteGenerationManager(BaseClassificationManager):
             return FULL_MODE_PROMPT
         else:
             return PARTIAL_MODE_PROMPT
+
+
+class AsyncChatGPTRouteGenerationManager(AsyncBaseClassificationManager):
+    """
+    Асинхронный вариант ChatGPTRouteGenerationManager:
+    запрос к ChatGPT не блокирует event loop.
+    """
+
+    settings = Settings()
+
+    MAX_RESPONSES_PER_DAY = settings.chatgpt.max_responses_per_day or 300
+
+    def __init__(self, redis_cache: AbstractAsyncRedisCache, serializer=None):
+        super().__init__(redis_cache)
+        self.serializer = serializer
+
+    async def generate_route(
+        self,
+        content: ChatGPTContentData,
+        mode: Mode = Mode.FULL,
+        user_id: int | None = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        quota_day = await self._reserve_response(user_id)
+
+        PROMPT: str = ChatGPTRouteGenerationManager._choose_prompt(mode)
+        logger.info(f"ChatGPT request with {len(content.places_data)} places")
+        try:
+            response = await self._send_request(content, PROMPT, on_progress)
+        except Exception:
+            await self._release_response(quota_day, user_id)
+            raise
+        if self.serializer:
+            return self.serializer(**response)
+
+        logger.info(f"ChatGPT responded with a response: {response}")
+        return response
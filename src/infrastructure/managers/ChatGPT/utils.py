@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import re
 from functools import wraps
 from time import sleep
 
@@ -33,3 +35,47 @@ def retry_on_status_code(code: int, max_retries=3, delay=5):
         return wrapper
 
     return decorator
+
+
+def async_retry_on_status_code(code: int, max_retries=3, delay=5, backoff=2):
+    """Асинхронный вариант retry_on_status_code: пауза через asyncio.sleep с экспоненциальным ростом"""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            retries = 0
+            while retries < max_retries:
+                try:
+                    return await func(*args, **kwargs)
+                except httpx.HTTPStatusError as ex:
+                    if ex.response.status_code != code:
+                        raise
+                    pause = delay * backoff**retries
+                    logger.warning(
+                        f"Received {code} response. "
+                        f"Retrying {retries + 1}/{max_retries} in {pause} seconds..."
+                    )
+                    retries += 1
+                    await asyncio.sleep(pause)
+            raise Exception("Max retries exceeded.")
+
+        return wrapper
+
+    return decorator
+
+
+PLACES_ARRAY_PATTERN = re.compile(r'"places"\s*:\s*\[([^\]]*)')
+PLACE_ID_PATTERN = re.compile(r"(\d+)\s*(?=[,\]])")
+
+
+def parse_partial_places(text: str) -> list[int]:
+    """
+    ID мест из незаконченного JSON-ответа модели.
+    Берутся только числа, за которыми уже пришла запятая или закрывающая скобка.
+    """
+    match = PLACES_ARRAY_PATTERN.search(text)
+    if not match:
+        return []
+    # Закрывающая скобка массива не входит в группу, поэтому дописываем её, если массив уже закрыт
+    items = match.group(1) + ("]" if text[match.end(1) : match.end(1) + 1] == "]" else "")
+    return [int(value) for value in PLACE_ID_PATTERN.findall(items)]
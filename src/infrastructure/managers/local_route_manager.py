@@ -0,0 +1,167 @@
+import logging
+import re
+from typing import Any, Optional
+
+import numpy as np
+
+from application.constants import MAX_PLACES_COUNT, MIN_PLACES_COUNT
+from application.use_cases.routes.enums import RouteGenerationMode as Mode
+from common.geo import ROUTE_TYPE_SPEED_KMH, haversine_matrix
+from domain.entities.enums import RouteType
+from infrastructure.managers.ChatGPT.dto import ChatGPTContentData, ChatGPTPlaceData
+from infrastructure.repositories.interfaces.ChatGPT.base import AsyncClassificationManager, ProgressCallback
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[^\W\d_]{3,}")
+# Слова сравниваются по началу, чтобы "музеи" совпадало с "музей"
+STEM_LENGTH = 5
+# Переход между соседними местами, который считается комфортным, в минутах
+COMFORTABLE_LEG_MINUTES = 20
+
+CATEGORY_WEIGHT = 2.0
+TYPE_WEIGHT = 2.0
+KEYWORD_WEIGHT = 0.5
+
+
+class LocalRouteGenerationManager(AsyncClassificationManager):
+    """
+    Детерминированный генератор маршрутов без обращения к ChatGPT.
+    Места оцениваются по совпадению с категориями, типами и словами анкеты,
+    следующее место выбирается с учётом расстояния до предыдущего
+    (штраф растёт с длиной перехода относительно скорости выбранного транспорта).
+    Используется как быстрый режим генерации и как запасной путь при недоступности ChatGPT.
+    """
+
+    async def generate_route(
+        self,
+        content: ChatGPTContentData,
+        mode: Mode = Mode.FULL,
+        user_id: int | None = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        survey = content.survey_data
+        data = survey.data or {}
+        route_type = self._route_type(data.get("preferred_transport"))
+        places = content.places_data
+
+        slots = [slot for _, slot in sorted((survey.places or {}).items(), key=lambda item: int(item[0]))]
+        keywords = self._stems(survey.prompt, data.get("preferences"), data.get("experience"))
+
+        if slots:
+            selected = self._fill_slots(places, slots, keywords, route_type)
+        else:
+            count = data.get("places_count") or MIN_PLACES_COUNT
+            count = min(max(count, MIN_PLACES_COUNT), MAX_PLACES_COUNT)
+            scores = [self._score(place, {}, keywords) for place in places]
+            selected = self._pick(places, scores, count, route_type)
+
+        logger.info(f"Local route generator selected places: {selected}")
+        return {
+            "type": route_type.value,
+            "places": selected,
+            "keep_order": bool(slots and data.get("order_matters")),
+        }
+
+    def _fill_slots(
+        self,
+        places: list[ChatGPTPlaceData],
+        slots: list[dict[str, Any]],
+        keywords: set[str],
+        route_type: RouteType,
+    ) -> list[int]:
+        """Слоты анкеты заполняются по порядку: явное место или лучшее подходящее рядом с предыдущим"""
+        leg_m = self._comfortable_leg(route_type)
+        distances = self._distances(places, missing_m=leg_m)
+        index_by_id = {place.id: i for i, place in enumerate(places)}
+
+        selected: list[int] = []
+        for slot in slots:
+            if slot.get("place_id"):
+                selected.append(slot["place_id"])
+                continue
+
+            slot_keywords = keywords | self._stems(slot.get("description"))
+            previous = index_by_id.get(selected[-1]) if selected else None
+            best, best_score = None, None
+            for i, place in enumerate(places):
+                if place.id in selected:
+                    continue
+                score = self._score(place, slot, slot_keywords)
+                if previous is not None and distances is not None:
+                    score -= distances[previous, i] / leg_m
+                if best_score is None or score > best_score:
+                    best, best_score = place.id, score
+            if best is not None:
+                selected.append(best)
+        return selected
+
+    def _pick(
+        self, places: list[ChatGPTPlaceData], scores: list[float], count: int, route_type: RouteType
+    ) -> list[int]:
+        """
+        Жадный выбор: первое место - лучшее по оценке, каждое следующее - лучшее по оценке
+        за вычетом штрафа за расстояние от предыдущего. Порядок выбора сразу даёт порядок обхода.
+        """
+        if not places:
+            return []
+
+        leg_m = self._comfortable_leg(route_type)
+        distances = self._distances(places, missing_m=leg_m)
+        scores = np.asarray(scores, dtype=float)
+        available = np.ones(len(places), dtype=bool)
+
+        current = int(np.argmax(scores))
+        order = [current]
+        available[current] = False
+        while len(order) < count and available.any():
+            gain = scores.copy()
+            if distances is not None:
+                gain -= distances[current] / leg_m
+            gain[~available] = -np.inf
+            current = int(np.argmax(gain))
+            order.append(current)
+            available[current] = False
+        return [places[i].id for i in order]
+
+    @classmethod
+    def _score(cls, place: ChatGPTPlaceData, slot: dict[str, Any], keywords: set[str]) -> float:
+        score = 0.0
+        if slot.get("category") and slot["category"] == place.category:
+            score += CATEGORY_WEIGHT
+        if slot.get("type") and slot["type"] == place.type:
+            score += TYPE_WEIGHT
+        if keywords:
+            words = cls._stems(place.name, place.tags, place.category, place.type)
+            score += KEYWORD_WEIGHT * len(words & keywords)
+        return score
+
+    @staticmethod
+    def _stems(*texts: Optional[str]) -> set[str]:
+        return {
+            word.lower()[:STEM_LENGTH] for text in texts if text for word in WORD_PATTERN.findall(str(text))
+        }
+
+    @staticmethod
+    def _distances(places: list[ChatGPTPlaceData], missing_m: float) -> Optional[np.ndarray]:
+        """Матрица расстояний; расстояние до места без координат принимается равным missing_m"""
+        located = [i for i, place in enumerate(places) if place.coordinates and len(place.coordinates) >= 2]
+        if len(located) < 2:
+            return None
+
+        distances = np.full((len(places), len(places)), missing_m)
+        points = np.asarray([places[i].coordinates[:2] for i in located], dtype=float)
+        distances[np.ix_(located, located)] = haversine_matrix(points)
+        return distances
+
+    @staticmethod
+    def _comfortable_leg(route_type: RouteType) -> float:
+        speed_kmh = ROUTE_TYPE_SPEED_KMH.get(route_type, ROUTE_TYPE_SPEED_KMH[RouteType.MIXED])
+        return speed_kmh * 1000 * COMFORTABLE_LEG_MINUTES / 60
+
+    @staticmethod
+    def _route_type(value: Any) -> RouteType:
+        try:
+            return RouteType(value)
+        except ValueError:
+            return RouteType.MIXED
@@ -1,34 +1,64 @@
+import base64
+import json
+from datetime import datetime
 from math import ceil
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 from urllib.parse import urlencode
 
 from fastapi import Request
-from sqlalchemy import Result
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.exceptions import APIException
 from domain.validators.dto import PaginatedResponse
 
 T = TypeVar("T")
 
 
+def encode_cursor(created_at: datetime, obj_id: int) -> str:
+    """Кодирует позицию (created_at, id) в непрозрачный курсор"""
+    raw = json.dumps({"created_at": created_at.isoformat(), "id": obj_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Декодирует курсор обратно в позицию (created_at, id)"""
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(raw["created_at"]), int(raw["id"])
+    except Exception:
+        raise APIException(code=400, message=f"Некорректный курсор: {cursor}")
+
+
 class Paginator(Generic[T]):
+    """
+    Пагинация на стороне БД: страница выбирается через LIMIT/OFFSET,
+    общее количество считается отдельным COUNT по тому же запросу.
+    """
+
     def __init__(self, schema_read: Type[T]):
         self.schema_read = schema_read
 
     async def paginate(
         self,
-        result: Result,
+        session: AsyncSession,
+        stmt: Select,
         request: Request,
         page: int = 1,
         page_size: int = 10,
+        scalars: bool = True,
     ) -> PaginatedResponse[T]:
-        items = result.scalars().unique().all()
-        total_items = len(items)
+        """scalars=False - запрос возвращает строки из колонок, а не ORM-объекты"""
+        total_items = await self._count(session, stmt)
         total_pages = ceil(total_items / page_size) if total_items else 1
 
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated_items = items[start:end]
-        data = [self.schema_read.model_validate(obj) for obj in paginated_items]
+        items = []
+        if total_items:
+            page_stmt = stmt.limit(page_size).offset((page - 1) * page_size)
+            result = await session.execute(page_stmt)
+            items = result.scalars().unique().all() if scalars else result.mappings().all()
+
+        data = [self.schema_read.model_validate(obj) for obj in items]
         base_url = str(request.url.replace_query_params())
         query_params = dict(request.query_params)
 
@@ -47,3 +77,51 @@ class Paginator(Generic[T]):
             next=build_url(page + 1),
             previous=build_url(page - 1),
         )
+
+    async def paginate_by_cursor(
+        self,
+        session: AsyncSession,
+        stmt: Select,
+        request: Request,
+        page_size: int = 10,
+    ) -> PaginatedResponse[T]:
+        """
+        Keyset-пагинация: предикат по курсору уже добавлен репозиторием,
+        здесь выбирается page_size + 1 строк, чтобы понять, есть ли следующая страница.
+        COUNT не выполняется.
+        """
+        result = await session.execute(stmt.limit(page_size + 1))
+        items = result.scalars().unique().all()
+
+        has_next = len(items) > page_size
+        items = items[:page_size]
+        next_cursor = self._build_cursor(items[-1]) if has_next and items else None
+
+        data = [self.schema_read.model_validate(obj) for obj in items]
+
+        next_url = None
+        if next_cursor:
+            base_url = str(request.url.replace_query_params())
+            params = {**dict(request.query_params), "cursor": next_cursor, "page_size": str(page_size)}
+            next_url = f"{base_url}?{urlencode(params)}"
+
+        return PaginatedResponse[T](
+            data=data,
+            count=None,
+            page=1,
+            page_size=page_size,
+            total_pages=None,
+            next=next_url,
+            previous=None,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _build_cursor(obj: Any) -> str:
+        return encode_cursor(obj.created_at, obj.id)
+
+    @staticmethod
+    async def _count(session: AsyncSession, stmt: Select) -> int:
+        """Количество строк запроса без сортировки и eager-загрузок"""
+        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return await session.scalar(count_stmt) or 0
@@ -0,0 +1,78 @@
+import math
+from collections import defaultdict
+from typing import Iterable, Optional, Sequence
+
+from domain.entities.place import Place
+
+
+class PlaceCandidateSelector:
+    """
+    Прореживание списка мест-кандидатов по карте.
+    Область, которую покрывают места, делится на сетку, и места берутся по кругу из разных ячеек,
+    так что в выборку попадают лучшие места каждого района, а не только самого плотного.
+    """
+
+    def select(
+        self,
+        places: Sequence[Place],
+        limit: int,
+        pinned_ids: Optional[Iterable[int]] = None,
+    ) -> list[Place]:
+        """
+        places: кандидаты в порядке убывания релевантности.
+        pinned_ids: места, которые попадают в выборку всегда.
+        Возвращает не больше limit мест (не считая закреплённых) в исходном порядке.
+        """
+        pinned_ids = set(pinned_ids or ())
+        pinned = [i for i, place in enumerate(places) if place.id in pinned_ids]
+        rest = [i for i, place in enumerate(places) if place.id not in pinned_ids]
+
+        if len(rest) > limit:
+            rest = self._spread(places, rest, limit)
+
+        return [places[i] for i in sorted(pinned + rest)]
+
+    def _spread(self, places: Sequence[Place], indexes: list[int], limit: int) -> list[int]:
+        """Круговой обход ячеек сетки; внутри ячейки - по релевантности"""
+        cells = self._grid_cells(places, indexes, size=math.ceil(math.sqrt(limit)))
+
+        buckets: dict = defaultdict(list)
+        for i in indexes:
+            buckets[cells.get(i)].append(i)
+
+        # Ячейки с более релевантными местами обходятся первыми
+        queues = sorted(buckets.values(), key=lambda bucket: bucket[0])
+        selected = []
+        depth = 0
+        while len(selected) < limit:
+            taken = [bucket[depth] for bucket in queues if depth < len(bucket)]
+            if not taken:
+                break
+            selected.extend(taken[: limit - len(selected)])
+            depth += 1
+        return selected
+
+    @staticmethod
+    def _grid_cells(places: Sequence[Place], indexes: list[int], size: int) -> dict[int, tuple[int, int]]:
+        """Ячейка сетки size x size для каждого места с координатами"""
+        points = {
+            i: places[i].coordinates[:2]
+            for i in indexes
+            if places[i].coordinates and len(places[i].coordinates) >= 2
+        }
+        if not points:
+            return {}
+
+        lats = [lat for lat, _ in points.values()]
+        lons = [lon for _, lon in points.values()]
+        min_lat, min_lon = min(lats), min(lons)
+        lat_step = (max(lats) - min_lat) / size or 1.0
+        lon_step = (max(lons) - min_lon) / size or 1.0
+
+        return {
+            i: (
+                min(int((lat - min_lat) / lat_step), size - 1),
+                min(int((lon - min_lon) / lon_step), size - 1),
+            )
+            for i, (lat, lon) in points.items()
+        }
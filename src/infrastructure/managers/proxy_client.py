@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, AsyncContextManager, Dict, Optional
 
 import httpx
 
@@ -40,4 +40,49 @@ class ProxyClient:
     ) -> httpx.Response:
         t = timeout if timeout is not None else self.CHATGPT_REQUEST_TIMEOUT
         response = self.client.post(url, json=json, headers=headers, timeout=t)
-        return response
\ No newline at end of file
+        return response
+
+
+class AsyncProxyClient:
+    """Асинхронный клиент через тот же прокси с общим пулом соединений"""
+
+    settings = Settings()
+    CHATGPT_REQUEST_TIMEOUT = settings.chatgpt.chatgpt_request_timeout
+
+    def __init__(
+        self,
+        proxy_host: str,
+        proxy_http_port: int,
+        proxy_username: str,
+        proxy_password: str,
+        max_connections: int = 20,
+    ):
+        proxy_url = f"http://{proxy_username}:{proxy_password}@{proxy_host}:{proxy_http_port}"
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        transport = httpx.AsyncHTTPTransport(proxy=proxy_url, limits=limits)
+
+        self.client = httpx.AsyncClient(transport=transport)
+
+    async def post(
+        self,
+        url: str,
+        json: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        t = timeout if timeout is not None else self.CHATGPT_REQUEST_TIMEOUT
+        return await self.client.post(url, json=json, headers=headers, timeout=t)
+
+    def stream(
+        self,
+        url: str,
+        json: Dict[str, Any],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> AsyncContextManager[httpx.Response]:
+        """POST с потоковым чтением тела ответа"""
+        t = timeout if timeout is not None else self.CHATGPT_REQUEST_TIMEOUT
+        return self.client.stream("POST", url, json=json, headers=headers, timeout=t)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,136 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from common.geo import haversine_matrix, path_length
+
+# Минимальный выигрыш 2-opt в метрах, меньшие улучшения считаются шумом
+MIN_IMPROVEMENT_M = 1e-6
+
+
+class RouteOrderOptimizer:
+    """
+    Порядок обхода мест, сокращающий суммарное расстояние по haversine.
+    Начальное решение строится жадно (ближайший сосед) и улучшается 2-opt.
+    Маршрут открытый: возвращаться в начальную точку не нужно.
+    """
+
+    def order_places(
+        self,
+        place_ids: Sequence[int],
+        coordinates: Sequence[Optional[Sequence[float]]],
+        start_place_id: Optional[int] = None,
+        finish_place_id: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Упорядочить места маршрута. Места без координат не участвуют в оптимизации
+        и остаются в конце в исходном порядке. Закреплённые первое и последнее места
+        остаются на своих позициях, даже если у них нет координат.
+        """
+        located = [i for i, point in enumerate(coordinates) if point and len(point) >= 2]
+        located_set = set(located)
+        missing = [place_id for i, place_id in enumerate(place_ids) if i not in located_set]
+        located_ids = [place_ids[i] for i in located]
+
+        start = located_ids.index(start_place_id) if start_place_id in located_ids else None
+        finish = located_ids.index(finish_place_id) if finish_place_id in located_ids else None
+
+        order = self.optimize([coordinates[i][:2] for i in located], start, finish)
+        start_id = start_place_id if start_place_id in place_ids else None
+        finish_id = finish_place_id if finish_place_id in place_ids else None
+        if finish_id == start_id:
+            finish_id = None
+        return self._pin([located_ids[i] for i in order] + missing, start_id, finish_id)
+
+    def optimize(
+        self,
+        coordinates: Sequence[Sequence[float]],
+        start: Optional[int] = None,
+        finish: Optional[int] = None,
+    ) -> list[int]:
+        """
+        coordinates: [широта, долгота] мест в текущем порядке.
+        start / finish: индексы мест, которые должны остаться первым / последним.
+        Возвращает индексы мест в новом порядке.
+        """
+        if finish == start:
+            finish = None
+
+        size = len(coordinates)
+        if size < 3:
+            return self._pin(list(range(size)), start, finish)
+
+        distances = haversine_matrix(np.asarray(coordinates, dtype=float))
+        order = self._nearest_neighbour(distances, start, finish)
+        return self._two_opt(distances, order, start is not None, finish is not None)
+
+    @staticmethod
+    def _pin(order: list[int], start: Optional[int], finish: Optional[int]) -> list[int]:
+        if start is not None:
+            order = [start] + [i for i in order if i != start]
+        if finish is not None:
+            order = [i for i in order if i != finish] + [finish]
+        return order
+
+    @classmethod
+    def _nearest_neighbour(
+        cls, distances: np.ndarray, start: Optional[int], finish: Optional[int]
+    ) -> list[int]:
+        size = len(distances)
+        starts = [start] if start is not None else [i for i in range(size) if i != finish]
+
+        best_order, best_length = None, np.inf
+        for first in starts:
+            order = [first]
+            visited = np.zeros(size, dtype=bool)
+            visited[first] = True
+            if finish is not None:
+                visited[finish] = True
+
+            while not visited.all():
+                row = np.where(visited, np.inf, distances[order[-1]])
+                nearest = int(row.argmin())
+                order.append(nearest)
+                visited[nearest] = True
+
+            if finish is not None:
+                order.append(finish)
+
+            length = path_length(distances, order)
+            if length < best_length:
+                best_order, best_length = order, length
+        return best_order
+
+    @staticmethod
+    def _two_opt(
+        distances: np.ndarray, order: list[int], fixed_start: bool, fixed_finish: bool
+    ) -> list[int]:
+        tour = np.asarray(order, dtype=int)
+        size = len(tour)
+        first = 1 if fixed_start else 0
+        last = size - 2 if fixed_finish else size - 1
+
+        improved = True
+        while improved:
+            improved = False
+            for i in range(first, last):
+                # Разворот отрезка tour[i..j] для всех j сразу
+                js = np.arange(i + 1, last + 1)
+                b, c = tour[i], tour[js]
+                has_next = js + 1 < size
+                e = tour[np.minimum(js + 1, size - 1)]
+
+                before = np.where(has_next, distances[c, e], 0.0)
+                after = np.where(has_next, distances[b, e], 0.0)
+                if i > 0:
+                    a = tour[i - 1]
+                    before = before + distances[a, b]
+                    after = after + distances[a, c]
+
+                delta = after - before
+                best = int(delta.argmin())
+                if delta[best] < -MIN_IMPROVEMENT_M:
+                    j = js[best]
+                    tour[i : j + 1] = tour[i : j + 1][::-1]
+                    improved = True
+        return tour.tolist()
@@ -7,7 +7,7 @@ from fastapi import HTTPException
 from application.use_cases.auth.dto import SmsPayloadDTO
 from config.settings import SmsSettings
 from domain.validators.base import PhoneNumberValidator
-from infrastructure.redis.base import AbstractRedisCache
+from infrastructure.redis.base import AbstractAsyncRedisCache
 
 
 class SmsClient:
@@ -19,7 +19,7 @@ class SmsClient:
     COOLDOWN_SECONDS: int = 1  # 5 минут
     BLOCK_SECONDS: int = 24 * 60 * 60  # 1 день
 
-    def __init__(self, redis_cache: AbstractRedisCache, settings: SmsSettings):
+    def __init__(self, redis_cache: AbstractAsyncRedisCache, settings: SmsSettings):
         self._redis_cache = redis_cache
         self.settings = settings
 
@@ -45,11 +45,11 @@ class SmsClient:
     async def get_code(self, phone: str) -> str:
         """Генерирует или получает кешированный код подтверждения."""
         phone = self._validate_phone(phone)
-        self._check_spam_restrictions(phone)
+        await self._check_spam_restrictions(phone)
 
         code = self._generate_code()
-        self._redis_cache.set_code_by_phone(phone, code, self.settings.cache_timeout)
-        self._increment_sms_attempt(phone)
+        await self._redis_cache.set_code_by_phone(phone, code, self.settings.cache_timeout)
+        await self._increment_sms_attempt(phone)
 
         return code
 
@@ -119,15 +119,15 @@ class SmsClient:
                 detail=f"Неизвестная ошибка: {response.text}",
             )
 
-    def _check_spam_restrictions(self, phone: str) -> None:
+    async def _check_spam_restrictions(self, phone: str) -> None:
         """Проверяет ограничения по частоте отправки кодов"""
         attempts_key = f"{self.SPAM_ATTEMPT_KEY_PREFIX}{phone}"
         timestamp_key = f"{self.SPAM_TIMESTAMP_KEY}{phone}"
 
-        attempts = self._redis_cache.get(attempts_key)
+        attempts = await self._redis_cache.get(attempts_key)
         attempts = int(attempts) if attempts else 0
 
-        last_ts = self._redis_cache.get(timestamp_key)
+        last_ts = await self._redis_cache.get(timestamp_key)
         now = int(time.time())
 
         if attempts >= self.MAX_ATTEMPTS:
@@ -137,7 +137,7 @@ class SmsClient:
                     detail="Превышен лимит отправок. Попробуйте через 24 часа.",
                 )
             else:
-                self._redis_cache.set(attempts_key, "0")  # Сбросить счётчик
+                await self._redis_cache.set(attempts_key, "0")  # Сбросить счётчик
 
         elif attempts >= 2:
             if last_ts and now - int(last_ts) < self.COOLDOWN_SECONDS:
@@ -146,12 +146,12 @@ class SmsClient:
                     detail="Слишком часто запрашиваете код. Попробуйте через 5 минут.",
                 )
 
-    def _increment_sms_attempt(self, phone: str) -> None:
+    async def _increment_sms_attempt(self, phone: str) -> None:
         """Увеличивает счётчик отправок и обновляет время последней попытки"""
         attempts_key = f"{self.SPAM_ATTEMPT_KEY_PREFIX}{phone}"
         timestamp_key = f"{self.SPAM_TIMESTAMP_KEY}{phone}"
 
-        attempts = self._redis_cache.get(attempts_key)
+        attempts = await self._redis_cache.get(attempts_key)
         attempts = int(attempts) if attempts else 0
-        self._redis_cache.set(attempts_key, str(attempts + 1), ttl=self.BLOCK_SECONDS)
-        self._redis_cache.set(timestamp_key, str(int(time.time())), ttl=self.BLOCK_SECONDS)
+        await self._redis_cache.set(attempts_key, str(attempts + 1), ttl=self.BLOCK_SECONDS)
+        await self._redis_cache.set(timestamp_key, str(int(time.time())), ttl=self.BLOCK_SECONDS)
@@ -1,4 +1,4 @@
 from .posts import Post
-from .routes import Comment, Place, Route, RoutePlace
+from .routes import Comment, Place, Route, RoutePlace, RouteStats
 from .surveys import Survey
 from .users import User
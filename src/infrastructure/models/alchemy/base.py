@@ -1,7 +1,11 @@
 from typing import Any
 
-from sqlalchemy import JSON, MetaData
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import JSON, Computed, MetaData
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedColumn, mapped_column
+
+# Конфигурация полнотекстового поиска Postgres (стемминг русского языка)
+SEARCH_CONFIG = "russian"
 
 
 class Base(DeclarativeBase):
@@ -12,3 +16,15 @@ class Base(DeclarativeBase):
 
     # Automatically generate id column
     id: Mapped[int] = mapped_column(primary_key=True)
+
+
+def search_vector_column(**weights: str) -> MappedColumn[Any]:
+    """
+    Хранимая tsvector-колонка, которую Postgres пересчитывает сам при изменении полей.
+    weights: имя текстовой колонки -> вес ("A" - самый значимый).
+    """
+    expression = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weights.items()
+    )
+    return mapped_column(TSVECTOR, Computed(expression, persisted=True), deferred=True)
@@ -2,10 +2,10 @@ from datetime import datetime
 from tokenize import Comment
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from infrastructure.models.alchemy.base import Base
+from infrastructure.models.alchemy.base import Base, search_vector_column
 
 if TYPE_CHECKING:
     from infrastructure.models.alchemy.routes import Comment, Like, Route
@@ -14,6 +14,22 @@ if TYPE_CHECKING:
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index(
+            "ix_posts_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_posts_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -28,6 +44,7 @@ class Post(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now, server_default="now()"
     )
+    search_vector: Mapped[str | None] = search_vector_column(title="A", description="B")
 
     route: Mapped["Route"] = relationship("Route", back_populates="posts", lazy="selectin")
     author: Mapped["User"] = relationship("User", back_populates="posts", lazy="selectin")
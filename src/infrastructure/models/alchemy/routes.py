@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import JSON, Computed, DateTime, Double, Enum, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domain.entities.enums import CityCategory, PlaceCategory, PlaceType, RouteType
-from infrastructure.models.alchemy.base import Base
+from infrastructure.models.alchemy.base import Base, search_vector_column
 
 if TYPE_CHECKING:
     from infrastructure.models.alchemy.posts import Post
@@ -14,6 +14,16 @@ if TYPE_CHECKING:
 
 class Place(Base):
     __tablename__ = "places"
+    __table_args__ = (
+        Index(
+            "ix_places_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_places_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_places_location", text("point(longitude, latitude)"), postgresql_using="gist"),
+    )
 
     name: Mapped[str] = mapped_column(String, index=True)
     website_url: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -34,9 +44,17 @@ class Place(Base):
     object_id: Mapped[int] = mapped_column(Integer, nullable=True)
     tags: Mapped[str | None] = mapped_column(default=None, server_default=None)
     coordinates: Mapped[list | None] = mapped_column(JSON, default=None, server_default=None)
+    # Типизированные координаты вычисляются Postgres из coordinates = [широта, долгота]
+    latitude: Mapped[float | None] = mapped_column(
+        Double, Computed("(coordinates ->> 0)::double precision", persisted=True)
+    )
+    longitude: Mapped[float | None] = mapped_column(
+        Double, Computed("(coordinates ->> 1)::double precision", persisted=True)
+    )
     photo: Mapped[str | None] = mapped_column(default=None, server_default=None)
     map_name: Mapped[str | None] = mapped_column(default=None, server_default=None)
     json_data: Mapped[dict | None] = mapped_column(JSON, default=None, server_default=None)
+    search_vector: Mapped[str | None] = search_vector_column(name="A", tags="B", description="C")
 
     route_places: Mapped[list["RoutePlace"]] = relationship(
         "RoutePlace", back_populates="place", lazy="selectin"
@@ -52,6 +70,16 @@ class Place(Base):
 
 class Route(Base):
     __tablename__ = "routes"
+    __table_args__ = (
+        Index("ix_routes_created_at_id", "created_at", "id"),
+        Index(
+            "ix_routes_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_routes_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     name: Mapped[str] = mapped_column(String, index=True)
     type: Mapped[RouteType] = mapped_column(
@@ -66,18 +94,22 @@ class Route(Base):
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
 
     description: Mapped[str | None] = mapped_column(default=None, server_default=None)
-    duration: Mapped[int | None] = mapped_column(default=None, server_default=None)
-    distance: Mapped[int | None] = mapped_column(default=None, server_default=None)
+    # Время в пути в минутах и длина в метрах, пересчитываются при изменении мест маршрута
+    duration: Mapped[int | None] = mapped_column(default=None, server_default=None, index=True)
+    distance: Mapped[int | None] = mapped_column(default=None, server_default=None, index=True)
     is_custom: Mapped[bool] = mapped_column(default=False, server_default="false")
     is_publicated: Mapped[bool] = mapped_column(default=False, server_default="false")
 
     photo: Mapped[str | None] = mapped_column(default=None, server_default=None)
+    # Пересчитывается вместе с distance/duration при изменении мест маршрута
+    yandex_maps_url: Mapped[str | None] = mapped_column(String, default=None, server_default=None)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, server_default="now()")
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now, server_default="now()"
     )
     json_data: Mapped[dict | None] = mapped_column(JSON, default=None, server_default=None)
+    search_vector: Mapped[str | None] = search_vector_column(name="A", description="B")
 
     author: Mapped["User"] = relationship("User", back_populates="routes", lazy="selectin")
     places: Mapped[list["RoutePlace"]] = relationship(
@@ -96,7 +128,7 @@ class Route(Base):
 class RoutePlace(Base):
     __tablename__ = "route_places"
 
-    route_id: Mapped[int] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"))
+    route_id: Mapped[int] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"), index=True)
     place_id: Mapped[int] = mapped_column(ForeignKey("places.id"))
     order: Mapped[int] = mapped_column(default=0)
 
@@ -104,11 +136,23 @@ class RoutePlace(Base):
     place: Mapped["Place"] = relationship("Place", back_populates="route_places", lazy="selectin")
 
 
+class RouteStats(Base):
+    """Денормализованные счётчики маршрута (read model для фильтров ленты)"""
+
+    __tablename__ = "route_stats"
+
+    route_id: Mapped[int] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"), unique=True)
+    place_count: Mapped[int] = mapped_column(default=0, server_default="0", index=True)
+    photo_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    like_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(default=0, server_default="0")
+
+
 class Like(Base):
     __tablename__ = "likes"
 
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
-    route_id: Mapped[int | None] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"))
+    route_id: Mapped[int | None] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"), index=True)
     place_id: Mapped[int | None] = mapped_column(ForeignKey("places.id", ondelete="CASCADE"))
     post_id: Mapped[int | None] = mapped_column(ForeignKey("posts.id", ondelete="CASCADE"))
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
@@ -123,7 +167,7 @@ class Comment(Base):
     __tablename__ = "comments"
 
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
-    route_id: Mapped[int | None] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"))
+    route_id: Mapped[int | None] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"), index=True)
     place_id: Mapped[int | None] = mapped_column(ForeignKey("places.id", ondelete="CASCADE"))
     post_id: Mapped[int | None] = mapped_column(ForeignKey("posts.id", ondelete="CASCADE"))
     timestamp: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
@@ -142,7 +186,9 @@ class Photo(Base):
     uploaded_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, server_default="now()")
     uploaded_by: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     place_id: Mapped[int | None] = mapped_column(ForeignKey("places.id", ondelete="CASCADE"), nullable=True)
-    route_id: Mapped[int | None] = mapped_column(ForeignKey("routes.id", ondelete="CASCADE"), nullable=True)
+    route_id: Mapped[int | None] = mapped_column(
+        ForeignKey("routes.id", ondelete="CASCADE"), nullable=True, index=True
+    )
 
     place: Mapped["Place"] = relationship("Place", back_populates="photos", lazy="selectin")
     route: Mapped["Route"] = relationship("Route", back_populates="photos", lazy="selectin")
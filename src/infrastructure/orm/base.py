@@ -1,7 +1,6 @@
 import inspect
 from collections import defaultdict
 from typing import Any, Generic, List, Optional, Type, TypeVar
-from urllib.parse import urlencode
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Request, Response, status
@@ -14,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from common.exceptions import APIException
 from config.containers import Container
 from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.paginator import Paginator
 from infrastructure.models.alchemy.base import Base
 from infrastructure.permissions.dependencies import (
     request_body_schema_from_self,
@@ -22,6 +22,7 @@ from infrastructure.permissions.dependencies import (
     role_required,
 )
 from infrastructure.permissions.enums import PermissionEnum, RoleEnum
+from infrastructure.repositories.alchemy.search import contains
 
 TRead = TypeVar("TRead", bound=BaseModel)
 TCreate = TypeVar("TCreate", bound=BaseModel)
@@ -211,7 +212,7 @@ class BaseViewSet(Generic[TRead, TCreate, TPut, TPatch, TFilter]):
                     if hasattr(self.model, column_name):
                         stmt = stmt.where(getattr(self.model, column_name).in_(value))
                 elif attr in self.ilike_list:
-                    stmt = stmt.where(getattr(self.model, attr).ilike(f"%{value}%"))
+                    stmt = stmt.where(contains(getattr(self.model, attr), value))
                 elif hasattr(self.model, attr):
                     stmt = stmt.where(getattr(self.model, attr) == value)
 
@@ -219,36 +220,13 @@ class BaseViewSet(Generic[TRead, TCreate, TPut, TPatch, TFilter]):
 
     async def paginate_queryset(
         self,
-        result: Result,
+        session: AsyncSession,
+        stmt: Select,
         request: Request,
         page: int = 1,
         page_size: int = 10,
     ) -> BaseModel:
-        items = result.unique().scalars().all()
-        total = len(items)
-
-        start = (page - 1) * page_size
-        end = start + page_size
-        paginated = items[start:end]
-
-        paginated_data = [self.schema_read.model_validate(obj) for obj in paginated]
-
-        base_url = str(request.url).split("?")[0]
-        query_params = dict(request.query_params)
-
-        def build_url(page_number: int) -> Optional[str]:
-            if page_number < 1 or page_number > (total + page_size - 1) // page_size:
-                return None
-            params = {**query_params, "page": page_number, "page_size": page_size}
-            return f"{base_url}?{urlencode(params)}"
-
-        return self.pagination_class(
-            data=paginated_data,
-            count=total,
-            page=page,
-            next=build_url(page + 1),
-            previous=build_url(page - 1),
-        )
+        return await Paginator(self.schema_read).paginate(session, stmt, request, page, page_size)
 
     @inject
     async def list(
@@ -259,15 +237,16 @@ class BaseViewSet(Generic[TRead, TCreate, TPut, TPatch, TFilter]):
         try:
             filter_obj = self.parse_query_filters(request)
             filters = filter_obj.model_dump(exclude_none=True)
-            result = await self.get_queryset(session, filters=filters)
+            stmt = self.build_select_stmt(filters=filters).order_by(self.model.id)
 
             # Пагинация включена
             if self.pagination_class:
                 page = int(request.query_params.get("page", 1))
                 page_size = int(request.query_params.get("page_size", 10))
-                return await self.paginate_queryset(result, request, page=page, page_size=page_size)
+                return await self.paginate_queryset(session, stmt, request, page=page, page_size=page_size)
 
             # Без пагинации — сериализация в схемы
+            result = await session.execute(stmt)
             items = result.unique().scalars().all()
             return [self.schema_read.model_validate(obj) for obj in items]
         finally:
@@ -0,0 +1,94 @@
+import json
+
+from redis.asyncio import Redis  # type: ignore
+
+from infrastructure.redis.base import AbstractAsyncRedisCache
+
+
+class AsyncRedisCache(AbstractAsyncRedisCache):
+    """Реализация кеша на основе redis.asyncio: запросы к Redis не блокируют event loop"""
+
+    def __init__(self, cache_connection: Redis):
+        super().__init__(cache_connection)  # type: ignore
+        self._cache_connection: Redis = cache_connection  # type: ignore
+
+    async def ping(self) -> bool:
+        """Проверяет соединение с Redis и открывает его в пуле заранее"""
+        return await self._cache_connection.ping()
+
+    async def get(self, key: str) -> str | None:
+        """Получает значение по ключу из Redis"""
+        return await self._cache_connection.get(key)
+
+    async def set(self, key: str, value: str, ttl: int = AbstractAsyncRedisCache.TTL) -> None:
+        """Записывает значение в Redis с TTL"""
+        await self._cache_connection.setex(key, ttl, value)
+
+    async def get_code_by_phone(self, phone: str) -> str | None:
+        """Получает код по телефону"""
+        value = await self._cache_connection.get(self._sms_code_key(phone))
+        return value.decode("utf-8") if value else None
+
+    async def set_code_by_phone(
+        self, phone: str, code: int, ttl: int = AbstractAsyncRedisCache.TTL
+    ) -> str | None:
+        """Сохраняет код по телефону"""
+        await self._cache_connection.setex(self._sms_code_key(phone), ttl, code)
+
+    async def delete_code_by_phone(self, phone: str) -> None:
+        """Удаляет код по телефону"""
+        await self._cache_connection.delete(self._sms_code_key(phone))
+
+    async def acquire_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        key = self._generation_lock_key(user_id)
+        return bool(await self._cache_connection.set(key, token, nx=True, ex=ttl))
+
+    async def extend_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        return bool(await self._cache_connection.eval(*self._extend_lock_eval(user_id, token, ttl)))
+
+    async def release_route_generation_lock(self, user_id: int, token: str) -> bool:
+        return bool(await self._cache_connection.eval(*self._release_lock_eval(user_id, token)))
+
+    async def get_places_catalog_version(self) -> int:
+        return self._to_int(await self._cache_connection.get(self.PLACES_CATALOG_VERSION_KEY))
+
+    async def bump_places_catalog_version(self) -> int:
+        return await self._cache_connection.incr(self.PLACES_CATALOG_VERSION_KEY)
+
+    async def reserve_chatgpt_response(
+        self, day: str, user_id: int | None, daily_limit: int, user_daily_limit: int
+    ) -> bool:
+        args = self._reserve_quota_eval(day, user_id, daily_limit, user_daily_limit)
+        return bool(await self._cache_connection.eval(*args))
+
+    async def release_chatgpt_response(self, day: str, user_id: int | None) -> None:
+        await self._cache_connection.eval(*self._release_quota_eval(day, user_id))
+
+    async def get_chatgpt_responses_count(self, day: str, user_id: int | None = None) -> int:
+        return self._to_int(await self._cache_connection.get(self._chatgpt_quota_keys(day, user_id)[-1]))
+
+    async def get_generated_route(self, fingerprint: str) -> dict | None:
+        value = await self._cache_connection.get(self._generated_route_key(fingerprint))
+        return json.loads(value) if value else None
+
+    async def set_generated_route(self, fingerprint: str, route_data: dict) -> None:
+        value = json.dumps(route_data, ensure_ascii=False)
+        key = self._generated_route_key(fingerprint)
+        await self._cache_connection.setex(key, self.GENERATED_ROUTE_TTL, value)
+
+    async def create_generation_job(self, job_id: str, user_id: int, survey_id: int, status: str) -> None:
+        pipeline = self._cache_connection.pipeline()
+        self._queue_create_generation_job(pipeline, job_id, user_id, survey_id, status)
+        await pipeline.execute()
+
+    async def update_generation_job(self, job_id: str, status: str, **fields: str | int) -> None:
+        pipeline = self._cache_connection.pipeline()
+        self._queue_update_generation_job(pipeline, job_id, status, fields)
+        await pipeline.execute()
+
+    async def get_generation_job(self, job_id: str) -> dict[str, str] | None:
+        value = await self._cache_connection.hgetall(self._generation_job_key(job_id))
+        return self._decode_generation_job(value)
+
+    async def take_rate_limit_token(self, name: str, rate: float, capacity: int) -> float:
+        return float(await self._cache_connection.eval(*self._take_token_eval(name, rate, capacity)))
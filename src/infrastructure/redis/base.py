@@ -1,14 +1,31 @@
 from abc import abstractmethod
+from datetime import datetime
+from typing import Any
 
 from redis.client import AbstractRedis  # type: ignore
 
+from config.settings import Settings
+from infrastructure.redis.scripts import (
+    EXTEND_LOCK_SCRIPT,
+    RELEASE_LOCK_SCRIPT,
+    RELEASE_QUOTA_SCRIPT,
+    RESERVE_QUOTA_SCRIPT,
+    TAKE_TOKEN_SCRIPT,
+)
 
-class AbstractRedisCache:
-    """Абстрактный класс для кеша в Redis."""
+
+class RedisCacheMixin:
+    """
+    Общая часть кешей в Redis: TTL, ключи, аргументы Lua-скриптов и команды pipeline.
+    Реализации только выполняют запросы: RedisCache синхронно, AsyncRedisCache через redis.asyncio.
+    """
 
     TTL = 60 * 60 * 24  # 1 день
-    # TTL_MINIUTE = 60  # 1 минута
-    TTL_MINIUTE = 1
+    # Счётчик дня живёт двое суток, чтобы пережить границу дня в разных часовых поясах
+    CHATGPT_QUOTA_TTL = 2 * TTL
+    GENERATED_ROUTE_TTL = Settings().chatgpt.result_cache_ttl
+    GENERATION_JOB_TTL = TTL
+    PLACES_CATALOG_VERSION_KEY = "places_catalog:version"
 
     def __init__(
         self,
@@ -22,13 +39,93 @@ class AbstractRedisCache:
     ) -> None:
         self.phone = phone
 
+    @staticmethod
+    def _sms_code_key(phone: str) -> str:
+        return f"sms_code:{phone}"
+
+    @staticmethod
+    def _generation_lock_key(user_id: int) -> str:
+        return f"active_generation:{user_id}"
+
+    @staticmethod
+    def _chatgpt_quota_keys(day: str, user_id: int | None) -> list[str]:
+        keys = [f"chatgpt_quota:{day}"]
+        if user_id is not None:
+            keys.append(f"chatgpt_quota:{day}:user:{user_id}")
+        return keys
+
+    @staticmethod
+    def _generated_route_key(fingerprint: str) -> str:
+        return f"generated_route:{fingerprint}"
+
+    @staticmethod
+    def _generation_job_key(job_id: str) -> str:
+        return f"generation_job:{job_id}"
+
+    @staticmethod
+    def _to_int(value: bytes | None) -> int:
+        return int(value) if value else 0
+
+    # Аргументы EVAL: скрипт, количество ключей, ключи и ARGV
+    def _extend_lock_eval(self, user_id: int, token: str, ttl: int) -> tuple[Any, ...]:
+        return EXTEND_LOCK_SCRIPT, 1, self._generation_lock_key(user_id), token, ttl
+
+    def _release_lock_eval(self, user_id: int, token: str) -> tuple[Any, ...]:
+        return RELEASE_LOCK_SCRIPT, 1, self._generation_lock_key(user_id), token
+
+    def _reserve_quota_eval(
+        self, day: str, user_id: int | None, daily_limit: int, user_daily_limit: int
+    ) -> tuple[Any, ...]:
+        keys = self._chatgpt_quota_keys(day, user_id)
+        limits = [daily_limit, user_daily_limit][: len(keys)]
+        return RESERVE_QUOTA_SCRIPT, len(keys), *keys, self.CHATGPT_QUOTA_TTL, *limits
+
+    def _release_quota_eval(self, day: str, user_id: int | None) -> tuple[Any, ...]:
+        keys = self._chatgpt_quota_keys(day, user_id)
+        return RELEASE_QUOTA_SCRIPT, len(keys), *keys
+
+    @staticmethod
+    def _take_token_eval(name: str, rate: float, capacity: int) -> tuple[Any, ...]:
+        return TAKE_TOKEN_SCRIPT, 1, f"rate_limit:{name}", rate, capacity
+
+    # Команды задачи генерации одинаково ставятся в очередь pipeline синхронного и асинхронного клиента
+    def _queue_create_generation_job(
+        self, pipeline: Any, job_id: str, user_id: int, survey_id: int, status: str
+    ) -> None:
+        key = self._generation_job_key(job_id)
+        mapping = {
+            "user_id": user_id,
+            "survey_id": survey_id,
+            "status": status,
+            "version": 1,
+            "updated_at": datetime.now().isoformat(),
+        }
+        pipeline.hset(key, mapping=mapping)
+        pipeline.expire(key, self.GENERATION_JOB_TTL)
+
+    def _queue_update_generation_job(
+        self, pipeline: Any, job_id: str, status: str, fields: dict[str, str | int]
+    ) -> None:
+        key = self._generation_job_key(job_id)
+        pipeline.hset(key, mapping={**fields, "status": status, "updated_at": datetime.now().isoformat()})
+        pipeline.hincrby(key, "version", 1)
+        pipeline.expire(key, self.GENERATION_JOB_TTL)
+
+    @staticmethod
+    def _decode_generation_job(value: dict[bytes, bytes]) -> dict[str, str] | None:
+        return {key.decode(): item.decode() for key, item in value.items()} if value else None
+
+
+class AbstractRedisCache(RedisCacheMixin):
+    """Абстрактный класс для синхронного кеша в Redis."""
+
     @abstractmethod
     def get(self, key: str) -> str | None:
         """Абстрактный метод для получения данных из кеша."""
         pass
 
     @abstractmethod
-    def set(self, key: str, value: str, ttl: int = TTL) -> None:
+    def set(self, key: str, value: str, ttl: int = RedisCacheMixin.TTL) -> None:
         """Абстрактный метод для записи данных в кеш."""
         pass
 
@@ -38,7 +135,7 @@ class AbstractRedisCache:
         pass
 
     @abstractmethod
-    def set_code_by_phone(self, phone: str, code: int, ttl: int = TTL) -> str | None:
+    def set_code_by_phone(self, phone: str, code: int, ttl: int = RedisCacheMixin.TTL) -> str | None:
         """Получает код по телефону"""
         pass
 
@@ -48,16 +145,179 @@ class AbstractRedisCache:
         pass
 
     @abstractmethod
-    def set_active_route_geration(self, user_id: int, ttl: int = TTL_MINIUTE) -> str | None:
-        """Устанавливает флаг активной генерации маршрута"""
+    def acquire_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        """Занимает блокировку генерации маршрута пользователя; False, если она уже занята"""
+        pass
+
+    @abstractmethod
+    def extend_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        """Продлевает блокировку, если она принадлежит владельцу token"""
+        pass
+
+    @abstractmethod
+    def release_route_generation_lock(self, user_id: int, token: str) -> bool:
+        """Снимает блокировку, если она принадлежит владельцу token"""
+        pass
+
+    @abstractmethod
+    def get_places_catalog_version(self) -> int:
+        """Текущая версия каталога мест"""
+        pass
+
+    @abstractmethod
+    def bump_places_catalog_version(self) -> int:
+        """Увеличивает версию каталога мест"""
+        pass
+
+    @abstractmethod
+    def reserve_chatgpt_response(
+        self, day: str, user_id: int | None, daily_limit: int, user_daily_limit: int
+    ) -> bool:
+        """Атомарно занимает один ответ ChatGPT из дневной квоты; False, если квота исчерпана"""
+        pass
+
+    @abstractmethod
+    def release_chatgpt_response(self, day: str, user_id: int | None) -> None:
+        """Возвращает занятый ответ в дневную квоту"""
+        pass
+
+    @abstractmethod
+    def get_chatgpt_responses_count(self, day: str, user_id: int | None = None) -> int:
+        """Количество ответов ChatGPT за день: всего или у пользователя"""
+        pass
+
+    @abstractmethod
+    def get_generated_route(self, fingerprint: str) -> dict | None:
+        """Результат генерации маршрута для анкеты с таким отпечатком"""
+        pass
+
+    @abstractmethod
+    def set_generated_route(self, fingerprint: str, route_data: dict) -> None:
+        """Сохраняет результат генерации маршрута"""
+        pass
+
+    @abstractmethod
+    def create_generation_job(self, job_id: str, user_id: int, survey_id: int, status: str) -> None:
+        """Создаёт запись о задаче генерации маршрута"""
+        pass
+
+    @abstractmethod
+    def update_generation_job(self, job_id: str, status: str, **fields: str | int) -> None:
+        """Меняет статус задачи генерации и увеличивает её версию"""
+        pass
+
+    @abstractmethod
+    def get_generation_job(self, job_id: str) -> dict[str, str] | None:
+        """Состояние задачи генерации маршрута"""
+        pass
+
+    @abstractmethod
+    def take_rate_limit_token(self, name: str, rate: float, capacity: int) -> float:
+        """Берёт токен из общего ведра name; 0, если токен взят, иначе сколько секунд ждать"""
+        pass
+
+
+class AbstractAsyncRedisCache(RedisCacheMixin):
+    """Абстрактный класс для асинхронного кеша в Redis: те же операции, но корутины."""
+
+    @abstractmethod
+    async def ping(self) -> bool:
+        """Проверяет соединение с Redis и открывает его в пуле заранее"""
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Абстрактный метод для получения данных из кеша."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int = RedisCacheMixin.TTL) -> None:
+        """Абстрактный метод для записи данных в кеш."""
+        pass
+
+    @abstractmethod
+    async def get_code_by_phone(self, phone: str) -> str | None:
+        """Получает код по телефону"""
+        pass
+
+    @abstractmethod
+    async def set_code_by_phone(self, phone: str, code: int, ttl: int = RedisCacheMixin.TTL) -> str | None:
+        """Получает код по телефону"""
+        pass
+
+    @abstractmethod
+    async def delete_code_by_phone(self, phone: str) -> None:
+        """Удаляет код по телефону"""
+        pass
+
+    @abstractmethod
+    async def acquire_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        """Занимает блокировку генерации маршрута пользователя; False, если она уже занята"""
+        pass
+
+    @abstractmethod
+    async def extend_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        """Продлевает блокировку, если она принадлежит владельцу token"""
+        pass
+
+    @abstractmethod
+    async def release_route_generation_lock(self, user_id: int, token: str) -> bool:
+        """Снимает блокировку, если она принадлежит владельцу token"""
+        pass
+
+    @abstractmethod
+    async def get_places_catalog_version(self) -> int:
+        """Текущая версия каталога мест"""
+        pass
+
+    @abstractmethod
+    async def bump_places_catalog_version(self) -> int:
+        """Увеличивает версию каталога мест"""
+        pass
+
+    @abstractmethod
+    async def reserve_chatgpt_response(
+        self, day: str, user_id: int | None, daily_limit: int, user_daily_limit: int
+    ) -> bool:
+        """Атомарно занимает один ответ ChatGPT из дневной квоты; False, если квота исчерпана"""
+        pass
+
+    @abstractmethod
+    async def release_chatgpt_response(self, day: str, user_id: int | None) -> None:
+        """Возвращает занятый ответ в дневную квоту"""
+        pass
+
+    @abstractmethod
+    async def get_chatgpt_responses_count(self, day: str, user_id: int | None = None) -> int:
+        """Количество ответов ChatGPT за день: всего или у пользователя"""
+        pass
+
+    @abstractmethod
+    async def get_generated_route(self, fingerprint: str) -> dict | None:
+        """Результат генерации маршрута для анкеты с таким отпечатком"""
+        pass
+
+    @abstractmethod
+    async def set_generated_route(self, fingerprint: str, route_data: dict) -> None:
+        """Сохраняет результат генерации маршрута"""
+        pass
+
+    @abstractmethod
+    async def create_generation_job(self, job_id: str, user_id: int, survey_id: int, status: str) -> None:
+        """Создаёт запись о задаче генерации маршрута"""
+        pass
+
+    @abstractmethod
+    async def update_generation_job(self, job_id: str, status: str, **fields: str | int) -> None:
+        """Меняет статус задачи генерации и увеличивает её версию"""
         pass
 
     @abstractmethod
-    def unset_active_route_geration(self, user_id: int, ttl: int = TTL_MINIUTE) -> str | None:
-        """Сбрасывает флаг активной генерации маршрута"""
+    async def get_generation_job(self, job_id: str) -> dict[str, str] | None:
+        """Состояние задачи генерации маршрута"""
         pass
 
     @abstractmethod
-    def check_if_user_has_active_route_geration(self, user_id: int) -> bool:
-        """Проверяет, есть ли у пользователя активная генерация маршрута"""
+    async def take_rate_limit_token(self, name: str, rate: float, capacity: int) -> float:
+        """Берёт токен из общего ведра name; 0, если токен взят, иначе сколько секунд ждать"""
         pass
@@ -1,6 +1,20 @@
 from redis import Redis, from_url  # type: ignore
+from redis.asyncio import Redis as AsyncRedis  # type: ignore
+from redis.asyncio import from_url as async_from_url  # type: ignore
+
+from infrastructure.redis.async_redis_cache import AsyncRedisCache
 
 
 def init_redis_pool(host: str, password: str) -> Redis:
     session = from_url(host, password=password, encoding="utf-8", decode_responses=False)
     return session
+
+
+def init_async_redis_pool(host: str, password: str) -> AsyncRedis:
+    session = async_from_url(host, password=password, encoding="utf-8", decode_responses=False)
+    return session
+
+
+def init_async_redis_cache(host: str, password: str) -> AsyncRedisCache:
+    """Кеш на одном пуле соединений redis.asyncio на процесс"""
+    return AsyncRedisCache(init_async_redis_pool(host, password))
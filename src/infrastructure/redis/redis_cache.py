@@ -1,3 +1,5 @@
+import json
+
 from redis import Redis  # type: ignore
 
 from infrastructure.redis.base import AbstractRedisCache
@@ -20,29 +22,66 @@ class RedisCache(AbstractRedisCache):
 
     def get_code_by_phone(self, phone: str) -> str | None:
         """Получает код по телефону"""
-        key = f"sms_code:{phone}"
-        value = self._cache_connection.get(key)
+        value = self._cache_connection.get(self._sms_code_key(phone))
         return value.decode("utf-8") if value else None
 
     def set_code_by_phone(self, phone: str, code: int, ttl: int = AbstractRedisCache.TTL) -> str | None:
         """Сохраняет код по телефону"""
-        key = f"sms_code:{phone}"
-        self._cache_connection.setex(key, ttl, code)
+        self._cache_connection.setex(self._sms_code_key(phone), ttl, code)
 
     def delete_code_by_phone(self, phone: str) -> None:
         """Удаляет код по телефону"""
-        keys = [f"sms_code:{phone}"]
-        self._cache_connection.delete(*keys)
+        self._cache_connection.delete(self._sms_code_key(phone))
+
+    def acquire_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        key = self._generation_lock_key(user_id)
+        return bool(self._cache_connection.set(key, token, nx=True, ex=ttl))
+
+    def extend_route_generation_lock(self, user_id: int, token: str, ttl: int) -> bool:
+        return bool(self._cache_connection.eval(*self._extend_lock_eval(user_id, token, ttl)))
+
+    def release_route_generation_lock(self, user_id: int, token: str) -> bool:
+        return bool(self._cache_connection.eval(*self._release_lock_eval(user_id, token)))
+
+    def get_places_catalog_version(self) -> int:
+        return self._to_int(self._cache_connection.get(self.PLACES_CATALOG_VERSION_KEY))
+
+    def bump_places_catalog_version(self) -> int:
+        return self._cache_connection.incr(self.PLACES_CATALOG_VERSION_KEY)
+
+    def reserve_chatgpt_response(
+        self, day: str, user_id: int | None, daily_limit: int, user_daily_limit: int
+    ) -> bool:
+        args = self._reserve_quota_eval(day, user_id, daily_limit, user_daily_limit)
+        return bool(self._cache_connection.eval(*args))
+
+    def release_chatgpt_response(self, day: str, user_id: int | None) -> None:
+        self._cache_connection.eval(*self._release_quota_eval(day, user_id))
+
+    def get_chatgpt_responses_count(self, day: str, user_id: int | None = None) -> int:
+        return self._to_int(self._cache_connection.get(self._chatgpt_quota_keys(day, user_id)[-1]))
+
+    def get_generated_route(self, fingerprint: str) -> dict | None:
+        value = self._cache_connection.get(self._generated_route_key(fingerprint))
+        return json.loads(value) if value else None
+
+    def set_generated_route(self, fingerprint: str, route_data: dict) -> None:
+        value = json.dumps(route_data, ensure_ascii=False)
+        key = self._generated_route_key(fingerprint)
+        self._cache_connection.setex(key, self.GENERATED_ROUTE_TTL, value)
+
+    def create_generation_job(self, job_id: str, user_id: int, survey_id: int, status: str) -> None:
+        pipeline = self._cache_connection.pipeline()
+        self._queue_create_generation_job(pipeline, job_id, user_id, survey_id, status)
+        pipeline.execute()
 
-    def set_active_route_geration(self, user_id: int, ttl: int = AbstractRedisCache.TTL_MINIUTE) -> None:
-        key = f"active_generation:{user_id}"
-        self._cache_connection.setex(key, ttl, "1")  # строка вместо bool
+    def update_generation_job(self, job_id: str, status: str, **fields: str | int) -> None:
+        pipeline = self._cache_connection.pipeline()
+        self._queue_update_generation_job(pipeline, job_id, status, fields)
+        pipeline.execute()
 
-    def unset_active_route_geration(self, user_id: int, ttl: int = AbstractRedisCache.TTL_MINIUTE) -> None:
-        key = f"active_generation:{user_id}"
-        self._cache_connection.setex(key, ttl, "0")  # строка вместо bool
+    def get_generation_job(self, job_id: str) -> dict[str, str] | None:
+        return self._decode_generation_job(self._cache_connection.hgetall(self._generation_job_key(job_id)))
 
-    def check_if_user_has_active_route_geration(self, user_id: int) -> bool:
-        key = f"active_generation:{user_id}"
-        value = self._cache_connection.get(key)
-        return value == b"1"
+    def take_rate_limit_token(self, name: str, rate: float, capacity: int) -> float:
+        return float(self._cache_connection.eval(*self._take_token_eval(name, rate, capacity)))
@@ -0,0 +1,60 @@
+# Проверка всех лимитов и увеличение счётчиков одной операцией: KEYS - счётчики, ARGV - TTL и лимиты
+RESERVE_QUOTA_SCRIPT = """
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[i + 1])
+    if limit > 0 and tonumber(redis.call('GET', key) or '0') >= limit then
+        return 0
+    end
+end
+for _, key in ipairs(KEYS) do
+    redis.call('INCR', key)
+    redis.call('EXPIRE', key, ARGV[1])
+end
+return 1
+"""
+
+# Продление и снятие блокировки только её владельцем: KEYS[1] - блокировка, ARGV[1] - токен владельца
+EXTEND_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Token bucket: KEYS[1] - ведро, ARGV - скорость пополнения (токенов в секунду) и ёмкость.
+# Время берётся на сервере Redis, поэтому часы воркеров не влияют на лимит.
+# Возвращает 0, если токен взят, иначе сколько секунд ждать следующего токена
+TAKE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+RELEASE_QUOTA_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if tonumber(redis.call('GET', key) or '0') > 0 then
+        redis.call('DECR', key)
+    end
+end
+"""
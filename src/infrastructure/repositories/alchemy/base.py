@@ -1,10 +1,12 @@
 from typing import Any, Type, TypeVar
 
+from fastapi import Request
 from pydantic import BaseModel
 from sqlalchemy import (
     JSON,
     Result,
     ScalarResult,
+    Select,
     String,
     and_,
     cast,
@@ -13,6 +15,7 @@ from sqlalchemy import (
     exists,
     func,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +24,8 @@ from sqlalchemy.sql.sqltypes import Enum as SAEnum
 
 from common.exceptions import APIException
 from domain.entities.model import Model
+from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.paginator import Paginator, decode_cursor
 from infrastructure.models.alchemy.base import Base
 from infrastructure.repositories.interfaces.base import ModelRepository, Repository
 
@@ -37,6 +42,8 @@ class SqlAlchemyRepository(Repository):
 class SqlAlchemyModelRepository(SqlAlchemyRepository, ModelRepository[TModel]):
     ENTITY: Type[Model]
     LIST_DTO: Type[BaseModel]
+    # Направление ленты для keyset-пагинации по (created_at, id)
+    CURSOR_DESC: bool = False
 
     async def get_field_values(
         self,
@@ -120,10 +127,39 @@ class SqlAlchemyModelRepository(SqlAlchemyRepository, ModelRepository[TModel]):
         return [self.LIST_DTO.model_validate(obj) for obj in objects]
 
     async def get_list_models(self, **filters: Any) -> Result:
-        stmt = select(self.MODEL).filter_by(**filters)
+        stmt = self.get_list_models_stmt(**filters)
         result = await self._session.execute(stmt)
         return result
 
+    def get_list_models_stmt(self, **filters: Any) -> Select:
+        return select(self.MODEL).filter_by(**filters).order_by(self.MODEL.id)
+
+    async def paginate(
+        self,
+        stmt: Select,
+        schema_read: Type[BaseModel],
+        request: Request,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse:
+        """Выполнить запрос постранично (LIMIT/OFFSET + COUNT)"""
+        return await Paginator(schema_read).paginate(self._session, stmt, request, page, page_size)
+
+    async def paginate_by_cursor(
+        self,
+        stmt: Select,
+        schema_read: Type[BaseModel],
+        request: Request,
+        page_size: int = 10,
+        cursor: str | None = None,
+    ) -> PaginatedResponse:
+        """Выполнить запрос постранично по курсору: строки строго после (created_at, id) курсора"""
+        if cursor:
+            key = tuple_(self.MODEL.created_at, self.MODEL.id)
+            value = tuple_(*decode_cursor(cursor))
+            stmt = stmt.where(key < value if self.CURSOR_DESC else key > value)
+        return await Paginator(schema_read).paginate_by_cursor(self._session, stmt, request, page_size)
+
     async def get_list_by_ids(
         self,
         id_list: list[int],
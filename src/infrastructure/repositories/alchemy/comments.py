@@ -1,6 +1,6 @@
 from typing import Any, List
 
-from sqlalchemy import Result, desc, func, select
+from sqlalchemy import Select, desc, func, select
 from sqlalchemy.orm import joinedload
 
 from application.use_cases.comments.dto import CommentBaseDTO, CommentDTO
@@ -68,17 +68,16 @@ class SqlAlchemyCommentsRepository(SqlAlchemyModelRepository[Comment], CommentRe
             raise APIException(code=404, message=f"Комментарий c id={model_id} не найден")
         return self.convert_to_entity(model)
 
-    async def get_list_models(self, **filters: Any) -> Result:
-        """Получить коментарии по фильтрам"""
-        stmt = (
+    def get_list_models_stmt(self, **filters: Any) -> Select:
+        """Получить запрос на коментарии по фильтрам"""
+        return (
             select(CommentModel)
             .filter_by(**filters)
             .options(
                 joinedload(CommentModel.author),
             )
-            .order_by(desc(CommentModel.timestamp))
+            .order_by(desc(CommentModel.timestamp), desc(CommentModel.id))
         )
-        return await self._session.execute(stmt)
 
     def convert_to_model(self, entity: Comment) -> CommentModel:
         return CommentModel(
@@ -0,0 +1,74 @@
+from fastapi import Request
+from sqlalchemy import ColumnElement, Select, String, cast, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.dto import SEARCHABLE_MODEL_TYPES, SearchFiltersDTO, SearchResultRead
+from domain.entities.enums import ModelType
+from domain.validators.dto import PaginatedResponse
+from infrastructure.managers.paginator import Paginator
+from infrastructure.models.alchemy.base import SEARCH_CONFIG
+from infrastructure.models.alchemy.posts import Post
+from infrastructure.models.alchemy.routes import Place, Route
+from infrastructure.repositories.interfaces.search import SearchRepository
+
+
+class SqlAlchemySearchRepository(SearchRepository):
+    """
+    Полнотекстовый поиск по хранимым tsvector-колонкам (GIN-индексы).
+    Места, маршруты и посты объединяются в одну выдачу через UNION ALL и сортируются по ts_rank_cd.
+    Маршруты и посты попадают в выдачу только для опубликованных маршрутов, как и в ленте.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def get_search_stmt(self, filters: SearchFiltersDTO) -> Select:
+        query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), filters.q)
+        types = filters.types or SEARCHABLE_MODEL_TYPES
+
+        selects = []
+        if ModelType.PLACES in types:
+            stmt = self._select(ModelType.PLACES, Place, Place.name, query)
+            if filters.city:
+                stmt = stmt.where(Place.city == filters.city)
+            selects.append(stmt)
+
+        if ModelType.ROUTES in types:
+            stmt = self._select(ModelType.ROUTES, Route, Route.name, query)
+            stmt = stmt.where(Route.is_publicated.is_(True))
+            if filters.city:
+                stmt = stmt.where(Route.city == filters.city)
+            selects.append(stmt)
+
+        if ModelType.POSTS in types:
+            stmt = self._select(ModelType.POSTS, Post, Post.title, query)
+            stmt = stmt.join(Route, Route.id == Post.route_id).where(Route.is_publicated.is_(True))
+            if filters.city:
+                stmt = stmt.where(Route.city == filters.city)
+            selects.append(stmt)
+
+        results = union_all(*selects).subquery("search_results")
+        return select(results).order_by(results.c.rank.desc(), results.c.type, results.c.id)
+
+    async def paginate(
+        self,
+        stmt: Select,
+        request: Request,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse[SearchResultRead]:
+        return await Paginator(SearchResultRead).paginate(
+            self._session, stmt, request, page, page_size, scalars=False
+        )
+
+    @staticmethod
+    def _select(model_type: ModelType, model, title: ColumnElement, query: ColumnElement) -> Select:
+        return select(
+            cast(literal(model_type.value), String).label("type"),
+            model.id.label("id"),
+            title.label("title"),
+            model.description.label("description"),
+            model.photo.label("photo"),
+            func.ts_rank_cd(model.search_vector, query).label("rank"),
+        ).where(model.search_vector.op("@@")(query))
@@ -1,15 +1,20 @@
+import math
 from typing import List
 
-from sqlalchemy import Result, Select, func, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import ColumnElement, Integer, Select, cast, false, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import noload, selectinload
 
 from application.use_cases.places.dto import PlaceDTO
-from common.dto import PlacesFiltersDTO
+from common.dto import PlaceCandidatesFiltersDTO, PlacesFiltersDTO
+from common.geo import DEFAULT_RADIUS_M, EARTH_RADIUS_M, radius_bbox
 from domain.entities.place import Place
+from infrastructure.models.alchemy.base import SEARCH_CONFIG
 from infrastructure.models.alchemy.routes import Photo
 from infrastructure.models.alchemy.routes import Place as PlaceModel
 from infrastructure.models.alchemy.routes import Route, RoutePlace
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.alchemy.search import contains
 from infrastructure.repositories.interfaces import PlaceRepository
 
 
@@ -32,10 +37,15 @@ class SqlAlchemyPlacesRepository(SqlAlchemyModelRepository[Place], PlaceReposito
         place_models = [rp.place for rp in route.places if rp.place]
         return [self.convert_to_entity(place_model) for place_model in place_models]
 
-    async def get_list_by_filters(self, filters: PlacesFiltersDTO) -> Result:
-        stmt = self._create_stmt_by_filters(filters)
-        result = await self._session.execute(stmt)
-        return result
+    async def get_list_by_city(self, city: str) -> List[Place]:
+        """Получить все места города"""
+        stmt = select(PlaceModel).options(noload(PlaceModel.photos)).where(PlaceModel.city == city)
+        result = await self._session.scalars(stmt.order_by(PlaceModel.id))
+        return [self.convert_to_entity(model) for model in result.all()]
+
+    async def get_stmt_by_filters(self, filters: PlacesFiltersDTO) -> Select:
+        """Получить запрос на места по фильтрам"""
+        return self._create_stmt_by_filters(filters)
 
     def _create_stmt_by_filters(self, filters: PlacesFiltersDTO) -> Select:
         """Получить места по фильтрам"""
@@ -60,16 +70,32 @@ class SqlAlchemyPlacesRepository(SqlAlchemyModelRepository[Place], PlaceReposito
         if filters.get("types"):
             stmt = stmt.where(MODEL.type.in_(filters.get("types")))
 
-        # Фильтр по имени с ilike
+        # Фильтр по подстроке имени (триграммный индекс)
         name = filters.get("name")
         if name:
-            stmt = stmt.where(MODEL.name.ilike(f"%{name}%"))
+            stmt = stmt.where(contains(MODEL.name, name))
 
         # Фильтр по аватарке
         has_avatar = filters.get("has_avatar")
         if has_avatar is not None:
             stmt = stmt.where(MODEL.photo.isnot(None) if has_avatar else MODEL.photo.is_(None))
 
+        # Фильтр по области карты (GiST-индекс по point(longitude, latitude))
+        if bbox := filters.get("bbox"):
+            stmt = stmt.where(self._in_bbox(*bbox))
+
+        # Фильтр по радиусу: индексный предфильтр по описанному прямоугольнику + точный haversine
+        if near := filters.get("near"):
+            lat, lon = near
+            radius = filters.get("radius", DEFAULT_RADIUS_M)
+            distance = self._distance_to(lat, lon)
+            stmt = (
+                stmt.where(self._in_bbox(*radius_bbox(lat, lon, radius)))
+                .where(distance <= radius)
+                .order_by(None)
+                .order_by(distance, MODEL.id)
+            )
+
         # Фильтр по наличию связанных фото
         if filters.get("has_photos"):
             stmt = (
@@ -79,6 +105,60 @@ class SqlAlchemyPlacesRepository(SqlAlchemyModelRepository[Place], PlaceReposito
             )
         return stmt
 
+    async def get_candidates(self, filters: PlaceCandidatesFiltersDTO) -> List[Place]:
+        """
+        Места-кандидаты для генерации маршрута, самые подходящие первыми.
+        Релевантность: совпадение категории и типа плюс ts_rank_cd по ключевым словам.
+        Из каждой категории берётся не больше per_category мест, явно выбранные места попадают всегда.
+        """
+        MODEL = PlaceModel
+        pinned = MODEL.id.in_(filters.place_ids) if filters.place_ids else false()
+
+        terms = []
+        if filters.categories:
+            terms.append(cast(MODEL.category.in_(filters.categories), Integer))
+        if filters.types:
+            terms.append(cast(func.coalesce(MODEL.type.in_(filters.types), false()), Integer))
+        if filters.keywords:
+            query = func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), " | ".join(filters.keywords))
+            terms.append(func.ts_rank_cd(MODEL.search_vector, query))
+        score = sum(terms[1:], terms[0]) if terms else literal_column("0")
+
+        rn = func.row_number().over(partition_by=MODEL.category, order_by=(score.desc(), MODEL.id))
+        ranked = select(MODEL.id, score.label("score"), rn.label("rn"))
+        if filters.city:
+            ranked = ranked.where(or_(MODEL.city == filters.city, pinned))
+        if filters.strict and (filters.categories or filters.types):
+            ranked = ranked.where(
+                or_(MODEL.category.in_(filters.categories), MODEL.type.in_(filters.types), pinned)
+            )
+        ranked = ranked.subquery()
+
+        stmt = (
+            select(MODEL)
+            .options(noload(MODEL.photos))
+            .join(ranked, ranked.c.id == MODEL.id)
+            .where(or_(ranked.c.rn <= filters.per_category, pinned))
+            .order_by(pinned.desc(), ranked.c.score.desc(), MODEL.id)
+            .limit(filters.limit)
+        )
+        result = await self._session.scalars(stmt)
+        return [self.convert_to_entity(model) for model in result.all()]
+
+    @staticmethod
+    def _in_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> ColumnElement[bool]:
+        location = func.point(PlaceModel.longitude, PlaceModel.latitude)
+        return location.op("<@")(func.box(func.point(min_lon, min_lat), func.point(max_lon, max_lat)))
+
+    @staticmethod
+    def _distance_to(lat: float, lon: float) -> ColumnElement[float]:
+        """Расстояние в метрах от места до точки по формуле haversine"""
+        sin_lat = func.sin(func.radians(PlaceModel.latitude - lat) * 0.5)
+        sin_lon = func.sin(func.radians(PlaceModel.longitude - lon) * 0.5)
+        cos_lat = math.cos(math.radians(lat)) * func.cos(func.radians(PlaceModel.latitude))
+        a = sin_lat * sin_lat + cos_lat * sin_lon * sin_lon
+        return 2 * EARTH_RADIUS_M * func.asin(func.sqrt(a))
+
     def convert_to_model(self, entity: Place) -> PlaceModel:
         return PlaceModel(
             id=entity.id,
@@ -1,20 +1,22 @@
 from typing import Any
 
-from sqlalchemy import Result, Select, desc, func, select
+from sqlalchemy import Select, desc, select
 from sqlalchemy.orm import joinedload, selectinload
 
 from common.dto import PostsFiltersDTO
 from common.exceptions import APIException
 from domain.entities.post import Post
 from infrastructure.models.alchemy.posts import Post as PostModel
-from infrastructure.models.alchemy.routes import Photo, Place, Route, RoutePlace
+from infrastructure.models.alchemy.routes import Place, Route, RoutePlace, RouteStats
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.alchemy.search import contains
 from infrastructure.repositories.interfaces.post import PostRepository
 
 
 class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository):
     MODEL = PostModel
     ENTITY = Post
+    CURSOR_DESC = True
 
     async def create(self, data: Post) -> Post:
         model = self.convert_to_model(data)
@@ -48,33 +50,32 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
             )
         return self.convert_to_entity(model)
 
-    async def get_list_models(self, **filters: Any) -> Result:
-        """Получить список постов по фильтрам"""
-        stmt = (
+    def get_list_models_stmt(self, **filters: Any) -> Select:
+        """Получить запрос на список постов по фильтрам"""
+        return (
             select(PostModel)
             .filter_by(**filters)
             .options(
                 joinedload(PostModel.author),
                 joinedload(PostModel.route),
             )
-            .order_by(desc(PostModel.created_at))
+            .order_by(desc(PostModel.created_at), desc(PostModel.id))
         )
-        return await self._session.execute(stmt)
 
-    async def get_list_by_filters(self, filters: PostsFiltersDTO) -> Result:
-        """Получить маршруты по фильтрам"""
-        stmt = await self._create_stmt_by_filters(filters)
-        result = await self._session.execute(stmt)
-        return result
+    async def get_stmt_by_filters(self, filters: PostsFiltersDTO) -> Select:
+        """Получить запрос на посты по фильтрам"""
+        return await self._create_stmt_by_filters(filters)
 
     async def _create_stmt_by_filters(self, filters: PostsFiltersDTO) -> Select:
         MODEL = PostModel
         ROUTE = Route
 
+        STATS = RouteStats
+
         stmt = (
             select(MODEL)
             .join(ROUTE, ROUTE.id == MODEL.route_id)
-            .outerjoin(Photo, Photo.route_id == ROUTE.id)
+            .join(STATS, STATS.route_id == ROUTE.id)
             .options(
                 joinedload(MODEL.author),
                 joinedload(MODEL.route)
@@ -82,22 +83,21 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
                 .joinedload(RoutePlace.place)
                 .joinedload(Place.photos),
             )
-            .group_by(MODEL.id, ROUTE.id)
-            .order_by(MODEL.created_at.desc())
+            .order_by(MODEL.created_at.desc(), MODEL.id.desc())
         )
 
         raw_filters = filters.model_dump(exclude_unset=True)
 
         # --- фильтры по посту ---
         if title := raw_filters.get("title"):
-            stmt = stmt.where(MODEL.title.ilike(f"%{title}%"))
+            stmt = stmt.where(contains(MODEL.title, title))
 
         if desc := raw_filters.get("description"):
-            stmt = stmt.where(MODEL.description.ilike(f"%{desc}%"))
+            stmt = stmt.where(contains(MODEL.description, desc))
 
         # --- фильтры по маршруту ---
         if route_name := raw_filters.get("route_name"):
-            stmt = stmt.where(ROUTE.name.ilike(f"%{route_name}%"))
+            stmt = stmt.where(contains(ROUTE.name, route_name))
 
         if city := raw_filters.get("city"):
             stmt = stmt.where(ROUTE.city == city)
@@ -114,16 +114,15 @@ class SqlAlchemyPostsRepository(SqlAlchemyModelRepository[Post], PostRepository)
 
         # наличие связанных фото маршрута
         if raw_filters.get("has_photos"):
-            stmt = stmt.having(func.count(func.distinct(Photo.id)) > 0)
+            stmt = stmt.where(STATS.photo_count > 0)
 
         # фильтры по количеству мест маршрута
-        place_count_expr = func.count(func.distinct(RoutePlace.place_id))
         if (val := raw_filters.get("places_count")) is not None:
-            stmt = stmt.having(place_count_expr == val)
+            stmt = stmt.where(STATS.place_count == val)
         if (val := raw_filters.get("places_gte")) is not None:
-            stmt = stmt.having(place_count_expr >= val)
+            stmt = stmt.where(STATS.place_count >= val)
         if (val := raw_filters.get("places_lte")) is not None:
-            stmt = stmt.having(place_count_expr <= val)
+            stmt = stmt.where(STATS.place_count <= val)
 
         return stmt
 
@@ -39,6 +39,23 @@ class SqlAlchemyRoutePlacesRepository(SqlAlchemyModelRepository[RoutePlaces], Ro
         stmt = update(self.MODEL).where(self.MODEL.place_id == place_id).values(order=order)
         await self._session.execute(stmt)
 
+    async def get_list_by_route_id(self, route_id: int) -> list[RoutePlaces]:
+        """Получить места маршрута в порядке посещения"""
+        stmt = (
+            select(RoutePlaceModel)
+            .where(RoutePlaceModel.route_id == route_id)
+            .order_by(RoutePlaceModel.order, RoutePlaceModel.id)
+        )
+        result = await self._session.execute(stmt)
+        return [self.convert_to_entity(m) for m in result.scalars().all()]
+
+    async def update_orders(self, orders: dict[int, int]) -> None:
+        """Изменить порядок мест маршрута: id записи RoutePlace -> порядок"""
+        for route_place_id, order in orders.items():
+            await self._session.execute(
+                update(self.MODEL).where(self.MODEL.id == route_place_id).values(order=order)
+            )
+
     async def get_last_order_by_route_id(self, route_id: int) -> int:
         stmt = select(func.max(RoutePlaceModel.order)).where(RoutePlaceModel.route_id == route_id)
         result = await self._session.execute(stmt)
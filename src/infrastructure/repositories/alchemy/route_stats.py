@@ -0,0 +1,63 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from domain.entities.route_stats import RouteStats
+from infrastructure.models.alchemy.routes import Comment, Like, Photo, RoutePlace
+from infrastructure.models.alchemy.routes import RouteStats as RouteStatsModel
+from infrastructure.repositories.alchemy.base import SqlAlchemyRepository
+from infrastructure.repositories.interfaces.route_stats import RouteStatsRepository
+
+
+class SqlAlchemyRouteStatsRepository(SqlAlchemyRepository, RouteStatsRepository):
+    """
+    Денормализованные счётчики маршрута для фильтров ленты.
+    Пересчитываются целиком по route_id, поэтому повторный вызов безопасен.
+    """
+
+    MODEL = RouteStatsModel
+
+    async def get_by_route_id(self, route_id: int) -> RouteStats | None:
+        stmt = select(RouteStatsModel).where(RouteStatsModel.route_id == route_id)
+        model = await self._session.scalar(stmt)
+        return self.convert_to_entity(model) if model else None
+
+    async def refresh(self, route_id: int | None) -> None:
+        if route_id is None:
+            return
+
+        counts = {
+            "place_count": select(func.count(func.distinct(RoutePlace.place_id)))
+            .where(RoutePlace.route_id == route_id)
+            .scalar_subquery(),
+            "photo_count": select(func.count(Photo.id)).where(Photo.route_id == route_id).scalar_subquery(),
+            "like_count": select(func.count(Like.id)).where(Like.route_id == route_id).scalar_subquery(),
+            "comment_count": select(func.count(Comment.id))
+            .where(Comment.route_id == route_id)
+            .scalar_subquery(),
+        }
+        stmt = insert(RouteStatsModel).values(route_id=route_id, **counts)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RouteStatsModel.route_id],
+            set_={field: stmt.excluded[field] for field in counts},
+        )
+        await self._session.execute(stmt)
+
+    def convert_to_model(self, entity: RouteStats) -> RouteStatsModel:
+        return RouteStatsModel(
+            id=entity.id,
+            route_id=entity.route_id,
+            place_count=entity.place_count,
+            photo_count=entity.photo_count,
+            like_count=entity.like_count,
+            comment_count=entity.comment_count,
+        )
+
+    def convert_to_entity(self, model: RouteStatsModel) -> RouteStats:
+        return RouteStats(
+            id=model.id,
+            route_id=model.route_id,
+            place_count=model.place_count,
+            photo_count=model.photo_count,
+            like_count=model.like_count,
+            comment_count=model.comment_count,
+        )
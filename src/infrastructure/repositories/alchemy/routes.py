@@ -1,15 +1,18 @@
 from typing import Any
 
-from sqlalchemy import Result, Select, desc, func, select
+from sqlalchemy import Select, desc, select, update
 from sqlalchemy.orm import joinedload, selectinload
 
 from application.use_cases.routes.dto import RouteFeedFiltersDTO
 from common.exceptions import APIException
+from common.geo import route_duration, route_length
+from common.maps import build_yandex_maps_url
 from domain.entities.route import Route
-from infrastructure.models.alchemy.routes import Photo, Place
+from infrastructure.models.alchemy.routes import Place
 from infrastructure.models.alchemy.routes import Route as RouteModel
-from infrastructure.models.alchemy.routes import RoutePlace
+from infrastructure.models.alchemy.routes import RoutePlace, RouteStats
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.alchemy.search import contains
 from infrastructure.repositories.interfaces.route import RouteRepository
 
 
@@ -37,9 +40,26 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
             )
         return self.convert_to_entity(model)
 
-    async def get_list_models(self, **filters: Any) -> Result:
-        """Получить маршруты по фильтрам"""
+    async def get_list_by_ids(self, id_list: list[int]) -> list[Route]:
+        """Получить маршруты по списку id вместе с автором, фото и местами"""
+        if not id_list:
+            return []
+
         stmt = (
+            select(RouteModel)
+            .where(RouteModel.id.in_(id_list))
+            .options(
+                joinedload(RouteModel.author),
+                joinedload(RouteModel.photos),
+                joinedload(RouteModel.places).joinedload(RoutePlace.place).joinedload(Place.photos),
+            )
+        )
+        result = await self._session.execute(stmt)
+        return [self.convert_to_entity(model) for model in result.unique().scalars().all()]
+
+    def get_list_models_stmt(self, **filters: Any) -> Select:
+        """Получить запрос на маршруты по фильтрам"""
+        return (
             select(RouteModel)
             .filter_by(**filters)
             .options(
@@ -47,18 +67,16 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
                 joinedload(RouteModel.photos),
                 joinedload(RouteModel.places).joinedload(RoutePlace.place).joinedload(Place.photos),
             )
-            .order_by(desc(RouteModel.created_at))
+            .order_by(desc(RouteModel.created_at), desc(RouteModel.id))
         )
-        return await self._session.execute(stmt)
 
-    async def get_list_by_filters(self, filters: RouteFeedFiltersDTO, add_filters: Any) -> Result:
-        """Получить маршруты по фильтрам"""
-        stmt = await self._create_stmt_by_filters(filters, add_filters)
-        result = await self._session.execute(stmt)
-        return result
+    async def get_stmt_by_filters(self, filters: RouteFeedFiltersDTO, add_filters: Any) -> Select:
+        """Получить запрос на маршруты по фильтрам"""
+        return await self._create_stmt_by_filters(filters, add_filters)
 
     async def _create_stmt_by_filters(self, filters: RouteFeedFiltersDTO, add_filters: Any) -> Select:
         MODEL = RouteModel
+        STATS = RouteStats
         stmt = (
             select(MODEL)
             .filter_by(**add_filters)
@@ -66,10 +84,9 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
                 selectinload(MODEL.places),
                 selectinload(MODEL.photos),
             )
-            .outerjoin(Photo, Photo.route_id == MODEL.id)
-            .join(RoutePlace, RoutePlace.route_id == MODEL.id)
-            .group_by(MODEL.id)
-            .order_by(MODEL.created_at.asc())
+            .join(STATS, STATS.route_id == MODEL.id)
+            .where(STATS.place_count > 0)
+            .order_by(MODEL.created_at.asc(), MODEL.id.asc())
         )
 
         raw_filters = filters.model_dump(exclude_unset=True)
@@ -85,10 +102,10 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
             if value is not None:
                 stmt = stmt.where(model_field == value)
 
-        # Фильтр по имени с ilike
+        # Фильтр по подстроке имени (триграммный индекс)
         name = raw_filters.get("name")
         if name:
-            stmt = stmt.where(MODEL.name.ilike(f"%{name}%"))
+            stmt = stmt.where(contains(MODEL.name, name))
 
         # Фильтр по аватарке
         has_avatar = raw_filters.get("has_avatar")
@@ -97,19 +114,73 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
 
         # Фильтр по наличию связанных фото
         if raw_filters.get("has_photos"):
-            stmt = stmt.having(func.count(func.distinct(Photo.id)) > 0)
+            stmt = stmt.where(STATS.photo_count > 0)
 
         # Фильтры по количеству мест
-        place_count_expr = func.count(func.distinct(RoutePlace.place_id))
         if (val := raw_filters.get("places_count")) is not None:
-            stmt = stmt.having(place_count_expr == val)
+            stmt = stmt.where(STATS.place_count == val)
         if (val := raw_filters.get("places_gte")) is not None:
-            stmt = stmt.having(place_count_expr >= val)
+            stmt = stmt.where(STATS.place_count >= val)
         if (val := raw_filters.get("places_lte")) is not None:
-            stmt = stmt.having(place_count_expr <= val)
+            stmt = stmt.where(STATS.place_count <= val)
+
+        # Фильтры по длине (м) и времени в пути (мин)
+        if (val := raw_filters.get("distance_gte")) is not None:
+            stmt = stmt.where(MODEL.distance >= val)
+        if (val := raw_filters.get("distance_lte")) is not None:
+            stmt = stmt.where(MODEL.distance <= val)
+        if (val := raw_filters.get("duration_gte")) is not None:
+            stmt = stmt.where(MODEL.duration >= val)
+        if (val := raw_filters.get("duration_lte")) is not None:
+            stmt = stmt.where(MODEL.duration <= val)
 
         return stmt
 
+    async def create(self, data: Route) -> Route:
+        """Создать маршрут вместе с пустой строкой статистики"""
+        route = await super().create(data)
+        self._session.add(RouteStats(route_id=route.id))
+        await self._session.flush()
+        return route
+
+    async def refresh_metrics(self, route_id: int | None) -> None:
+        """Пересчитать длину (м), время в пути (мин) и ссылку на Яндекс.Карты по упорядоченным местам"""
+        if route_id is None:
+            return
+
+        route_type = await self._session.scalar(select(RouteModel.type).where(RouteModel.id == route_id))
+        if route_type is None:
+            return
+
+        stmt = (
+            select(Place.latitude, Place.longitude, Place.object_id)
+            .join(RoutePlace, RoutePlace.place_id == Place.id)
+            .where(RoutePlace.route_id == route_id)
+            .order_by(RoutePlace.order, RoutePlace.id)
+        )
+        result = await self._session.execute(stmt)
+        points = [
+            ([lat, lon] if lat is not None and lon is not None else None, object_id)
+            for lat, lon, object_id in result.all()
+        ]
+        distance = route_length([coordinates for coordinates, _ in points])
+
+        await self._session.execute(
+            update(RouteModel)
+            .where(RouteModel.id == route_id)
+            .values(
+                distance=round(distance),
+                duration=route_duration(distance, route_type),
+                yandex_maps_url=build_yandex_maps_url(points, route_type),
+            )
+        )
+
+    async def refresh_metrics_by_place(self, place_id: int) -> None:
+        """Координаты и object_id места входят в метрики и ссылку каждого маршрута с этим местом"""
+        stmt = select(RoutePlace.route_id).where(RoutePlace.place_id == place_id).distinct()
+        for route_id in await self._session.scalars(stmt):
+            await self.refresh_metrics(route_id)
+
     async def copy(self, route: Route, user_id: int) -> Route:
         """Скопировать маршрут в мои маршруты"""
         route.author_id = user_id
@@ -123,6 +194,7 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
             id=entity.id,
             city=entity.city,
             name=entity.name,
+            type=entity.type,
             description=entity.description,
             photo=entity.photo,
             author_id=entity.author_id,
@@ -132,6 +204,7 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
             distance=entity.distance,
             is_publicated=entity.is_publicated,
             json_data=entity.json_data,
+            yandex_maps_url=entity.yandex_maps_url,
         )
 
     def convert_to_entity(self, model: RouteModel) -> Route:
@@ -146,7 +219,9 @@ class SqlAlchemyRoutesRepository(SqlAlchemyModelRepository[Route], RouteReposito
             updated_at=model.updated_at,
             duration=model.duration,
             distance=model.distance,
+            type=model.type,
             json_data=model.json_data,
+            yandex_maps_url=model.yandex_maps_url,
             is_publicated=model.is_publicated,
             places=[place for place in model.places] if model.places else [],
             photos=[photo for photo in model.photos] if model.photos else [],
@@ -0,0 +1,22 @@
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import InstrumentedAttribute
+
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(value: str) -> str:
+    """Экранирует спецсимволы LIKE, чтобы `%` и `_` из запроса искались буквально"""
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def contains(column: InstrumentedAttribute, value: str) -> ColumnElement[bool]:
+    """
+    Поиск подстроки без учёта регистра.
+    ILIKE '%...%' обслуживается GIN-индексом с gin_trgm_ops (расширение pg_trgm),
+    поэтому не требует последовательного сканирования таблицы.
+    """
+    return column.ilike(f"%{escape_like(value.strip())}%", escape=LIKE_ESCAPE)
@@ -1,11 +1,12 @@
 from datetime import date
 from typing import List, Optional
 
-from sqlalchemy import delete, exists, select, update
+from sqlalchemy import Select, delete, exists, or_, select, update
 
 from domain.entities.user import User
 from infrastructure.models.alchemy.users import User as UserModel
 from infrastructure.repositories.alchemy.base import SqlAlchemyModelRepository
+from infrastructure.repositories.alchemy.search import contains
 from infrastructure.repositories.interfaces import UserRepository
 
 
@@ -22,6 +23,14 @@ class SqlAlchemyUsersRepository(SqlAlchemyModelRepository[User], UserRepository)
         else:
             return None
 
+    def get_stmt_by_name(self, name: Optional[str] = None) -> Select:
+        stmt = self.get_list_models_stmt()
+        if name:
+            stmt = stmt.where(
+                or_(contains(self.MODEL.first_name, name), contains(self.MODEL.last_name, name))
+            )
+        return stmt
+
     async def get_list(self) -> List[User]:
         stmt = select(self.MODEL)
         return await self._session.execute(stmt)
@@ -1,10 +1,28 @@
 from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Optional
 
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
 from infrastructure.managers.ChatGPT.dto import ChatGPTContentData
 
+# Получает ID мест, которые модель уже выбрала, пока ответ ещё генерируется
+ProgressCallback = Callable[[list[int]], Awaitable[Any]]
+
 
 class ClassificationManager(ABC):
     @abstractmethod
-    def generate_route(self, route_data: ChatGPTContentData, mode: Mode = Mode.FULL) -> dict:
+    def generate_route(
+        self, route_data: ChatGPTContentData, mode: Mode = Mode.FULL, user_id: int | None = None
+    ) -> dict:
+        pass
+
+
+class AsyncClassificationManager(ABC):
+    @abstractmethod
+    async def generate_route(
+        self,
+        route_data: ChatGPTContentData,
+        mode: Mode = Mode.FULL,
+        user_id: int | None = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> dict:
         pass
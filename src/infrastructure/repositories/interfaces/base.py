@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Any, Generic, Type, TypeVar
 
-from sqlalchemy import Result, ScalarResult
+from fastapi import Request
+from pydantic import BaseModel
+from sqlalchemy import Result, ScalarResult, Select
 
 from domain.entities.model import Model
+from domain.validators.dto import PaginatedResponse
 
 TModel = TypeVar("TModel", bound=Model)
 
@@ -61,6 +64,35 @@ class ModelRepository(Repository, Generic[TModel]):
         """Получить список моделей объектов"""
         pass
 
+    @abstractmethod
+    def get_list_models_stmt(self, **filters) -> Select:
+        """Получить запрос на список моделей объектов"""
+        pass
+
+    @abstractmethod
+    async def paginate(
+        self,
+        stmt: Select,
+        schema_read: Type[BaseModel],
+        request: Request,
+        page: int = 1,
+        page_size: int = 10,
+    ) -> PaginatedResponse:
+        """Получить страницу объектов по запросу"""
+        pass
+
+    @abstractmethod
+    async def paginate_by_cursor(
+        self,
+        stmt: Select,
+        schema_read: Type[BaseModel],
+        request: Request,
+        page_size: int = 10,
+        cursor: str | None = None,
+    ) -> PaginatedResponse:
+        """Получить страницу объектов по курсору"""
+        pass
+
     @abstractmethod
     async def get_list_by_ids(
         self,
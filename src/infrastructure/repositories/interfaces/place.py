@@ -1,7 +1,9 @@
 from abc import abstractmethod
 from typing import List, TypeVar
 
-from common.dto import PlacesFiltersDTO
+from sqlalchemy import Select
+
+from common.dto import PlaceCandidatesFiltersDTO, PlacesFiltersDTO
 from domain.entities.model import Model
 from infrastructure.repositories.interfaces.base import ModelRepository
 
@@ -15,6 +17,16 @@ class PlaceRepository(ModelRepository):
         pass
 
     @abstractmethod
-    async def get_list_by_filters(self, filters: PlacesFiltersDTO) -> List[TModel]:
-        """Получить места по фильтрам"""
+    async def get_list_by_city(self, city: str) -> List[TModel]:
+        """Получить все места города"""
+        pass
+
+    @abstractmethod
+    async def get_stmt_by_filters(self, filters: PlacesFiltersDTO) -> Select:
+        """Получить запрос на места по фильтрам"""
+        pass
+
+    @abstractmethod
+    async def get_candidates(self, filters: PlaceCandidatesFiltersDTO) -> List[TModel]:
+        """Получить места-кандидаты для генерации маршрута"""
         pass
@@ -1,6 +1,9 @@
 from abc import abstractmethod
 from typing import Any, List, TypeVar
 
+from sqlalchemy import Select
+
+from common.dto import PostsFiltersDTO
 from domain.entities.model import Model
 from domain.entities.post import Post
 from infrastructure.repositories.interfaces.base import ModelRepository
@@ -18,3 +21,8 @@ class PostRepository(ModelRepository):
     async def get_list_models(self) -> List[Any]:
         """Получить список маршрутов"""
         pass
+
+    @abstractmethod
+    async def get_stmt_by_filters(self, filters: PostsFiltersDTO) -> Select:
+        """Получить запрос на посты по фильтрам"""
+        pass
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from typing import Any, List
 
-from sqlalchemy import Result
+from sqlalchemy import Select
 
 from application.use_cases.routes.dto import RouteFeedFiltersDTO
 from domain.entities.route import Route
@@ -15,8 +15,13 @@ class RouteRepository(ModelRepository):
         pass
 
     @abstractmethod
-    async def get_list_by_filters(self, filters: RouteFeedFiltersDTO, add_filters: Any) -> Result:
-        """Получить маршруты по фильтрам"""
+    async def get_list_by_ids(self, id_list: list[int]) -> List[Route]:
+        """Получить маршруты по списку id"""
+        pass
+
+    @abstractmethod
+    async def get_stmt_by_filters(self, filters: RouteFeedFiltersDTO, add_filters: Any) -> Select:
+        """Получить запрос на маршруты по фильтрам"""
         pass
 
     @abstractmethod
@@ -24,6 +29,16 @@ class RouteRepository(ModelRepository):
         """Получить список маршрутов"""
         pass
 
+    @abstractmethod
+    async def refresh_metrics(self, route_id: int | None) -> None:
+        """Пересчитать длину, время в пути и ссылку на карты по упорядоченным местам"""
+        pass
+
+    @abstractmethod
+    async def refresh_metrics_by_place(self, place_id: int) -> None:
+        """Пересчитать метрики всех маршрутов, в которые входит место"""
+        pass
+
     @abstractmethod
     async def copy(self, route: Route, user_id: int) -> Route:
         """Скопировать маршрут в мои маршруты"""
@@ -29,3 +29,13 @@ class RoutePlacesRepository(ModelRepository):
     async def update_order(self, place_id: int, order: int) -> None:
         """Изменить порядок места маршрута"""
         pass
+
+    @abstractmethod
+    async def get_list_by_route_id(self, route_id: int) -> list[RoutePlaces]:
+        """Получить места маршрута в порядке посещения"""
+        pass
+
+    @abstractmethod
+    async def update_orders(self, orders: dict[int, int]) -> None:
+        """Изменить порядок мест маршрута: id записи RoutePlace -> порядок"""
+        pass
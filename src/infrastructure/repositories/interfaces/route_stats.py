@@ -0,0 +1,16 @@
+from abc import abstractmethod
+
+from domain.entities.route_stats import RouteStats
+from infrastructure.repositories.interfaces.base import Repository
+
+
+class RouteStatsRepository(Repository):
+    @abstractmethod
+    async def get_by_route_id(self, route_id: int) -> RouteStats | None:
+        """Получить статистику маршрута"""
+        pass
+
+    @abstractmethod
+    async def refresh(self, route_id: int | None) -> None:
+        """Пересчитать статистику маршрута по исходным таблицам"""
+        pass
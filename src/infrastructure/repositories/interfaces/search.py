@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+
+from fastapi import Request
+from sqlalchemy import Select
+
+from common.dto import SearchFiltersDTO, SearchResultRead
+from domain.validators.dto import PaginatedResponse
+
+
+class SearchRepository(ABC):
+    """Поисковая выдача только читается, поэтому контракт Repository с конвертацией не нужен"""
+
+    @abstractmethod
+    def get_search_stmt(self, filters: SearchFiltersDTO) -> Select:
+        """Запрос полнотекстового поиска по местам, маршрутам и постам с ранжированием"""
+        pass
+
+    @abstractmethod
+    async def paginate(
+        self, stmt: Select, request: Request, page: int = 1, page_size: int = 10
+    ) -> PaginatedResponse[SearchResultRead]:
+        """Выполнить поисковый запрос постранично"""
+        pass
@@ -1,6 +1,8 @@
 from abc import abstractmethod
 from datetime import date
-from typing import List, TypeVar
+from typing import List, Optional, TypeVar
+
+from sqlalchemy import Select
 
 from domain.entities.model import Model
 from infrastructure.repositories.interfaces.base import ModelRepository
@@ -14,6 +16,11 @@ class UserRepository(ModelRepository):
         """Получить пользователя по телефону"""
         pass
 
+    @abstractmethod
+    def get_stmt_by_name(self, name: Optional[str] = None) -> Select:
+        """Запрос списка пользователей с поиском по имени или фамилии"""
+        pass
+
     @abstractmethod
     async def get_list(self) -> List[TModel]:
         """Получить список пользователей"""
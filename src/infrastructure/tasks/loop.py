@@ -0,0 +1,59 @@
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TaskEventLoop:
+    """
+    Долгоживущий event loop процесса воркера Celery, работающий в отдельном потоке.
+    Задачи отправляют в него корутины, поэтому пулы соединений БД, Redis и HTTP-клиента
+    создаются один раз на процесс, а при пуле потоков Celery несколько генераций
+    одновременно ждут ответа ChatGPT в одном процессе.
+    После fork (prefork-пул) loop создаётся заново в дочернем процессе.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None or self._pid != os.getpid():
+            with self._lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._start()
+        return self._loop  # type: ignore
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Выполнить корутину в loop процесса и дождаться результата в текущем потоке"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self) -> None:
+        if self._loop is None or self._pid != os.getpid():
+            return
+
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+        self._loop.close()
+        self._loop, self._thread, self._pid = None, None, None
+
+    def _start(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="celery-task-event-loop", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Task event loop started in process {self._pid}")
+
+
+task_event_loop = TaskEventLoop()
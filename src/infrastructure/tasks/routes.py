@@ -1,12 +1,30 @@
-import asyncio
+from typing import List, Optional
 
 from celery import Task, shared_task
 
 from application.use_cases.routes.enums import RouteGenerationMode as Mode
+from infrastructure.tasks.loop import task_event_loop
 
 
 @shared_task(bind=True, name="bestway.tasks.default.route_generate_gpt_task")
-def route_generate_gpt_task(self: Task, user_id: int, survey_id: int, mode: str = Mode.FULL.value) -> None:
-    loop = asyncio.get_event_loop()
+def route_generate_gpt_task(
+    self: Task,
+    user_id: int,
+    survey_id: int,
+    mode: str = Mode.FULL.value,
+    use_cache: bool = True,
+    lock_token: Optional[str] = None,
+    job_id: Optional[str] = None,
+) -> None:
+    # Экземпляр use case на задачу: у него своя единица работы (сессия БД),
+    # а клиенты и пулы соединений общие для процесса
     use_case = self.app.container.route_chatgpt_generate_use_case()
-    loop.run_until_complete(use_case.execute(user_id, survey_id, mode))
+    task_event_loop.run(use_case.execute(user_id, survey_id, mode, use_cache, lock_token, job_id))
+
+
+@shared_task(bind=True, name="bestway.tasks.default.route_batch_generate_gpt_task")
+def route_batch_generate_gpt_task(
+    self: Task, survey_ids: List[int], mode: str = Mode.FULL.value, use_cache: bool = True
+) -> None:
+    use_case = self.app.container.route_chatgpt_batch_generate_use_case()
+    task_event_loop.run(use_case.execute(survey_ids, mode, use_cache))
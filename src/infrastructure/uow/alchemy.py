@@ -7,9 +7,11 @@ from infrastructure.repositories.alchemy import (
     SqlAlchemyUsersRepository,
 )
 from infrastructure.repositories.alchemy.comments import SqlAlchemyCommentsRepository
+from infrastructure.repositories.alchemy.full_text_search import SqlAlchemySearchRepository
 from infrastructure.repositories.alchemy.likes import SqlAlchemyLikesRepository
 from infrastructure.repositories.alchemy.posts import SqlAlchemyPostsRepository
 from infrastructure.repositories.alchemy.route_places import SqlAlchemyRoutePlacesRepository
+from infrastructure.repositories.alchemy.route_stats import SqlAlchemyRouteStatsRepository
 from infrastructure.repositories.alchemy.routes import SqlAlchemyRoutesRepository
 from infrastructure.repositories.alchemy.survey import SqlAlchemySurveysRepository
 from infrastructure.repositories.interfaces.base import ModelRepository
@@ -28,8 +30,10 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         self.routes = SqlAlchemyRoutesRepository(self._session)
         self.posts = SqlAlchemyPostsRepository(self._session)
         self.route_places = SqlAlchemyRoutePlacesRepository(self._session)
+        self.route_stats = SqlAlchemyRouteStatsRepository(self._session)
         self.surveys = SqlAlchemySurveysRepository(self._session)
         self.photos = SqlAlchemyPhotosRepository(self._session)
+        self.search = SqlAlchemySearchRepository(self._session)
 
         self.comments = SqlAlchemyCommentsRepository(self._session)
         self.likes = SqlAlchemyLikesRepository(self._session)
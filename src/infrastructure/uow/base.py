@@ -16,6 +16,8 @@ from infrastructure.repositories.interfaces.place import PlaceRepository
 from infrastructure.repositories.interfaces.post import PostRepository
 from infrastructure.repositories.interfaces.route import RouteRepository
 from infrastructure.repositories.interfaces.route_places import RoutePlacesRepository
+from infrastructure.repositories.interfaces.route_stats import RouteStatsRepository
+from infrastructure.repositories.interfaces.search import SearchRepository
 from infrastructure.repositories.interfaces.survey import SurveyRepository
 from infrastructure.repositories.interfaces.user import UserRepository
 
@@ -24,10 +26,12 @@ class UnitOfWork(ABC):
     users: UserRepository
     places: PlaceRepository
     route_places: RoutePlacesRepository
+    route_stats: RouteStatsRepository
     routes: RouteRepository
     posts: PostRepository
     surveys: SurveyRepository
     photos: PhotoRepository
+    search: SearchRepository
 
     comments: CommentRepository
     likes: LikeRepository
@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from application.use_cases.routes.chatgpt_create import ChatGPTRouteGenerateUseCase
+from common.exceptions import APIException
+
+
+@pytest.fixture
+def redis_cache() -> AsyncMock:
+    redis_cache = AsyncMock()
+    redis_cache.extend_route_generation_lock.return_value = True
+    return redis_cache
+
+
+@pytest.fixture
+def use_case(redis_cache: AsyncMock) -> ChatGPTRouteGenerateUseCase:
+    uow = MagicMock()
+    uow.return_value.__aenter__ = AsyncMock()
+    uow.return_value.__aexit__ = AsyncMock(return_value=False)
+    uow.surveys.delete_by_id = AsyncMock()
+    notifier = MagicMock()
+    notifier.notify_user = AsyncMock()
+    return ChatGPTRouteGenerateUseCase(
+        uow=uow,
+        notifier=notifier,
+        redis_client=redis_cache,
+        route_generate_gpt_manager=MagicMock(),
+        route_order_optimizer=MagicMock(),
+        place_candidate_selector=MagicMock(),
+        places_catalog=MagicMock(),
+        local_route_generator=MagicMock(),
+        lock_ttl=0.3,
+    )
+
+
+async def test_lock_is_extended_and_released_through_async_cache(use_case, redis_cache):
+    async with use_case._hold_generation_lock(1, "token", "job"):
+        await asyncio.sleep(0.25)
+
+    assert redis_cache.extend_route_generation_lock.await_count >= 2
+    redis_cache.acquire_route_generation_lock.assert_not_awaited()
+    redis_cache.release_route_generation_lock.assert_awaited_once_with(1, "token")
+
+
+async def test_expired_lock_is_acquired_again(use_case, redis_cache):
+    redis_cache.extend_route_generation_lock.return_value = False
+    redis_cache.acquire_route_generation_lock.return_value = True
+
+    async with use_case._hold_generation_lock(1, "token", "job"):
+        pass
+
+    redis_cache.acquire_route_generation_lock.assert_awaited_once_with(1, "token", 0.3)
+
+
+async def test_lock_held_by_another_run_rejects_generation(use_case, redis_cache):
+    redis_cache.extend_route_generation_lock.return_value = False
+    redis_cache.acquire_route_generation_lock.return_value = False
+
+    with pytest.raises(APIException):
+        async with use_case._hold_generation_lock(1, "token", "job"):
+            pass
+
+    assert redis_cache.update_generation_job.await_args.args[:2] == ("job", "GENERATED_ERROR")
+    redis_cache.release_route_generation_lock.assert_not_awaited()
+
+
+async def test_lost_lock_cancels_generation(use_case, redis_cache):
+    redis_cache.extend_route_generation_lock.side_effect = [True, False]
+
+    async def slow_content(*args):
+        await asyncio.sleep(5)
+
+    use_case._create_content = slow_content
+
+    with pytest.raises(asyncio.CancelledError):
+        await use_case.execute(1, 2, lock_token="token", job_id="job")
+
+    assert redis_cache.update_generation_job.await_args.args[:2] == ("job", "GENERATED_ERROR")
+    redis_cache.release_route_generation_lock.assert_awaited_once_with(1, "token")
+    use_case._uow.surveys.delete_by_id.assert_awaited_once_with(2)
@@ -0,0 +1,6 @@
+import os
+
+# Обязательные настройки без значений по умолчанию, чтобы модули с Settings() импортировались в тестах
+os.environ.setdefault("PUSHER__APP_ID", "test")
+os.environ.setdefault("PUSHER__KEY", "test")
+os.environ.setdefault("PUSHER__SECRET", "test")
@@ -0,0 +1,88 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from common.exceptions import ServiceUnavailableException
+from infrastructure.managers.ChatGPT.circuit_breaker import CircuitBreaker
+from infrastructure.managers.ChatGPT.route_chatgpt_manager import AsyncChatGPTRouteGenerationManager
+
+
+def open_breaker(reset_timeout: float = 0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_threshold_and_rejects_requests():
+    breaker = open_breaker(reset_timeout=60)
+
+    assert breaker.is_open
+    with pytest.raises(ServiceUnavailableException):
+        breaker.check()
+
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = open_breaker()
+
+    assert breaker.check() is True
+    with pytest.raises(ServiceUnavailableException):
+        breaker.check()
+
+
+def test_probe_success_closes_and_failure_reopens():
+    breaker = open_breaker()
+    breaker.check()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.check() is False
+
+    breaker = open_breaker(reset_timeout=60)
+    breaker.opened_at -= 60
+    breaker.check()
+    breaker.record_failure()
+    with pytest.raises(ServiceUnavailableException):
+        breaker.check()
+
+
+def test_unfinished_probe_does_not_keep_breaker_open():
+    breaker = open_breaker()
+    breaker.check()
+    breaker.end_probe()
+
+    assert breaker.check() is True
+
+
+def make_manager(breaker: CircuitBreaker, error: BaseException) -> AsyncChatGPTRouteGenerationManager:
+    manager = object.__new__(AsyncChatGPTRouteGenerationManager)
+    manager.circuit_breaker = breaker
+    manager.CHATGPT_REQUEST_DELAY = 0
+    manager._create_request_payload = lambda content, system_prompt: {}
+    manager._send_hedged = AsyncMock(side_effect=error)
+    return manager
+
+
+async def test_probe_answered_with_client_error_closes_breaker():
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    response = httpx.Response(400, request=request)
+    error = httpx.HTTPStatusError("Bad Request", request=request, response=response)
+    breaker = open_breaker()
+    manager = make_manager(breaker, error)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await manager._send_request(None, "prompt")
+
+    assert not breaker.is_open
+
+
+async def test_cancelled_probe_releases_half_open_state():
+    breaker = open_breaker()
+    manager = make_manager(breaker, asyncio.CancelledError())
+
+    with pytest.raises(asyncio.CancelledError):
+        await manager._send_request(None, "prompt")
+
+    assert breaker.is_open
+    assert breaker.check() is True